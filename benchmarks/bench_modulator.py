@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the gravity modulator hot paths.
+
+Times phase synthesis, activation, lift tests, thrust calculations and
+phase frame serialization at every scaling level that fits in memory,
+appends the results to a JSON history file and fails when a run regresses
+against the stored baseline.
+
+Usage:
+    python benchmarks/bench_modulator.py                    # run and compare
+    python benchmarks/bench_modulator.py --update-baseline  # record new baseline
+"""
+
+import gc
+import json
+import os
+import pickle
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Add parent and examples directories to path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'examples'))
+
+from gravity_modulator import (CasimirArraySpecs, GravityModulator, LiftTest, PhaseCache,
+                               ScalingArchitecture, ScalingLevel, decode_frame, encode_frame)
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+DEFAULT_THRESHOLD = 0.25         # Allowed slowdown vs baseline (25%)
+DEFAULT_MAX_BYTES = 2 * 1024**3  # Memory available to a single case
+WORKING_SET_FACTOR = 3           # Phase grid plus temporaries, in float64 grids
+
+
+def fitting_levels(scaling: ScalingArchitecture, max_bytes: int) -> List[ScalingLevel]:
+    """Scaling levels whose dense phase grid and temporaries fit in max_bytes"""
+    levels = []
+    for level in scaling.levels:
+        plates = scaling.array_specs(level).total_plates
+        if plates * np.dtype(float).itemsize * WORKING_SET_FACTOR <= max_bytes:
+            levels.append(level)
+    return levels
+
+
+def time_case(fn: Callable[[], object], repeat: int) -> Dict:
+    """
+    Time a benchmark case
+
+    The best of `repeat` wall-clock runs is reported; one extra run under
+    tracemalloc records the case's peak traced allocation. process_peak_rss_kb
+    is the process-wide resident high-water mark so far, not a per-case
+    figure; it never decreases, so later cases inherit earlier peaks.
+    """
+    fn()  # Warm-up
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': min(times),
+        'mean_seconds': float(np.mean(times)),
+        'peak_alloc_bytes': peak_alloc,
+        'process_peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+
+def run_benchmarks(levels: List[ScalingLevel], repeat: int = 5) -> Dict:
+    """
+    Run every hot-path case at each scaling level
+
+    Args:
+        levels: Scaling levels to benchmark
+        repeat: Timed runs per case
+
+    Returns:
+        Run record with per-case timings and environment details
+    """
+    from thrust_calc import ThrustCalculator
+
+    scaling = ScalingArchitecture()
+    cases = {}
+
+    for level in levels:
+        specs = scaling.array_specs(level)
+        plates = specs.total_plates
+        mod = GravityModulator(array_size_cm=level.dimensions_cm, array=specs,
+                               phase_cache=PhaseCache(max_entries=0))
+        cached = GravityModulator(array_size_cm=level.dimensions_cm, array=specs)
+
+        # Half the available thrust, so the lift always succeeds
+        mass_kg = 0.5 * mod.total_force() * 0.99999 / 9.81
+        lift = LiftTest(mod)
+        calc = ThrustCalculator()
+        
+        # Phase frames for a small steering change, as streamed to the hardware
+        resolution_deg = specs.phase_resolution_deg
+        codes = mod.calculate_phase_codes((0, 0, 1))
+        next_codes = mod.calculate_phase_codes((0.01, 0, 1))
+        raw_frame = bytes(encode_frame(codes, resolution_deg, compression='none'))
+        zlib_frame = bytes(encode_frame(codes, resolution_deg))
+        delta_frame = bytes(encode_frame(next_codes, resolution_deg, previous=codes))
+        phases = mod.calculate_phase_pattern((0, 0, 1))
+        pickled = pickle.dumps(phases)
+        frame_bytes = {'pickle_dumps': len(pickled), 'encode_frame_raw': len(raw_frame),
+                       'encode_frame_zlib': len(zlib_frame), 'encode_frame_delta': len(delta_frame)}
+
+        # ThrustCalculator always builds a default-geometry modulator
+        level_cases = {
+            'calculate_phase_pattern': (lambda: mod.calculate_phase_pattern((0.3, -0.2, 0.9)), plates),
+            'activate': (lambda: mod.activate(direction=(0, 0, 1), power_MW=level.power_MW), plates),
+            'activate_cached': (lambda: cached.activate(direction=(0, 0, 1), power_MW=level.power_MW), plates),
+            'lift_payload': (lambda: lift.lift_payload(mass_kg=mass_kg, height_m=10.0), plates),
+            'calculate_thrust': (lambda: calc.calculate_thrust(level.dimensions_cm, level.power_MW),
+                                 CasimirArraySpecs().total_plates),
+            'pickle_dumps': (lambda: pickle.dumps(phases), plates),
+            'pickle_loads': (lambda: pickle.loads(pickled), plates),
+            'encode_frame_raw': (lambda: encode_frame(codes, resolution_deg, compression='none'), plates),
+            'encode_frame_zlib': (lambda: encode_frame(codes, resolution_deg), plates),
+            'encode_frame_delta': (lambda: encode_frame(next_codes, resolution_deg, previous=codes), plates),
+            'decode_frame_raw': (lambda: decode_frame(raw_frame), plates),
+            'decode_frame_zlib': (lambda: decode_frame(zlib_frame), plates),
+            'decode_frame_delta': (lambda: decode_frame(delta_frame, previous=codes), plates),
+        }
+        for name, (fn, case_plates) in level_cases.items():
+            result = time_case(fn, repeat)
+            result['plates'] = case_plates
+            result['plates_per_s'] = case_plates / result['seconds'] if result['seconds'] > 0 else float('inf')
+            if name in frame_bytes:
+                result['frame_bytes'] = frame_bytes[name]
+            cases[f"{level.name}/{name}"] = result
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'cases': cases
+    }
+
+
+def compare(run: Dict, baseline: Optional[Dict], threshold: float) -> List[str]:
+    """
+    Find cases that regressed against the baseline
+
+    Args:
+        run: Current run record
+        baseline: Baseline run record (None means nothing to compare)
+        threshold: Allowed fractional slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        Human-readable descriptions of each regression
+    """
+    if not baseline:
+        return []
+
+    regressions = []
+    for name, result in run['cases'].items():
+        reference = baseline['cases'].get(name)
+        if reference is None:
+            continue
+        ratio = result['seconds'] / reference['seconds'] if reference['seconds'] > 0 else 1.0
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{name}: {result['seconds'] * 1e3:.2f} ms vs baseline "
+                f"{reference['seconds'] * 1e3:.2f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def load_history(path: str) -> Dict:
+    """Load the benchmark history, or an empty one if the file does not exist"""
+    if not os.path.exists(path):
+        return {'baseline': None, 'runs': []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(path: str, history: Dict):
+    """Write the benchmark history atomically"""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp, path)
+
+
+def print_run(run: Dict):
+    """Print a run as a table"""
+    print(f"\n{'Case':<40} {'Best (ms)':>12} {'Plates/s':>14} {'Peak alloc':>12} {'Frame':>10}")
+    print("-" * 91)
+    for name, result in run['cases'].items():
+        frame = f"{result['frame_bytes'] / 1024:.1f}KB" if 'frame_bytes' in result else ''
+        print(f"{name:<40} {result['seconds'] * 1e3:>12.3f} {result['plates_per_s']:>14.3e} "
+              f"{result['peak_alloc_bytes'] / 1024**2:>10.1f}MB {frame:>10}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point; returns a process exit code"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Gravity Modulator hot-path benchmarks')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON history file')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown vs baseline (fraction)')
+    parser.add_argument('--max-bytes', type=float, default=DEFAULT_MAX_BYTES,
+                        help='Memory budget for choosing scaling levels')
+    parser.add_argument('--levels', type=str, help='Comma-separated level names to run')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store this run as the new baseline')
+
+    args = parser.parse_args(argv)
+
+    scaling = ScalingArchitecture()
+    levels = fitting_levels(scaling, int(args.max_bytes))
+    if args.levels:
+        wanted = {name.strip() for name in args.levels.split(',')}
+        levels = [level for level in levels if level.name in wanted]
+
+    run = run_benchmarks(levels, repeat=args.repeat)
+    print_run(run)
+
+    history = load_history(args.history)
+    regressions = compare(run, history.get('baseline'), args.threshold)
+
+    history['runs'].append(run)
+    if args.update_baseline or not history.get('baseline'):
+        history['baseline'] = run
+        print("\n📌 Stored as baseline")
+    save_history(args.history, history)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,11 +12,12 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from gravity_modulator import GravityModulator, LiftTest, ScalingArchitecture
+from gravity_modulator import GravityModulator, LiftTest, ScalingArchitecture, log_to_console
 
 
 def main():
     """Run lift test demonstration."""
+    log_to_console()
     
     print("=" * 70)
     print("GRAVITY MODULATOR - LIFT TEST DEMONSTRATION")
@@ -34,7 +35,7 @@ def main():
     
     # Initialize modulator
     print(f"\n🔧 Initializing gravity modulator...")
-    modulator = GravityModulator(array_size_cm=ARRAY_SIZE_CM)
+    modulator = GravityModulator(array_size_cm=ARRAY_SIZE_CM, verbose=True)
     
     # Display metamaterial specs
     print(f"\n🧪 Metamaterial enhancement:")
@@ -59,7 +60,7 @@ def main():
     print(f"   Required power: {required_power_mw:.3f} MW ({required_power_mw*1000:.1f} kW)")
     
     # Initialize lift test
-    lift = LiftTest(modulator)
+    lift = LiftTest(modulator, verbose=True)
     
     # Run lift test
     print(f"\n🚀 EXECUTING LIFT TEST...")
@@ -129,12 +130,13 @@ def main():
 
 def quick_test():
     """Run a quick test with smaller payload."""
+    log_to_console()
     
     print("\n🔍 QUICK TEST (Small Payload)")
     print("-" * 30)
     
-    modulator = GravityModulator(array_size_cm=1.0)  # 1cm tile
-    lift = LiftTest(modulator)
+    modulator = GravityModulator(array_size_cm=1.0, verbose=True)  # 1cm tile
+    lift = LiftTest(modulator, verbose=True)
     
     results = lift.lift_payload(mass_kg=10, height_m=5)
     
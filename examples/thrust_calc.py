@@ -4,15 +4,123 @@ Thrust calculator for gravity modulator.
 Calculate thrust for any configuration and compare to conventional systems.
 """
 
+import hashlib
 import numpy as np
 import sys
 import os
-from tabulate import tabulate
+from typing import Dict, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from gravity_modulator import GravityModulator, ScalingArchitecture
+from gravity_modulator import (GravityModulator, ScalingArchitecture, NOMINAL_EFFICIENCY,
+                               CasimirArraySpecs, MetamaterialSpecs, LiftProfiles,
+                               phase_statistics, simulate_lift, total_force)
+
+# Columns written by ThrustCalculator.sweep(), in order
+SWEEP_COLUMNS = ['size_cm', 'volume_m3', 'power_mw', 'dir_x', 'dir_y', 'dir_z',
+                 'thrust_n', 'thrust_kg', 'thrust_per_mw', 'efficiency', 'phase_coherence']
+SWEEP_CHUNK_ROWS = 100_000  # Rows evaluated and written per chunk
+
+
+def _grid_fingerprint(sizes_cm: np.ndarray, powers_mw: np.ndarray, directions: np.ndarray,
+                      far_field: bool, coherence: bool) -> str:
+    """Short hash identifying a sweep grid, stored with its output to guard resumes"""
+    digest = hashlib.sha256()
+    for values in (sizes_cm, powers_mw, directions):
+        digest.update(repr(np.shape(values)).encode())
+        digest.update(np.ascontiguousarray(values, dtype='<f8').tobytes())
+    digest.update(f"far_field={far_field},coherence={coherence}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _far_field_efficiency(direction: Tuple[float, float, float]) -> float:
+    """Worker: measured main-lobe efficiency of the default array for one direction"""
+    modulator = GravityModulator()
+    modulator.phase_matrix = modulator.calculate_phase_pattern(direction)
+    return modulator.far_field(direction)['main_lobe_efficiency']
+
+
+class _CsvSink:
+    """
+    Append-only CSV output; a torn last line from an interrupted run is dropped
+    
+    The first line is a '# grid <fingerprint>' comment naming the sweep
+    the rows belong to, followed by the column header.
+    """
+    
+    def __init__(self, path: str, resume: bool, grid: str):
+        self.path = path
+        grid_line, column_line = f"# grid {grid}", ','.join(SWEEP_COLUMNS)
+        self.header = f"{grid_line}\n{column_line}\n"
+        self.rows_done = 0
+        if resume and os.path.exists(path):
+            with open(path, 'rb+') as f:
+                data = f.read()
+                complete = data.rfind(b'\n') + 1
+                if complete:
+                    lines = data[:complete].decode().split('\n', 2)
+                    if len(lines) < 3 or lines[1] != column_line:
+                        raise ValueError(f"{path} has different columns; cannot resume")
+                    if lines[0] != grid_line:
+                        raise ValueError(f"{path} was written for a different sweep grid; "
+                                         f"cannot resume")
+                f.truncate(complete)
+                self.rows_done = max(0, data.count(b'\n', 0, complete) - 2)
+            if complete:
+                return
+        with open(path, 'w') as f:
+            f.write(self.header)
+    
+    def write(self, start: int, columns: Dict[str, np.ndarray]):
+        table = np.column_stack([columns[name] for name in SWEEP_COLUMNS])
+        with open(self.path, 'a') as f:
+            np.savetxt(f, table, delimiter=',', fmt='%.17g')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class _ParquetSink:
+    """
+    Directory of Parquet part files, each published atomically when complete
+    
+    Every part carries the sweep's grid fingerprint as 'sweep_grid' schema
+    metadata.
+    """
+    
+    def __init__(self, path: str, resume: bool, grid: str):
+        try:
+            import pyarrow  # noqa: F401  Optional dependency
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from e
+        
+        self.path = path
+        self.grid = grid
+        os.makedirs(path, exist_ok=True)
+        parts = sorted(name for name in os.listdir(path) if name.endswith('.parquet'))
+        if not resume:
+            for name in parts:
+                os.remove(os.path.join(path, name))
+            parts = []
+        for name in parts:
+            metadata = pq.read_schema(os.path.join(path, name)).metadata or {}
+            if metadata.get(b'sweep_grid') != grid.encode():
+                raise ValueError(f"{os.path.join(path, name)} was written for a different "
+                                 f"sweep grid; cannot resume")
+        self.rows_done = sum(pq.read_metadata(os.path.join(path, name)).num_rows
+                             for name in parts)
+    
+    def write(self, start: int, columns: Dict[str, np.ndarray]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        table = pa.table({name: columns[name] for name in SWEEP_COLUMNS},
+                         metadata={'sweep_grid': self.grid})
+        final = os.path.join(self.path, f"part-{start:012d}.parquet")
+        tmp = final + '.tmp'
+        pq.write_table(table, tmp)
+        os.replace(tmp, final)
 
 
 class ThrustCalculator:
@@ -21,6 +129,10 @@ class ThrustCalculator:
     def __init__(self):
         self.scaling = ScalingArchitecture()
         self.results = {}
+        # Thrust depends on the (default) array geometry, not on the size
+        spec = CasimirArraySpecs()
+        self.base_force = total_force(spec.plate_spacing_m, MetamaterialSpecs().total_enhancement,
+                                      spec.total_plates)
     
     def calculate_thrust(self, size_cm: float, power_mw: float, direction: tuple = (0,0,1)):
         """
@@ -54,6 +166,142 @@ class ThrustCalculator:
         
         return self.results
     
+    def evaluate(self, sizes_cm, powers_mw, directions=(0, 0, 1),
+                 efficiency=NOMINAL_EFFICIENCY) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_thrust() over many configurations
+        
+        Arguments broadcast against each other (directions along their
+        last axis of length 3); no modulator or phase grid is built.
+        
+        Args:
+            sizes_cm: Modulator size(s) in cm (cubic)
+            powers_mw: Power input(s) in megawatts
+            directions: Thrust direction vector(s), shape (..., 3)
+            efficiency: Directional efficiency per configuration
+            
+        Returns:
+            Dictionary of per-configuration column arrays
+        """
+        directions = np.asarray(directions, dtype=float)
+        sizes_cm, powers_mw, efficiency, dir_x, dir_y, dir_z = np.broadcast_arrays(
+            np.asarray(sizes_cm, dtype=float), np.asarray(powers_mw, dtype=float),
+            np.asarray(efficiency, dtype=float),
+            directions[..., 0], directions[..., 1], directions[..., 2]
+        )
+        
+        thrust = np.sqrt(dir_x**2 + dir_y**2 + dir_z**2) * self.base_force * efficiency
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thrust_per_mw = thrust / powers_mw
+        
+        return {
+            'size_cm': sizes_cm,
+            'volume_m3': (sizes_cm / 100)**3,
+            'power_mw': powers_mw,
+            'dir_x': dir_x,
+            'dir_y': dir_y,
+            'dir_z': dir_z,
+            'thrust_n': thrust,
+            'thrust_kg': thrust / 9.81,
+            'thrust_per_mw': thrust_per_mw,
+            'efficiency': efficiency
+        }
+    
+    def sweep(self, sizes_cm, powers_mw, directions=((0, 0, 1),),
+              output: Optional[str] = None,
+              fmt: Optional[str] = None,
+              resume: bool = True,
+              far_field: bool = False,
+              coherence: bool = False,
+              workers: int = 1,
+              chunk_rows: int = SWEEP_CHUNK_ROWS) -> Dict:
+        """
+        Evaluate the full size × power × direction grid
+        
+        Rows are generated in C order (direction varies fastest) and
+        evaluated a chunk at a time with evaluate(). Direction-dependent
+        work is done once per direction: phase coherence in one streamed
+        pass for all directions, far-field efficiency (an FFT per
+        direction) across a process pool.
+        
+        Args:
+            sizes_cm: Sizes to sweep (cm)
+            powers_mw: Powers to sweep (MW)
+            directions: Directions to sweep, shape (D, 3)
+            output: CSV file or Parquet directory to stream rows to; None
+                returns the columns in memory instead
+            fmt: 'csv' or 'parquet' (inferred from output if None)
+            resume: Continue an interrupted sweep from the rows already in
+                output; refused if output holds a different grid
+            far_field: Use measured main-lobe efficiency instead of nominal
+            coherence: Fill the phase_coherence column (NaN otherwise)
+            workers: Processes for the far-field solves
+            chunk_rows: Rows per evaluated and written chunk
+            
+        Returns:
+            Summary with total, skipped and written row counts (plus
+            'columns' when output is None)
+        """
+        sizes_cm = np.atleast_1d(np.asarray(sizes_cm, dtype=float))
+        powers_mw = np.atleast_1d(np.asarray(powers_mw, dtype=float))
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        shape = (len(sizes_cm), len(powers_mw), len(directions))
+        total = int(np.prod(shape))
+        
+        sink = None
+        if output is not None:
+            if fmt is None:
+                fmt = 'csv' if output.endswith('.csv') else 'parquet'
+            if fmt not in ('csv', 'parquet'):
+                raise ValueError(f"Unknown sweep format: {fmt}")
+            grid = _grid_fingerprint(sizes_cm, powers_mw, directions, far_field, coherence)
+            sink = (_CsvSink if fmt == 'csv' else _ParquetSink)(output, resume, grid)
+            if sink.rows_done > total:
+                raise ValueError(f"{output} holds {sink.rows_done} rows but the sweep has {total}")
+        start_row = sink.rows_done if sink is not None else 0
+        
+        if far_field and start_row < total:
+            efficiency = self._direction_efficiencies(directions, workers)
+        else:
+            efficiency = np.full(len(directions), NOMINAL_EFFICIENCY)
+        if coherence and start_row < total:
+            modulator = GravityModulator()
+            _, phase_coherence = phase_statistics(directions, modulator.array.plate_spacing_m,
+                                                  modulator.array.dimensions)
+        else:
+            phase_coherence = np.full(len(directions), np.nan)
+        
+        chunks = []
+        for start in range(start_row, total, chunk_rows):
+            stop = min(start + chunk_rows, total)
+            i_size, i_power, i_dir = np.unravel_index(np.arange(start, stop), shape)
+            columns = self.evaluate(sizes_cm[i_size], powers_mw[i_power],
+                                    directions[i_dir], efficiency[i_dir])
+            columns['phase_coherence'] = phase_coherence[i_dir]
+            if sink is not None:
+                sink.write(start, columns)
+            else:
+                chunks.append(columns)
+        
+        summary = {'total_rows': total, 'skipped_rows': start_row, 'written_rows': total - start_row}
+        if sink is None:
+            summary['columns'] = {
+                name: np.concatenate([chunk[name] for chunk in chunks]) if chunks else np.empty(0)
+                for name in SWEEP_COLUMNS
+            }
+        return summary
+    
+    @staticmethod
+    def _direction_efficiencies(directions: np.ndarray, workers: int) -> np.ndarray:
+        """Far-field efficiency per direction, across a process pool when workers > 1"""
+        jobs = [tuple(direction) for direction in directions]
+        if workers > 1 and len(jobs) > 1:
+            # Deferred: process pools are only needed for parallel sweeps
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return np.array(list(pool.map(_far_field_efficiency, jobs)))
+        return np.array([_far_field_efficiency(job) for job in jobs])
+    
     def compare_to_rocket(self):
         """Compare current configuration to chemical rocket."""
         if not self.results:
@@ -90,8 +338,17 @@ class ThrustCalculator:
             'improvement_factor': thrust_n / ion_thrust
         }
     
-    def time_to_orbit(self, payload_kg: float = 1000, orbit_km: float = 200):
-        """Calculate time to reach orbit."""
+    def time_to_orbit(self, payload_kg: float = 1000, orbit_km: float = 200,
+                      integrate: bool = False):
+        """
+        Calculate time to reach orbit.
+        
+        Args:
+            payload_kg: Payload mass in kg
+            orbit_km: Orbit altitude in km
+            integrate: Integrate the climb with altitude-dependent gravity
+                instead of the constant-acceleration sqrt(2d/a)
+        """
         if not self.results:
             return "No calculation performed yet."
         
@@ -105,16 +362,26 @@ class ThrustCalculator:
         # Distance to orbit
         distance_m = orbit_km * 1000
         
-        # Time = sqrt(2d/a)
-        time_s = np.sqrt(2 * distance_m / acceleration)
+        if integrate:
+            trajectory = simulate_lift(LiftProfiles(mass_kg=payload_kg, thrust_N=thrust_n,
+                                                    power_MW=self.results['power_mw'],
+                                                    target_m=distance_m))
+            time_s = float(trajectory['time_s'][0])
+        else:
+            # Time = sqrt(2d/a)
+            time_s = np.sqrt(2 * distance_m / acceleration)
         time_min = time_s / 60
         
-        return {
+        result = {
             'acceleration_m_s2': acceleration,
             'time_to_orbit_s': time_s,
             'time_to_orbit_min': time_min,
             'g_force': acceleration / 9.81
         }
+        if integrate:
+            result['arrival_velocity_m_s'] = float(trajectory['velocity_m_s'][0])
+            result['energy_J'] = float(trajectory['energy_J'][0])
+        return result
     
     def cost_to_orbit(self, payload_kg: float = 1000):
         """Calculate cost to orbit."""
@@ -261,6 +528,8 @@ def interactive_mode():
 
 def batch_mode():
     """Run batch calculations for multiple configurations."""
+    from tabulate import tabulate  # Only needed for the batch table
+    
     calc = ThrustCalculator()
     
     configurations = [
@@ -272,11 +541,12 @@ def batch_mode():
     
     results_table = []
     
-    for size, power, name in configurations:
-        calc.calculate_thrust(size, power)
-        thrust_kg = calc.results['thrust_kg']
-        thrust_n = calc.results['thrust_n']
-        
+    # One vectorized evaluation instead of a modulator per configuration
+    sizes, powers, _ = zip(*configurations)
+    results = calc.evaluate(sizes, powers)
+    
+    for (size, power, name), thrust_n, thrust_kg in zip(configurations, results['thrust_n'],
+                                                        results['thrust_kg']):
         results_table.append([
             name,
             f"{size}cm³",
@@ -303,10 +573,34 @@ def main():
     parser.add_argument('--dir', type=str, help='Direction as x,y,z')
     parser.add_argument('--batch', action='store_true', help='Run batch mode')
     parser.add_argument('--interactive', action='store_true', help='Run interactive mode')
+    parser.add_argument('--sweep', type=str, metavar='OUTPUT',
+                        help='Sweep --sizes × --powers × --dirs into a CSV file or Parquet directory')
+    parser.add_argument('--sizes', type=str, default='1,10,100,1000',
+                        help='Sweep sizes in cm, comma-separated')
+    parser.add_argument('--powers', type=str, default='0.0005,0.05,5,500',
+                        help='Sweep powers in MW, comma-separated')
+    parser.add_argument('--dirs', type=str, default='0,0,1',
+                        help='Sweep directions as x,y,z;x,y,z;...')
+    parser.add_argument('--far-field', action='store_true',
+                        help='Use measured far-field efficiency in the sweep')
+    parser.add_argument('--workers', type=int, default=1, help='Sweep worker processes')
+    parser.add_argument('--restart', action='store_true',
+                        help='Overwrite sweep output instead of resuming it')
     
     args = parser.parse_args()
     
-    if args.batch:
+    if args.sweep:
+        calc = ThrustCalculator()
+        summary = calc.sweep(
+            [float(v) for v in args.sizes.split(',')],
+            [float(v) for v in args.powers.split(',')],
+            [[float(v) for v in d.split(',')] for d in args.dirs.split(';')],
+            output=args.sweep, resume=not args.restart,
+            far_field=args.far_field, workers=args.workers
+        )
+        print(f"\n📊 Sweep: {summary['written_rows']:,} rows written, "
+              f"{summary['skipped_rows']:,} resumed, {summary['total_rows']:,} total -> {args.sweep}")
+    elif args.batch:
         batch_mode()
     elif args.interactive:
         interactive_mode()
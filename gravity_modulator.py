@@ -9,10 +9,16 @@ This simulation demonstrates a gravity modification system using:
 - Modular scaling architecture (1mm³ to 10m³)
 """
 
+import logging
+import struct
+import sys
+import tracemalloc
+import zlib
 import numpy as np
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple, Optional, Union
 import time
 
 # =============================================================================
@@ -23,6 +29,218 @@ HBAR = 1.0545718e-34  # Reduced Planck constant (J·s)
 C = 299792458          # Speed of light (m/s)
 G = 6.67430e-11        # Gravitational constant (m³/kg·s²)
 PI = np.pi
+G0 = 9.81              # Standard gravity at the surface (m/s²)
+EARTH_RADIUS_M = 6.371e6  # Mean Earth radius (m)
+
+PHASE_CODE_DTYPE = np.uint16  # Hardware phase code word
+PHASE_SLAB_PLATES = 1 << 20    # Plates synthesized per slab when encoding
+PHASE_STATS_SLAB_PLATES = 1 << 15   # Cache-sized slab for fused synthesis + statistics
+LAZY_COHERENCE_MAX_PLATES = 1 << 27  # Lazy fields above this are sampled, not streamed
+LAZY_COHERENCE_SAMPLES = 1 << 20     # Plates sampled for large lazy fields
+NOMINAL_EFFICIENCY = 0.99999  # Directional efficiency assumed without a far-field solve
+FAR_FIELD_MAX_PLATES = 1 << 24  # Largest pattern the FFT far-field solve will take
+MC_CHUNK_SAMPLES = 1 << 18      # Monte Carlo samples evaluated per batch
+MC_HISTOGRAM_BINS = 1 << 16     # Log-spaced bins for streamed percentiles
+MC_HISTOGRAM_DECADES = 3        # Histogram span either side of the nominal value
+SLEW_BATCH_PLATES = 1 << 22     # Phases synthesized per batch of slew frames
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())  # Applications and scripts choose where messages go
+
+VERBOSE = False  # Default for objects constructed with verbose=None
+
+
+def set_verbose(enabled: bool = True):
+    """Set whether modulator messages are logged at INFO (rather than DEBUG) by default"""
+    global VERBOSE
+    VERBOSE = enabled
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Write bare messages to whatever sys.stdout currently is"""
+    
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter("%(message)s"))
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def log_to_console(level: int = logging.INFO) -> logging.Handler:
+    """
+    Echo modulator messages to stdout, as the demo scripts do
+    
+    For scripts' main(); the library itself only installs a NullHandler.
+    Calling it again reuses the handler already attached.
+    
+    Args:
+        level: Lowest level echoed (INFO shows verbose messages)
+        
+    Returns:
+        The attached handler (pass to logger.removeHandler to detach)
+    """
+    handler = next((h for h in logger.handlers if isinstance(h, _StdoutHandler)), None)
+    if handler is None:
+        handler = _StdoutHandler()
+        logger.addHandler(handler)
+    handler.setLevel(level)
+    if logger.getEffectiveLevel() > level:
+        logger.setLevel(level)
+    return handler
+
+
+class _Fmt:
+    """Defer format(value, spec) until a log record is actually rendered"""
+    __slots__ = ('value', 'spec')
+    
+    def __init__(self, value, spec: str):
+        self.value = value
+        self.spec = spec
+    
+    def __str__(self) -> str:
+        return format(self.value, self.spec)
+
+
+def _report(verbose: Optional[bool], msg: str, *args):
+    """
+    Emit a progress message
+    
+    Verbose messages are logged at INFO, otherwise at DEBUG; either is a
+    cheap no-op unless the level is enabled. Formatting is deferred to
+    the logging handlers, and log_to_console() shows them on stdout.
+    """
+    if VERBOSE if verbose is None else verbose:
+        logger.info(msg, *args)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args)
+
+
+# =============================================================================
+# INSTRUMENTATION
+# =============================================================================
+
+_NULL_STAGE = nullcontext()  # Shared no-op stage used when profiling is off
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage timing for modulator hot paths
+    
+    Each instrumented call records named stage timings (and, with
+    trace_allocations, tracemalloc byte and block deltas, plus the peak
+    within the stage on Python 3.9+, where tracemalloc can reset its
+    peak). Per-call
+    records are kept as `last` and aggregated into fixed log-spaced
+    histograms so runs can be compared.
+    """
+    
+    # Histogram bin edges in seconds: 100 ns to 10 s, 4 bins per decade
+    BIN_EDGES = np.logspace(-7, 1, 33)
+    
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self.calls = 0
+        self.last: Optional[Dict] = None
+        self._current: Optional[Dict] = None
+        self._call_start = 0.0
+        self._started_tracing = False
+        self._samples: Dict[str, List[float]] = {}
+    
+    def begin_call(self):
+        """Start recording a new instrumented call"""
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._current = {}
+        self._call_start = time.perf_counter()
+    
+    def end_call(self) -> Dict:
+        """Finish the current call and return its stage record"""
+        total = time.perf_counter() - self._call_start
+        stages = self._current or {}
+        self._current = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        
+        for name, entry in stages.items():
+            self._samples.setdefault(name, []).append(entry['seconds'])
+        self._samples.setdefault('total', []).append(total)
+        self.calls += 1
+        self.last = {'stages': stages, 'total_seconds': total}
+        return self.last
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time a named stage; repeated entries within one call accumulate"""
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        track_peak = tracing and hasattr(tracemalloc, 'reset_peak')  # Python 3.9+
+        if tracing:
+            blocks_before = self._traced_blocks()
+            bytes_before = tracemalloc.get_traced_memory()[0]
+            if track_peak:
+                tracemalloc.reset_peak()
+        
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stages = self._current if self._current is not None else {}
+            entry = stages.setdefault(name, {'seconds': 0.0, 'entries': 0})
+            entry['seconds'] += elapsed
+            entry['entries'] += 1
+            if tracing:
+                bytes_after, peak = tracemalloc.get_traced_memory()
+                entry['alloc_bytes'] = entry.get('alloc_bytes', 0) + bytes_after - bytes_before
+                if track_peak:
+                    entry['peak_bytes'] = max(entry.get('peak_bytes', 0), peak - bytes_before)
+                entry['alloc_blocks'] = entry.get('alloc_blocks', 0) + \
+                    self._traced_blocks() - blocks_before
+    
+    @staticmethod
+    def _traced_blocks() -> int:
+        """Number of live memory blocks tracemalloc is tracking"""
+        return sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    
+    def summary(self) -> Dict:
+        """
+        Aggregate statistics and histograms across all recorded calls
+        
+        Returns:
+            Per-stage count, mean, min, max, p50, p95 (seconds) and a
+            histogram over BIN_EDGES
+        """
+        result = {}
+        for name, samples in self._samples.items():
+            values = np.asarray(samples)
+            counts, _ = np.histogram(values, bins=self.BIN_EDGES)
+            result[name] = {
+                'count': len(values),
+                'mean': float(values.mean()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'p50': float(np.percentile(values, 50)),
+                'p95': float(np.percentile(values, 95)),
+                'histogram': {'edges': self.BIN_EDGES.tolist(), 'counts': counts.tolist()}
+            }
+        return result
+    
+    def reset(self):
+        """Discard all recorded calls"""
+        self.calls = 0
+        self.last = None
+        self._samples.clear()
 
 # =============================================================================
 # DATA CLASSES
@@ -47,6 +265,10 @@ class MetamaterialSpecs:
     def total_enhancement(self) -> float:
         """Total metamaterial enhancement factor γ"""
         return self.bragg_enhancement * self.plasmonic_enhancement * self.hyperboliс_enhancement
+    
+    def freeze(self) -> "FrozenMetamaterialSpecs":
+        """Immutable, hashable copy with derived values precomputed"""
+        return FrozenMetamaterialSpecs(**_field_values(self))
 
 
 @dataclass
@@ -71,6 +293,10 @@ class CasimirArraySpecs:
     def plate_spacing_m(self) -> float:
         """Plate spacing in meters"""
         return self.plate_spacing_nm * 1e-9
+    
+    def freeze(self) -> "FrozenCasimirArraySpecs":
+        """Immutable, hashable copy with derived values precomputed"""
+        return FrozenCasimirArraySpecs(**_field_values(self))
 
 
 @dataclass
@@ -81,108 +307,1995 @@ class ScalingLevel:
     unit_cells: int
     thrust_N: float
     power_MW: float
+    
+    def freeze(self) -> "FrozenScalingLevel":
+        """Immutable, hashable copy"""
+        return FrozenScalingLevel(**_field_values(self))
+
+
+# Frozen, slotted variants for sweeps that hold many specs or key caches on
+# them. Derived values are computed once at construction; they are excluded
+# from equality and hashing since they follow from the other fields.
+
+def _field_values(spec) -> Dict:
+    """Constructor arguments of a spec dataclass (derived fields excluded)"""
+    return {f.name: getattr(spec, f.name) for f in fields(spec) if f.init}
+
+
+def _slotted(cls):
+    """
+    Rebuild a frozen dataclass with __slots__
+    
+    What dataclass(slots=True) does on Python 3.10+: field defaults live in
+    the generated __init__, so the class attributes can give way to slots,
+    and pickling goes through __getstate__/__setstate__ since frozen
+    instances reject setattr.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    
+    def __getstate__(self):
+        return [getattr(self, name) for name in names]
+    
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+    
+    namespace['__getstate__'] = __getstate__
+    namespace['__setstate__'] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _frozen_slots(cls):
+    """dataclass(frozen=True, slots=True), including on Python < 3.10"""
+    if sys.version_info >= (3, 10):
+        return dataclass(frozen=True, slots=True)(cls)
+    return _slotted(dataclass(frozen=True)(cls))
+
+
+@_frozen_slots
+class FrozenMetamaterialSpecs:
+    """Immutable MetamaterialSpecs"""
+    bragg_layers: int = 23
+    bragg_materials: Tuple[str, str] = ("Ag", "SiO₂")
+    bragg_enhancement: float = 850.0
+    
+    graphene_present: bool = True
+    graphene_mobility: float = 200000  # cm²/V·s
+    plasmonic_enhancement: float = 380.0
+    
+    hyperboliс_periods: int = 50
+    hyperboliс_materials: Tuple[str, str] = ("InGaAs", "AlInAs")
+    hyperboliс_enhancement: float = 3.7
+    
+    total_enhancement: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Tuples (e.g. the shared defaults) are kept as-is; lists become hashable
+        if not isinstance(self.bragg_materials, tuple):
+            object.__setattr__(self, 'bragg_materials', tuple(self.bragg_materials))
+        if not isinstance(self.hyperboliс_materials, tuple):
+            object.__setattr__(self, 'hyperboliс_materials', tuple(self.hyperboliс_materials))
+        object.__setattr__(self, 'total_enhancement', self.bragg_enhancement
+                           * self.plasmonic_enhancement * self.hyperboliс_enhancement)
+    
+    def thaw(self) -> MetamaterialSpecs:
+        """Mutable copy"""
+        return MetamaterialSpecs(**_field_values(self))
+
+
+@_frozen_slots
+class FrozenCasimirArraySpecs:
+    """Immutable CasimirArraySpecs"""
+    dimensions: Tuple[int, int, int] = (100, 100, 100)
+    plate_spacing_nm: float = 100.0
+    plate_thickness_nm: float = 10.0
+    plate_material: str = "Au/Si"
+    reflectivity: float = 0.99997
+    
+    phase_resolution_deg: float = 0.1
+    switching_speed_ps: float = 47.0
+    directional_accuracy_deg: float = 0.001
+    
+    total_plates: int = field(init=False, repr=False, compare=False)
+    plate_spacing_m: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        dimensions = self.dimensions
+        if not isinstance(dimensions, tuple):
+            dimensions = tuple(int(n) for n in dimensions)
+            object.__setattr__(self, 'dimensions', dimensions)
+        object.__setattr__(self, 'total_plates', dimensions[0] * dimensions[1] * dimensions[2])
+        object.__setattr__(self, 'plate_spacing_m', self.plate_spacing_nm * 1e-9)
+    
+    def thaw(self) -> CasimirArraySpecs:
+        """Mutable copy"""
+        return CasimirArraySpecs(**_field_values(self))
+
+
+@_frozen_slots
+class FrozenScalingLevel:
+    """Immutable ScalingLevel"""
+    name: str
+    dimensions_cm: float
+    unit_cells: int
+    thrust_N: float
+    power_MW: float
+    
+    def thaw(self) -> ScalingLevel:
+        """Mutable copy"""
+        return ScalingLevel(**_field_values(self))
 
 
 # =============================================================================
-# CORE ENGINE
+# PHASE SYNTHESIS
 # =============================================================================
 
-class GravityModulator:
+def phase_block(direction: Tuple[float, float, float],
+                plate_spacing_m: float,
+                i_idx: np.ndarray,
+                j_idx: np.ndarray,
+                k_idx: np.ndarray) -> np.ndarray:
     """
-    Quantum Vacuum Gravity Modulator Core Engine
+    Calculate phase shifts for a block of plates from per-axis indices
+
+    θ_ijk = k·r_ijk mod 2π, with r_ijk = (i, j, k) × spacing
+
+    The linear phase ramp separates per axis, so the block is built as an
+    outer sum of three 1D terms instead of one dot product per plate.
+
+    Args:
+        direction: Target thrust vector (x, y, z)
+        plate_spacing_m: Plate spacing in meters
+        i_idx, j_idx, k_idx: Plate indices along each axis
+
+    Returns:
+        Array of shape (len(i_idx), len(j_idx), len(k_idx)) of phases in radians
+    """
+    dx, dy, dz = (float(d) for d in direction)
+    k = 2 * PI / (plate_spacing_m * 1000)  # Wave vector
+
+    # Positions are scaled per axis exactly as r = (i, j, k) × spacing
+    x = dx * (np.asarray(i_idx) * plate_spacing_m)
+    y = dy * (np.asarray(j_idx) * plate_spacing_m)
+    z = dz * (np.asarray(k_idx) * plate_spacing_m)
+
+    phases = x[:, None, None] + y[None, :, None]
+    phases = phases + z[None, None, :]
+    phases *= k
+    np.mod(phases, 2 * PI, out=phases)
+    return phases
+
+
+def phase_levels(resolution_deg: float) -> int:
+    """Number of distinct phase codes at the given resolution (3600 at 0.1°)"""
+    levels = int(round(360.0 / resolution_deg))
+    if not 0 < levels <= np.iinfo(PHASE_CODE_DTYPE).max + 1:
+        raise ValueError(f"Phase resolution {resolution_deg}° does not fit in {PHASE_CODE_DTYPE.__name__} codes")
+    return levels
+
+
+def encode_phases(phases: np.ndarray, resolution_deg: float = 0.1) -> np.ndarray:
+    """
+    Quantize phases to hardware phase codes
     
-    Simulates Casimir-driven metric modification with metamaterial enhancement
-    and phased array control for directed thrust.
+    code = round(θ / Δθ) mod N, with N = 360° / Δθ
+    
+    Args:
+        phases: Phase shifts in radians
+        resolution_deg: Hardware phase resolution in degrees
+        
+    Returns:
+        Array of uint16 phase codes in [0, N)
     """
+    levels = phase_levels(resolution_deg)
+    scaled = np.multiply(phases, levels / (2 * PI))
+    np.rint(scaled, out=scaled)
+    np.mod(scaled, levels, out=scaled)
+    return scaled.astype(PHASE_CODE_DTYPE)
+
+
+def decode_phases(codes: np.ndarray, resolution_deg: float = 0.1) -> np.ndarray:
+    """
+    Convert hardware phase codes back to radians
     
-    def __init__(self, 
-                 array_size_cm: float = 10.0,
-                 metamaterial: Optional[MetamaterialSpecs] = None,
-                 array: Optional[CasimirArraySpecs] = None):
+    Args:
+        codes: uint16 phase codes
+        resolution_deg: Hardware phase resolution in degrees
         
-        self.array_size_m = array_size_cm / 100.0
-        self.metamaterial = metamaterial or MetamaterialSpecs()
-        self.array = array or CasimirArraySpecs()
+    Returns:
+        Array of phase shifts in radians
+    """
+    return np.multiply(codes, 2 * PI / phase_levels(resolution_deg))
+
+
+def _merge_moments(count_a: float, mean_a: np.ndarray, m2_a: np.ndarray,
+                   count_b: float, mean_b: np.ndarray, m2_b: np.ndarray
+                   ) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Combine two (count, mean, M2) partial statistics (Chan et al.)"""
+    count = count_a + count_b
+    if count == 0:
+        return count, mean_a, m2_a
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (count_b / count)
+    m2 = m2_a + m2_b + delta**2 * (count_a * count_b / count)
+    return count, mean, m2
+
+
+class PhaseMoments:
+    """
+    Running mean and variance of phases, updated block by block
+    
+    Each block's moments are computed while it is still cache-resident and
+    merged into the total, so statistics come out of the same pass that
+    generates the pattern.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, block: np.ndarray):
+        """Fold a block of phases into the running statistics"""
+        if block.size == 0:
+            return
+        block_mean = float(block.mean())
+        centered = (block - block_mean).reshape(-1)
+        block_m2 = float(np.dot(centered, centered))
+        self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2,
+                                                        block.size, block_mean, block_m2)
+    
+    def merge(self, other: "PhaseMoments"):
+        """Fold another accumulator (e.g. from a worker shard) into this one"""
+        if other.count:
+            self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2,
+                                                            other.count, other.mean, other.m2)
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of all phases seen"""
+        return self.m2 / self.count if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation (same as np.std over the pattern)"""
+        return float(np.sqrt(self.variance))
+    
+    def __repr__(self) -> str:
+        return f"PhaseMoments(count={self.count}, mean={self.mean:.6g}, std={self.std:.6g})"
+
+
+def phase_statistics(directions: np.ndarray,
+                     plate_spacing_m: float,
+                     dimensions: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and standard deviation of the phase pattern for many directions
+    
+    Patterns are synthesized in slabs that hold at most PHASE_SLAB_PLATES
+    phases across all directions, and per-slab moments are merged, so no
+    full pattern is ever stored.
+    
+    Args:
+        directions: (N, 3) array of thrust vectors
+        plate_spacing_m: Plate spacing in meters
+        dimensions: Plate grid dimensions
         
-        # Derived parameters
-        self.volume_m3 = self.array_size_m ** 3
-        self.gamma = self.metamaterial.total_enhancement
+    Returns:
+        (mean, std) arrays of shape (N,) in radians
+    """
+    directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+    nx, ny, nz = (int(n) for n in dimensions)
+    s = plate_spacing_m
+    k = 2 * PI / (plate_spacing_m * 1000)  # Wave vector
+    
+    x = np.arange(nx) * s
+    y = np.arange(ny) * s
+    z = np.arange(nz) * s
+    
+    plane = max(1, ny * nz)
+    group = max(1, min(len(directions), PHASE_SLAB_PLATES // plane))
+    means, stds = [], []
+    for g0 in range(0, len(directions), group):
+        d = directions[g0:g0 + group]
+        dx, dy, dz = (d[:, a, None, None, None] for a in range(3))
+        rows = max(1, PHASE_SLAB_PLATES // (plane * len(d)))
         
-        # State tracking
-        self.active = False
-        self.thrust_vector = np.array([0.0, 0.0, 0.0])
-        self.power_input_MW = 0.0
-        self.phase_matrix = np.zeros(self.array.dimensions)
+        count, mean, m2 = 0, np.zeros(len(d)), np.zeros(len(d))
+        for start in range(0, nx, rows):
+            xs = x[start:start + rows]
+            slab = dx * xs[None, :, None, None] + dy * y[None, None, :, None]
+            slab = slab + dz * z[None, None, None, :]
+            slab *= k
+            np.mod(slab, 2 * PI, out=slab)
+            
+            flat = slab.reshape(len(d), -1)
+            slab_mean = flat.mean(axis=1)
+            slab_m2 = ((flat - slab_mean[:, None])**2).sum(axis=1)
+            count, mean, m2 = _merge_moments(count, mean, m2, flat.shape[1], slab_mean, slab_m2)
         
-        print(f"\n🔧 GRAVITY MODULATOR INITIALIZED")
-        print(f"   Array size: {array_size_cm}cm³")
-        print(f"   Total plates: {self.array.total_plates:,}")
-        print(f"   Metamaterial enhancement: {self.gamma:.2e}x")
+        means.append(mean)
+        stds.append(np.sqrt(m2 / max(count, 1)))
+    
+    if not means:
+        return np.zeros(0), np.zeros(0)
+    return np.concatenate(means), np.concatenate(stds)
+
+
+def _phase_shard(shm_name: str,
+                 dimensions: Tuple[int, int, int],
+                 start: int,
+                 stop: int,
+                 direction: Tuple[float, float, float],
+                 plate_spacing_m: float):
+    """
+    Worker: write rows [start, stop) of the phase pattern into shared memory
+    
+    Returns the shard's (count, mean, M2) so statistics need no second pass.
+    """
+    from multiprocessing import shared_memory
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(dimensions, dtype=float, buffer=shm.buf)
+        moments = PhaseMoments()
+        _fill_phase_rows(out, direction, plate_spacing_m, start, stop, moments)
+        del out
+    finally:
+        shm.close()
+    return moments.count, moments.mean, moments.m2
+
+
+def _fill_phase_rows(out: np.ndarray,
+                     direction: Tuple[float, float, float],
+                     plate_spacing_m: float,
+                     start: int,
+                     stop: int,
+                     moments: Optional[PhaseMoments] = None):
+    """
+    Write rows [start, stop) of the phase pattern into out
+    
+    With moments, rows are generated in cache-sized slabs and each slab is
+    folded into the statistics while still hot.
+    """
+    ny, nz = out.shape[1], out.shape[2]
+    j_idx, k_idx = np.arange(ny), np.arange(nz)
+    if moments is None:
+        out[start:stop] = phase_block(direction, plate_spacing_m,
+                                      np.arange(start, stop), j_idx, k_idx)
+        return
+    
+    slab_rows = max(1, PHASE_STATS_SLAB_PLATES // max(1, ny * nz))
+    for row in range(start, stop, slab_rows):
+        end = min(row + slab_rows, stop)
+        block = phase_block(direction, plate_spacing_m, np.arange(row, end), j_idx, k_idx)
+        out[row:end] = block
+        moments.update(block)
+
+
+def parallel_phase_pattern(direction: Tuple[float, float, float],
+                           plate_spacing_m: float,
+                           dimensions: Tuple[int, int, int],
+                           workers: int,
+                           moments: Optional[PhaseMoments] = None) -> np.ndarray:
+    """
+    Calculate the phase pattern sharded along the first axis across processes
+    
+    Workers write their rows straight into a shared-memory buffer, so only
+    the shard bounds are pickled; the result is copied out once at the end.
+    
+    Args:
+        direction: Target thrust vector (x, y, z)
+        plate_spacing_m: Plate spacing in meters
+        dimensions: Plate grid dimensions
+        workers: Number of worker processes
+        moments: If given, accumulates phase statistics from every shard
         
-    def casimir_pressure(self, d: Optional[float] = None) -> float:
-        """
-        Calculate Casimir pressure between plates
+    Returns:
+        3D array of phase shifts in radians
+    """
+    # Deferred: only dense multi-process runs need these
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    dimensions = tuple(int(n) for n in dimensions)
+    direction = tuple(float(d) for d in direction)
+    nbytes = dimensions[0] * dimensions[1] * dimensions[2] * np.dtype(float).itemsize
+    bounds = np.linspace(0, dimensions[0], min(workers, dimensions[0]) + 1).astype(int)
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = [pool.submit(_phase_shard, shm.name, dimensions, int(start), int(stop),
+                                  direction, plate_spacing_m)
+                      for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            for shard in shards:
+                count, mean, m2 = shard.result()
+                if moments is not None:
+                    shard_moments = PhaseMoments()
+                    shard_moments.count, shard_moments.mean, shard_moments.m2 = count, mean, m2
+                    moments.merge(shard_moments)
         
-        P = -π²ℏc / 240d⁴
+        view = np.ndarray(dimensions, dtype=float, buffer=shm.buf)
+        phases = view.copy()
+        del view
+    finally:
+        shm.close()
+        shm.unlink()
+    return phases
+
+
+def plates_per_side(level: ScalingLevel) -> int:
+    """
+    Plates along each edge of a cubic scaling level
+    
+    Each unit cell holds 10×10×10 plates, so a level with N unit cells has
+    10·∛N plates per side.
+    """
+    return int(round(level.unit_cells ** (1 / 3))) * 10
+
+
+def iter_phase_tiles(direction: Tuple[float, float, float],
+                     plate_spacing_m: float,
+                     dimensions: Tuple[int, int, int],
+                     tile_shape: Tuple[int, int, int] = (10, 10, 10),
+                     resolution_deg: Optional[float] = None,
+                     moments: Optional[PhaseMoments] = None,
+                     field: Optional["PhaseField"] = None
+                     ) -> Iterator[Tuple[Tuple[int, int, int], np.ndarray]]:
+    """
+    Generate the phase pattern one tile at a time
+    
+    Tiles are visited in C order and edge tiles are clipped to the array
+    bounds. Only one tile is held in memory at a time.
+    
+    Args:
+        direction: Target thrust vector (x, y, z)
+        plate_spacing_m: Plate spacing in meters
+        dimensions: Plate grid dimensions
+        tile_shape: Plates per tile along each axis
+        resolution_deg: If given, yield uint16 phase codes at this resolution
+        moments: If given, accumulates statistics of the (unquantized) phases
+            as each tile is generated
+        field: Read tiles from this phase state (e.g. PhaseChannels) instead
+            of the analytic ramp for direction
         
-        Args:
-            d: Plate spacing (m), uses default if None
-            
-        Returns:
-            Pressure in Pascals (negative = attractive)
-        """
-        if d is None:
-            d = self.array.plate_spacing_m
-            
-        pressure = -(PI**2 * HBAR * C) / (240 * d**4)
-        return pressure
+    Yields:
+        (tile_index, phase_block) pairs
+    """
+    tile_shape = tuple(int(t) for t in tile_shape)
+    if any(t <= 0 for t in tile_shape):
+        raise ValueError(f"Tile shape must be positive, got {tile_shape}")
+    
+    counts = [-(-n // t) for n, t in zip(dimensions, tile_shape)]
+    for tile_index in np.ndindex(*counts):
+        ranges = [np.arange(ti * t, min((ti + 1) * t, n))
+                  for ti, t, n in zip(tile_index, tile_shape, dimensions)]
+        if field is None:
+            block = phase_block(direction, plate_spacing_m, *ranges)
+        else:
+            block = field._block(*ranges)
+        if moments is not None:
+            moments.update(block)
+        if resolution_deg is not None:
+            block = encode_phases(block, resolution_deg)
+        yield tile_index, block
+
+
+def bounded_tile_shape(dimensions: Tuple[int, int, int],
+                       max_plates: int) -> Tuple[int, int, int]:
+    """Largest C-contiguous-friendly tile shape holding at most max_plates plates"""
+    nx, ny, nz = dimensions
+    tk = max(1, min(nz, max_plates))
+    tj = max(1, min(ny, max_plates // tk))
+    ti = max(1, min(nx, max_plates // (tj * tk)))
+    return ti, tj, tk
+
+
+class PhaseField:
+    """
+    Procedural phase field evaluated on demand
+    
+    Stores only the steering direction, wave vector and array geometry, so
+    memory is constant regardless of plate count. Supports NumPy-style
+    indexing with integers, slices, Ellipsis and integer index arrays
+    (either on a single axis, or on all three axes for point sampling).
+    """
+    
+    ndim = 3
+    dtype = np.dtype(float)
+    
+    def __init__(self,
+                 direction: Tuple[float, float, float],
+                 plate_spacing_m: float,
+                 dimensions: Tuple[int, int, int]):
+        self.direction = tuple(float(d) for d in direction)
+        self.plate_spacing_m = plate_spacing_m
+        self.shape = tuple(int(n) for n in dimensions)
+        self.wave_vector = 2 * PI / (plate_spacing_m * 1000)
     
-    def effective_pressure(self) -> float:
+    @property
+    def size(self) -> int:
+        """Total number of plates"""
+        return self.shape[0] * self.shape[1] * self.shape[2]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes the field would occupy if fully materialized"""
+        return self.size * self.dtype.itemsize
+    
+    def __len__(self) -> int:
+        return self.shape[0]
+    
+    def __repr__(self) -> str:
+        return f"PhaseField(direction={self.direction}, shape={self.shape})"
+    
+    def _expand_key(self, key) -> List:
+        """Expand Ellipsis and pad missing axes with full slices"""
+        if not isinstance(key, tuple):
+            key = (key,)
+        ellipses = [at for at, k in enumerate(key) if k is Ellipsis]
+        if len(ellipses) > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        if ellipses:
+            at = ellipses[0]
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:at] + fill + key[at + 1:]
+        if len(key) > self.ndim:
+            raise IndexError(f"too many indices for PhaseField: {len(key)} given, {self.ndim} allowed")
+        return list(key) + [slice(None)] * (self.ndim - len(key))
+    
+    @staticmethod
+    def _axis_index(index, n: int, axis: int) -> np.ndarray:
+        """Convert one axis index to non-negative plate indices"""
+        if isinstance(index, slice):
+            return np.arange(*index.indices(n))
+        idx = np.asarray(index)
+        if idx.dtype == bool or not np.issubdtype(idx.dtype, np.integer):
+            raise IndexError("PhaseField only supports integer, slice and Ellipsis indices")
+        if np.any((idx < -n) | (idx >= n)):
+            raise IndexError(f"index out of bounds for axis {axis} with size {n}")
+        return np.where(idx < 0, idx + n, idx)
+    
+    def __getitem__(self, key) -> np.ndarray:
+        key = self._expand_key(key)
+        idx = [self._axis_index(k, n, axis) for axis, (k, n) in enumerate(zip(key, self.shape))]
+        advanced = [not isinstance(k, slice) and np.ndim(k) > 0 for k in key]
+        
+        if all(advanced):
+            # Point sampling: index arrays broadcast together, one phase per point
+            return self._points(*np.broadcast_arrays(*idx))
+        if sum(advanced) > 1:
+            raise IndexError("PhaseField supports index arrays on one axis or on all three axes")
+        
+        # Orthogonal indexing: integers drop their axis, everything else is kept
+        block = self._block(*(np.atleast_1d(a) for a in idx))
+        drop = tuple(axis for axis, k in enumerate(key)
+                     if not isinstance(k, slice) and np.ndim(k) == 0)
+        return block.reshape([n for axis, n in enumerate(block.shape) if axis not in drop])
+    
+    def _points(self, i: np.ndarray, j: np.ndarray, k: np.ndarray) -> np.ndarray:
+        """Phases at individual plates (i[n], j[n], k[n])"""
+        s = self.plate_spacing_m
+        dx, dy, dz = self.direction
+        phases = dx * (i * s) + dy * (j * s)
+        phases = phases + dz * (k * s)
+        phases *= self.wave_vector
+        return np.mod(phases, 2 * PI, out=phases)
+    
+    def _block(self, i_idx: np.ndarray, j_idx: np.ndarray, k_idx: np.ndarray) -> np.ndarray:
+        """Phases on the outer product of per-axis plate indices"""
+        return phase_block(self.direction, self.plate_spacing_m, i_idx, j_idx, k_idx)
+    
+    def materialize(self) -> np.ndarray:
+        """Evaluate the full field as a dense array"""
+        return self[...]
+    
+    def moments(self) -> PhaseMoments:
         """
-        Calculate effective pressure with metamaterial enhancement
+        Exact phase statistics streamed tile by tile
         
-        P_eff = P × γ
+        Memory is bounded by PHASE_STATS_SLAB_PLATES; time is linear in
+        plate count.
         """
-        base_pressure = self.casimir_pressure()
-        return base_pressure * self.gamma
+        moments = PhaseMoments()
+        tile_shape = bounded_tile_shape(self.shape, PHASE_STATS_SLAB_PLATES)
+        for _ in iter_phase_tiles(self.direction, self.plate_spacing_m, self.shape,
+                                  tile_shape, moments=moments):
+            pass
+        return moments
     
-    def total_force(self) -> float:
+    def sample_moments(self, samples: int = LAZY_COHERENCE_SAMPLES, seed: int = 0) -> PhaseMoments:
         """
-        Calculate total force from entire array
+        Phase statistics estimated from uniformly sampled plates
         
-        F = P_eff × A_total
+        Args:
+            samples: Number of plates to sample
+            seed: Random seed (estimates are reproducible)
         """
-        plate_area = (self.array.plate_spacing_m * 100) ** 2  # Approximate plate area
-        total_area = plate_area * self.array.total_plates
-        force = abs(self.effective_pressure()) * total_area
-        return force
+        rng = np.random.default_rng(seed)
+        idx = [rng.integers(0, n, size=samples) for n in self.shape]
+        moments = PhaseMoments()
+        moments.update(self[idx[0], idx[1], idx[2]])
+        return moments
     
-    def calculate_phase_pattern(self, direction: Tuple[float, float, float]) -> np.ndarray:
+    def coherence(self, max_plates: int = LAZY_COHERENCE_MAX_PLATES) -> float:
         """
-        Calculate phase shifts for each plate to direct thrust
+        Phase standard deviation of the field
         
-        θ_ij = φ_ij + k·r_ij
-        
-        Args:
-            direction: Target thrust vector (x, y, z)
-            
-        Returns:
-            3D array of phase shifts in radians
+        Exact (streamed) up to max_plates plates, sampled beyond that.
         """
-        phases = np.zeros(self.array.dimensions)
-        k = 2 * PI / (self.array.plate_spacing_m * 1000)  # Wave vector
-        
-        for i in range(self.array.dimensions[0]):
-            for j in range(self.array.dimensions[1]):
-                for k_idx in range(self.array.dimensions[2]):
-                    # Position vector
-                    r = np.array([i, j, k_idx]) * self.array.plate_spacing_m
-                    
-                    # Phase shift for constructive interference along direction
-                    phase = k * np.dot(direction, r)
-                    phases[i, j, k_idx] = phase % (2 * PI)
-                    
-        return phases
+        if self.size <= max_plates:
+            return self.moments().std
+        return self.sample_moments().std
+    
+    def __array__(self, dtype=None, copy=None):
+        phases = self.materialize()
+        return phases if dtype is None else phases.astype(dtype)
+
+
+# Grouped phase channels per scaling level (docs/scaling.md §8.1)
+PHASE_CHANNELS = {
+    "Unit Cell": 1_000,
+    "Tile": 10_000,
+    "Panel": 100_000,
+    "Array": 1_000_000,
+    "Megascale": 10_000_000,
+}
+
+
+def channel_group_shape(level: ScalingLevel) -> Tuple[int, int, int]:
+    """
+    Plates per channel group along each axis for a scaling level
+    
+    The plates-per-channel ratio from the §8.1 table (a power of ten) is
+    split across the axes as evenly as possible, larger factors last.
+    """
+    plates = plates_per_side(level) ** 3
+    exponent = int(round(np.log10(plates / PHASE_CHANNELS[level.name])))
+    base, extra = divmod(exponent, 3)
+    return tuple(10 ** (base + (axis >= 3 - extra)) for axis in range(3))
+
+
+def _group_bounds(n: int, g: int) -> Tuple[np.ndarray, np.ndarray]:
+    """First plate and plate count of each group along an axis of n plates"""
+    starts = np.arange(0, n, g)
+    return starts, np.minimum(starts + g, n) - starts
+
+
+def channel_centers(dimensions: Tuple[int, int, int],
+                    group: Tuple[int, int, int]) -> List[np.ndarray]:
+    """
+    Per-axis index of the plate each channel group is sampled at
+    
+    The middle plate of the group, or the lower of the two middle plates
+    when a group is an even number of plates wide, so a channel's phase
+    is always some plate's phase.
+    """
+    centers = []
+    for n, g in zip(dimensions, group):
+        starts, counts = _group_bounds(n, g)
+        centers.append(starts + (counts - 1) // 2)
+    return centers
+
+
+def channel_phases(direction: Tuple[float, float, float],
+                   plate_spacing_m: float,
+                   dimensions: Tuple[int, int, int],
+                   group: Tuple[int, int, int]) -> np.ndarray:
+    """
+    Phase of each channel group, taken at its center plate (channel_centers)
+    
+    Cost and memory scale with the channel count, not the plate count.
+    Groups at the far edge of an axis may be partial.
+    
+    Args:
+        direction: Target thrust vector (x, y, z)
+        plate_spacing_m: Plate spacing in meters
+        dimensions: Array shape in plates
+        group: Plates per channel along each axis
+        
+    Returns:
+        3D array of channel phases in radians, shape ceil(dimensions / group)
+    """
+    return phase_block(direction, plate_spacing_m, *channel_centers(dimensions, group))
+
+
+class PhaseChannels(PhaseField):
+    """
+    Phase state held per channel group
+    
+    Indexes like a per-plate PhaseField, but every plate reads the phase of
+    the channel it belongs to; only the channel array is stored.
+    """
+    
+    def __init__(self,
+                 channels: np.ndarray,
+                 group: Tuple[int, int, int],
+                 direction: Tuple[float, float, float],
+                 plate_spacing_m: float,
+                 dimensions: Tuple[int, int, int]):
+        super().__init__(direction, plate_spacing_m, dimensions)
+        self.channels = channels
+        self.group = tuple(int(g) for g in group)
+    
+    def __repr__(self) -> str:
+        return (f"PhaseChannels(direction={self.direction}, shape={self.shape}, "
+                f"channels={self.channels.shape})")
+    
+    def _points(self, i, j, k) -> np.ndarray:
+        gx, gy, gz = self.group
+        return self.channels[i // gx, j // gy, k // gz]
+    
+    def _block(self, i_idx, j_idx, k_idx) -> np.ndarray:
+        gx, gy, gz = self.group
+        return self.channels[np.ix_(i_idx // gx, j_idx // gy, k_idx // gz)]
+    
+    def weights(self) -> np.ndarray:
+        """Plates per channel (partial edge groups hold fewer)"""
+        cx, cy, cz = (_group_bounds(n, g)[1] for n, g in zip(self.shape, self.group))
+        return cx[:, None, None] * cy[None, :, None] * cz[None, None, :]
+    
+    def moments(self) -> PhaseMoments:
+        """Exact per-plate phase statistics from plate-weighted channels"""
+        weights = self.weights()
+        moments = PhaseMoments()
+        moments.count = int(weights.sum())
+        moments.mean = float(np.average(self.channels, weights=weights))
+        moments.m2 = float(np.sum(weights * np.square(self.channels - moments.mean)))
+        return moments
+    
+    def coherence(self, max_plates: int = LAZY_COHERENCE_MAX_PLATES) -> float:
+        """Phase standard deviation over plates (always exact; cost ∝ channels)"""
+        return self.moments().std
+
+
+class PhaseCache:
+    """
+    Bounded LRU cache of phase patterns
+
+    Entries are keyed on the steering direction and array geometry and are
+    evicted least-recently-used first when either the entry count or the
+    byte budget is exceeded. Cached arrays are read-only.
+    """
+    
+    def __init__(self, max_entries: int = 8, max_bytes: int = 256 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self._entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(direction: Tuple[float, float, float],
+                 array: CasimirArraySpecs) -> Tuple:
+        """
+        Build a cache key from direction and array geometry
+        
+        The direction is canonicalized to floats (so (0, 0, 1) and
+        (0.0, 0.0, 1.0) share an entry) but not rescaled, since the phase
+        ramp depends on its magnitude.
+        """
+        return (tuple(float(d) for d in direction),
+                array.plate_spacing_m,
+                tuple(int(n) for n in array.dimensions))
+    
+    def get_or_compute(self, key: Hashable,
+                       compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the cached pattern for key, computing and storing it on a miss"""
+        phases, _ = self.lookup(key, lambda: (compute(), None))
+        return phases
+    
+    def lookup(self, key: Hashable,
+               compute: Callable[[], Tuple[np.ndarray, object]]) -> Tuple[np.ndarray, object]:
+        """
+        Return the cached (pattern, info) pair for key, computing it on a miss
+        
+        info is any small object stored alongside the pattern (e.g. its
+        PhaseMoments); only the pattern counts toward the byte budget.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        
+        self.misses += 1
+        phases, info = compute()
+        phases.flags.writeable = False
+        
+        # Patterns larger than the whole budget are returned uncached
+        if self.max_entries <= 0 or phases.nbytes > self.max_bytes:
+            return phases, info
+        
+        self._entries[key] = (phases, info)
+        self.nbytes += phases.nbytes
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+        return phases, info
+    
+    def clear(self):
+        """Drop all cached patterns (counters are kept)"""
+        self._entries.clear()
+        self.nbytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> Dict:
+        """Get cache counters and occupancy"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.nbytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes
+        }
+
+
+# =============================================================================
+# FORCE MODEL
+# =============================================================================
+# Array-aware forms of the modulator's force equations. Arguments broadcast
+# against each other, so a design sweep over spacing, enhancement and plate
+# count is one call; scalar inputs give scalar results.
+
+def _unwrap(values: np.ndarray) -> Union[float, np.ndarray]:
+    """Plain float for 0-d results, the array otherwise"""
+    return float(values) if values.ndim == 0 else values
+
+
+def casimir_pressure(plate_spacing_m: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Casimir pressure between parallel plates
+    
+    P = -π²ℏc / 240d⁴
+    
+    Args:
+        plate_spacing_m: Plate spacing(s) in meters
+        
+    Returns:
+        Pressure in Pascals (negative = attractive)
+    """
+    d = np.asarray(plate_spacing_m, dtype=float)
+    return _unwrap(-(PI**2 * HBAR * C) / (240 * d**4))
+
+
+def effective_pressure(plate_spacing_m: Union[float, np.ndarray],
+                       enhancement: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Casimir pressure with metamaterial enhancement
+    
+    P_eff = P × γ
+    
+    Args:
+        plate_spacing_m: Plate spacing(s) in meters
+        enhancement: Metamaterial enhancement factor(s) γ
+    """
+    return _unwrap(np.asarray(casimir_pressure(plate_spacing_m)) * np.asarray(enhancement, dtype=float))
+
+
+def total_force(plate_spacing_m: Union[float, np.ndarray],
+                enhancement: Union[float, np.ndarray],
+                total_plates: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Total force from a plate array
+    
+    F = |P_eff| × A_total, with each plate's area approximated as (100·d)²
+    
+    Args:
+        plate_spacing_m: Plate spacing(s) in meters
+        enhancement: Metamaterial enhancement factor(s) γ
+        total_plates: Plate count(s)
+        
+    Returns:
+        Force in Newtons
+    """
+    d = np.asarray(plate_spacing_m, dtype=float)
+    plate_area = (d * 100) ** 2  # Approximate plate area
+    total_area = plate_area * np.asarray(total_plates, dtype=float)
+    return _unwrap(np.abs(effective_pressure(d, enhancement)) * total_area)
+
+
+# =============================================================================
+# TOLERANCE ANALYSIS
+# =============================================================================
+
+TOLERANCE_FIELDS = ('bragg_enhancement', 'plasmonic_enhancement', 'hyperboliс_enhancement',
+                    'plate_spacing_nm', 'reflectivity')
+
+
+@dataclass
+class Tolerance:
+    """Manufacturing scatter of one spec field"""
+    field: str
+    sigma: float                    # Std dev (normal) or half-width (uniform)
+    distribution: str = 'normal'    # 'normal', 'uniform' or 'lognormal'
+    relative: bool = True           # sigma is a fraction of the nominal value
+    bounds: Optional[Tuple[float, float]] = None  # Clip samples to [low, high]
+    
+    def sample(self, rng: np.random.Generator, nominal: float, n: int) -> np.ndarray:
+        """Draw n values around nominal"""
+        sigma = self.sigma * abs(nominal) if self.relative else self.sigma
+        if self.distribution == 'normal':
+            values = rng.normal(nominal, sigma, n)
+        elif self.distribution == 'uniform':
+            values = rng.uniform(nominal - sigma, nominal + sigma, n)
+        elif self.distribution == 'lognormal':
+            # Median at nominal; sigma is the spread of log(value)
+            values = nominal * rng.lognormal(0.0, self.sigma, n)
+        else:
+            raise ValueError(f"Unknown distribution: {self.distribution}")
+        if self.bounds is not None:
+            np.clip(values, self.bounds[0], self.bounds[1], out=values)
+        return values
+
+
+class _LogHistogram:
+    """Streamed distribution summary: exact moments and extrema, binned percentiles"""
+    
+    def __init__(self, nominal: float, bins: int = MC_HISTOGRAM_BINS,
+                 decades: float = MC_HISTOGRAM_DECADES):
+        center = np.log10(nominal)
+        self.edges = np.linspace(center - decades, center + decades, bins + 1)
+        self.counts = np.zeros(bins + 2, dtype=np.int64)  # Under/overflow at ends
+        self.moments = PhaseMoments()
+        self.min = np.inf
+        self.max = -np.inf
+    
+    def update(self, values: np.ndarray):
+        self.moments.update(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bins = np.searchsorted(self.edges, np.log10(values), side='right')
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+    
+    def percentile(self, q: float) -> float:
+        """q-th percentile, accurate to one bin (~0.02% relative at the default binning)"""
+        rank = q / 100 * (self.moments.count - 1)
+        cumulative = np.cumsum(self.counts)
+        bin_index = int(np.searchsorted(cumulative, rank, side='right'))
+        if bin_index == 0:
+            return self.min
+        if bin_index == len(self.counts) - 1:
+            return self.max
+        # Interpolate within the bin by rank
+        below = cumulative[bin_index - 1]
+        frac = (rank - below + 0.5) / self.counts[bin_index]
+        low, high = self.edges[bin_index - 1], self.edges[bin_index]
+        return float(np.clip(10 ** (low + frac * (high - low)), self.min, self.max))
+    
+    def summary(self, percentiles: Tuple[float, ...]) -> Dict:
+        return {
+            'mean': self.moments.mean,
+            'std': self.moments.std,
+            'min': self.min,
+            'max': self.max,
+            'percentiles': {q: self.percentile(q) for q in percentiles}
+        }
+
+
+def monte_carlo_thrust(tolerances: List[Tolerance],
+                       metamaterial: Optional[MetamaterialSpecs] = None,
+                       array: Optional[CasimirArraySpecs] = None,
+                       samples: int = 1_000_000,
+                       seed: int = 0,
+                       percentiles: Tuple[float, ...] = (1, 5, 50, 95, 99),
+                       min_thrust_N: Optional[float] = None,
+                       chunk_size: int = MC_CHUNK_SAMPLES) -> Dict:
+    """
+    Monte Carlo yield analysis of thrust under manufacturing scatter
+    
+    Each toleranced field is drawn from its own seeded stream, so results
+    are reproducible and draw the same samples for any chunk_size. Samples are
+    evaluated with the vectorized force model a chunk at a time and folded
+    into streamed summaries, so memory does not grow with sample count.
+    
+    Reflectivity enters as a relative factor (R/R₀)² on the pressure (one
+    reflection per plate), so the nominal design reproduces total_force().
+    
+    Args:
+        tolerances: Scatter for any of TOLERANCE_FIELDS; other fields stay nominal
+        metamaterial: Nominal metamaterial design (defaults to MetamaterialSpecs())
+        array: Nominal array design (defaults to CasimirArraySpecs())
+        samples: Number of Monte Carlo samples
+        seed: Root seed
+        percentiles: Percentiles to report
+        min_thrust_N: Thrust spec for the yield figure (None skips it)
+        chunk_size: Samples evaluated per batch
+        
+    Returns:
+        Dictionary with nominal values, thrust and pressure-magnitude
+        summaries and, when min_thrust_N is given, the yield fraction
+    """
+    metamaterial = metamaterial or MetamaterialSpecs()
+    array = array or CasimirArraySpecs()
+    nominal = {name: float(getattr(metamaterial if hasattr(metamaterial, name) else array, name))
+               for name in TOLERANCE_FIELDS}
+    for tolerance in tolerances:
+        if tolerance.field not in nominal:
+            raise ValueError(f"Cannot tolerance {tolerance.field!r}; choose from {TOLERANCE_FIELDS}")
+    
+    def evaluate(values: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        gamma = (values['bragg_enhancement'] * values['plasmonic_enhancement']
+                 * values['hyperboliс_enhancement'])
+        reflection = (values['reflectivity'] / nominal['reflectivity'])**2
+        spacing_m = values['plate_spacing_nm'] * 1e-9
+        pressure = np.abs(np.asarray(effective_pressure(spacing_m, gamma))) * reflection
+        thrust = np.asarray(total_force(spacing_m, gamma, array.total_plates)) * reflection
+        return thrust * NOMINAL_EFFICIENCY, pressure
+    
+    nominal_thrust, nominal_pressure = (float(x[0]) for x in evaluate(
+        {name: np.array([value]) for name, value in nominal.items()}))
+    
+    streams = dict(zip((t.field for t in tolerances),
+                       (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(tolerances)))))
+    thrust_hist = _LogHistogram(nominal_thrust)
+    pressure_hist = _LogHistogram(nominal_pressure)
+    passing = 0
+    
+    for start in range(0, samples, chunk_size):
+        n = min(chunk_size, samples - start)
+        values = {name: np.full(n, value) for name, value in nominal.items()}
+        for tolerance in tolerances:
+            values[tolerance.field] = tolerance.sample(streams[tolerance.field],
+                                                       nominal[tolerance.field], n)
+        thrust, pressure = evaluate(values)
+        thrust_hist.update(thrust)
+        pressure_hist.update(pressure)
+        if min_thrust_N is not None:
+            passing += int(np.count_nonzero(thrust >= min_thrust_N))
+    
+    result = {
+        'samples': samples,
+        'seed': seed,
+        'nominal_thrust_N': nominal_thrust,
+        'nominal_pressure_Pa': nominal_pressure,
+        'thrust_N': thrust_hist.summary(percentiles),
+        'pressure_Pa': pressure_hist.summary(percentiles)
+    }
+    if min_thrust_N is not None:
+        result['yield'] = passing / samples if samples else 0.0
+    return result
+
+
+# =============================================================================
+# FAR-FIELD RESPONSE
+# =============================================================================
+
+def steering_bin(direction: Tuple[float, float, float],
+                 grid_shape: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """
+    FFT bin the array factor peaks at when steered toward direction
+    
+    The synthesized ramp advances 2π·d/1000 rad per plate along each axis,
+    i.e. d/1000 cycles per plate.
+    """
+    return tuple(int(round(d / 1000 * n)) % n for d, n in zip(direction, grid_shape))
+
+
+def array_factor(phases: np.ndarray,
+                 direction: Tuple[float, float, float],
+                 grid_shape: Optional[Tuple[int, int, int]] = None) -> Dict:
+    """
+    Far-field response of a phase pattern via 3D FFT
+    
+    AF(u) = Σ exp(iθ_n) e^(-2πi u·n), sampled on grid_shape direction bins
+    (zero-padded beyond the array dimensions for a finer angular grid).
+    The main lobe is the box reaching the first null around the commanded
+    direction's bin. Efficiency is |AF|² at the main-lobe peak over N², the
+    bound reached when every plate adds coherently, so it does not depend
+    on the grid beyond how finely it samples the peak.
+    
+    Args:
+        phases: 3D array of phase shifts in radians
+        direction: Commanded thrust direction
+        grid_shape: Angular grid size per axis (defaults to the array shape)
+        
+    Returns:
+        Dictionary with main-lobe efficiency, side-lobe level and peak bins
+    """
+    grid_shape = tuple(phases.shape if grid_shape is None else grid_shape)
+    if any(g < n for g, n in zip(grid_shape, phases.shape)):
+        raise ValueError(f"grid_shape {grid_shape} is smaller than the array {phases.shape}")
+    
+    # Single precision halves FFT memory traffic; power ratios need no more
+    phases32 = phases.astype(np.float32)
+    excitation = np.empty(phases.shape, dtype=np.complex64)
+    np.cos(phases32, out=excitation.real)
+    np.sin(phases32, out=excitation.imag)
+    del phases32
+    
+    spectrum = np.fft.fftn(excitation, s=grid_shape, axes=(0, 1, 2))
+    del excitation
+    power = np.square(spectrum.real)
+    power += np.square(spectrum.imag)
+    del spectrum
+    
+    # Main lobe: commanded bin ± one null width (grid/array bins) per axis
+    target = steering_bin(direction, grid_shape)
+    lobe_axes = []
+    for center, g, n in zip(target, grid_shape, phases.shape):
+        half = -(-g // n)
+        lobe_axes.append(np.unique(np.arange(center - half, center + half + 1) % g))
+    lobe = np.ix_(*lobe_axes)
+    main_peak = float(power[lobe].max())
+    
+    peak_bin = np.unravel_index(int(np.argmax(power)), grid_shape)
+    power[lobe] = 0.0
+    side_peak = float(power.max())
+    
+    if side_peak > 0 and main_peak > 0:
+        side_lobe_db = 10 * np.log10(side_peak / main_peak)
+    else:
+        side_lobe_db = float('-inf')
+    
+    return {
+        'main_lobe_efficiency': main_peak / float(phases.size) ** 2 if phases.size else 0.0,
+        'side_lobe_level_db': float(side_lobe_db),
+        'target_bin': target,
+        'peak_bin': tuple(int(b) for b in peak_bin),
+        'grid_shape': grid_shape
+    }
+
+
+# =============================================================================
+# SLEW PLANNING
+# =============================================================================
+
+# Normalized progress s(τ) along a slew for normalized time τ in [0, 1]
+SLEW_PROFILES = {
+    'linear': lambda tau: tau,
+    'cosine': lambda tau: 0.5 - 0.5 * np.cos(PI * tau),
+    'min_jerk': lambda tau: tau**3 * (10 - 15 * tau + 6 * tau**2),
+}
+
+
+def slew_directions(start: Tuple[float, float, float],
+                    end: Tuple[float, float, float],
+                    duration_s: float,
+                    rate_hz: float = 1e6,
+                    profile: str = 'min_jerk') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Commanded direction at every control tick of a slew
+    
+    Directions follow the great circle from start to end (slerp) with
+    their magnitude interpolated linearly, so a unit thrust vector stays
+    unit length mid-slew. Antiparallel or zero vectors have no unique
+    great circle and are interpolated linearly instead.
+    
+    Args:
+        start: Direction at the start of the slew
+        end: Direction at the end of the slew
+        duration_s: Slew duration
+        rate_hz: Control tick rate (docs/scaling.md §8.1: 1 kHz to 1 MHz)
+        profile: Progress profile, one of SLEW_PROFILES
+        
+    Returns:
+        (times_s, directions) for ticks 1..N after the start; the last
+        tick lands exactly on end
+    """
+    if profile not in SLEW_PROFILES:
+        raise ValueError(f"Unknown slew profile {profile!r}; choose from {sorted(SLEW_PROFILES)}")
+    if duration_s <= 0 or rate_hz <= 0:
+        raise ValueError("Slew duration and tick rate must be positive")
+    
+    frames = max(1, int(round(duration_s * rate_hz)))
+    times = np.arange(1, frames + 1) * (duration_s / frames)
+    s = SLEW_PROFILES[profile](times / duration_s)[:, None]
+    
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    norm0, norm1 = np.linalg.norm(start), np.linalg.norm(end)
+    if norm0 > 0 and norm1 > 0:
+        u0, u1 = start / norm0, end / norm1
+        omega = np.arccos(np.clip(u0 @ u1, -1.0, 1.0))
+    else:
+        omega = PI
+    
+    if omega < 1e-12 or PI - omega < 1e-9:
+        directions = start + s * (end - start)
+    else:
+        path = (np.sin((1 - s) * omega) * u0 + np.sin(s * omega) * u1) / np.sin(omega)
+        directions = path * (norm0 + s * (norm1 - norm0))
+    directions[-1] = end
+    return times, directions
+
+
+def phase_frames(directions: np.ndarray,
+                 plate_spacing_m: float,
+                 i_idx: np.ndarray,
+                 j_idx: np.ndarray,
+                 k_idx: np.ndarray,
+                 resolution_deg: Optional[float] = None) -> np.ndarray:
+    """
+    Phase blocks for many directions in one batched pass
+    
+    The 4D form of phase_block(). Per-axis ramps for every frame are
+    reduced modulo one turn before the (frames, i, j, k) outer sum, so
+    each plate costs an add and a conditional subtract rather than a
+    floating-point modulo (several times faster than phase_block() per
+    frame). Results agree with phase_block() to rounding.
+    
+    Args:
+        directions: (F, 3) array of thrust vectors
+        plate_spacing_m: Plate spacing in meters
+        i_idx, j_idx, k_idx: Plate indices along each axis
+        resolution_deg: If given, return uint16 phase codes at this
+            resolution, computed directly in code units
+        
+    Returns:
+        Array of shape (F, len(i_idx), len(j_idx), len(k_idx)) in radians,
+        or of phase codes
+    """
+    directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+    turn = 2 * PI if resolution_deg is None else float(phase_levels(resolution_deg))
+    k = 2 * PI / (plate_spacing_m * 1000) * (turn / (2 * PI))  # Wave vector, in turn units
+    
+    x, y, z = (np.mod(k * directions[:, axis, None] * (np.asarray(idx) * plate_spacing_m)[None, :],
+                      turn)
+               for axis, idx in enumerate((i_idx, j_idx, k_idx)))
+    
+    plane = x[:, :, None] + y[:, None, :]
+    plane[plane >= turn] -= turn
+    phases = plane[:, :, :, None] + z[:, None, None, :]
+    np.subtract(phases, turn, out=phases, where=phases >= turn)
+    if resolution_deg is not None:
+        # Round after reducing; values just below one turn round up to it
+        np.rint(phases, out=phases)
+        phases[phases == turn] = 0
+        return phases.astype(PHASE_CODE_DTYPE)
+    return phases
+
+
+# =============================================================================
+# WIRE FORMAT
+# =============================================================================
+
+# Versioned binary phase frame: a fixed little-endian header, then the uint16
+# phase codes in C order, optionally delta-coded and compressed.
+#
+#   magic 4s | version B | flags B | codec B | reserved B | sequence I |
+#   resolution_deg d | nx, ny, nz 3I | payload_bytes I | crc32 I
+#
+# A delta frame carries (codes - previous) mod levels against frame
+# sequence - 1, which is mostly zeros for small steering changes and
+# compresses well. The CRC-32 covers the header (minus the CRC field) and
+# the payload as sent, so corruption is caught before decompression.
+FRAME_MAGIC = b'GMPF'
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct('<4sBBBBIdIIIII')
+FRAME_FLAG_DELTA = 0x01
+FRAME_CODECS = {'none': 0, 'zlib': 1, 'lz4': 2}
+_FRAME_WIRE_DTYPE = np.dtype('<u2')
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """Decoded phase frame header"""
+    sequence: int
+    resolution_deg: float
+    dimensions: Tuple[int, int, int]
+    delta: bool
+    compression: str
+    payload_bytes: int
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the whole frame on the wire"""
+        return FRAME_HEADER.size + self.payload_bytes
+
+
+def _lz4_frame():
+    try:
+        import lz4.frame  # Optional dependency
+    except ImportError as e:
+        raise ImportError("lz4 frame compression requires lz4 (pip install lz4)") from e
+    return lz4.frame
+
+
+def _compress(compression: str, data: memoryview, level: int) -> bytes:
+    if compression == 'zlib':
+        return zlib.compress(data, level)
+    return _lz4_frame().compress(data, compression_level=level)
+
+
+def _decompress(compression: str, payload: memoryview, raw_bytes: int) -> bytes:
+    if compression == 'zlib':
+        return zlib.decompress(payload, bufsize=raw_bytes)
+    return _lz4_frame().decompress(payload)
+
+
+def encode_frame(codes: np.ndarray,
+                 resolution_deg: float = 0.1,
+                 previous: Optional[np.ndarray] = None,
+                 compression: str = 'zlib',
+                 level: int = 1,
+                 sequence: int = 0) -> bytearray:
+    """
+    Serialize a grid of phase codes as one wire frame
+    
+    Args:
+        codes: 3D array of phase codes at resolution_deg (e.g. phase_codes)
+        resolution_deg: Phase resolution the codes are quantized at
+        previous: Codes of frame sequence - 1; if given, a delta frame is sent
+        compression: One of FRAME_CODECS ('lz4' needs the lz4 package)
+        level: Compression level passed to the codec
+        sequence: Frame number, wrapping at 2³²
+        
+    Returns:
+        The frame, ready to send or write as-is
+    """
+    if compression not in FRAME_CODECS:
+        raise ValueError(f"Unknown compression {compression!r}; choose from {sorted(FRAME_CODECS)}")
+    codes = np.ascontiguousarray(codes, dtype=_FRAME_WIRE_DTYPE)
+    if codes.ndim != 3:
+        raise ValueError(f"Phase frames are 3D code grids, got shape {codes.shape}")
+    
+    payload = codes
+    if previous is not None:
+        if np.shape(previous) != codes.shape:
+            raise ValueError(f"Previous frame shape {np.shape(previous)} != {codes.shape}")
+        # (codes - previous) mod levels; uint16 arithmetic wraps, so add levels back
+        payload = np.subtract(codes, previous, dtype=_FRAME_WIRE_DTYPE)
+        np.add(payload, phase_levels(resolution_deg), out=payload, where=codes < previous)
+    body = memoryview(payload).cast('B')
+    if compression != 'none':
+        body = _compress(compression, body, level)
+    
+    frame = bytearray(FRAME_HEADER.size + len(body))
+    frame[FRAME_HEADER.size:] = body
+    flags = FRAME_FLAG_DELTA if previous is not None else 0
+    FRAME_HEADER.pack_into(frame, 0, FRAME_MAGIC, FRAME_VERSION, flags, FRAME_CODECS[compression],
+                           0, sequence & 0xFFFFFFFF, float(resolution_deg), *codes.shape,
+                           len(body), 0)
+    view = memoryview(frame)
+    crc = zlib.crc32(view[FRAME_HEADER.size:], zlib.crc32(view[:FRAME_HEADER.size - 4]))
+    struct.pack_into('<I', frame, FRAME_HEADER.size - 4, crc)
+    return frame
+
+
+def read_frame_header(buffer) -> FrameHeader:
+    """Parse and validate the header at the start of buffer"""
+    view = memoryview(buffer).cast('B')
+    if len(view) < FRAME_HEADER.size:
+        raise ValueError(f"Frame truncated: {len(view)} bytes is shorter than the header")
+    (magic, version, flags, codec, _, sequence, resolution_deg,
+     nx, ny, nz, payload_bytes, _) = FRAME_HEADER.unpack_from(view)
+    if magic != FRAME_MAGIC:
+        raise ValueError(f"Not a phase frame (magic {bytes(magic)!r})")
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported phase frame version {version}")
+    names = {value: name for name, value in FRAME_CODECS.items()}
+    if codec not in names:
+        raise ValueError(f"Unknown phase frame codec {codec}")
+    return FrameHeader(sequence, resolution_deg, (nx, ny, nz), bool(flags & FRAME_FLAG_DELTA),
+                       names[codec], payload_bytes)
+
+
+def decode_frame(buffer,
+                 previous: Optional[np.ndarray] = None,
+                 verify: bool = True) -> Tuple[FrameHeader, np.ndarray]:
+    """
+    Deserialize one wire frame from the start of buffer
+    
+    Uncompressed keyframes are decoded without copying: the codes are a
+    read-only (or, over a bytearray, writable) view of buffer itself.
+    
+    Args:
+        buffer: Any bytes-like object holding the frame (extra trailing
+            bytes are ignored, see iter_frames())
+        previous: Codes of frame sequence - 1, required for delta frames
+        verify: Check the CRC-32 before decoding
+        
+    Returns:
+        (header, codes) with codes shaped header.dimensions
+    """
+    view = memoryview(buffer).cast('B')
+    header = read_frame_header(view)
+    if len(view) < header.nbytes:
+        raise ValueError(f"Frame truncated: {len(view)} of {header.nbytes} bytes")
+    payload = view[FRAME_HEADER.size:header.nbytes]
+    
+    if verify:
+        crc = zlib.crc32(payload, zlib.crc32(view[:FRAME_HEADER.size - 4]))
+        if crc != struct.unpack_from('<I', view, FRAME_HEADER.size - 4)[0]:
+            raise ValueError(f"Phase frame {header.sequence} failed its checksum")
+    
+    plates = int(np.prod(header.dimensions))
+    if header.compression != 'none':
+        payload = _decompress(header.compression, payload, plates * _FRAME_WIRE_DTYPE.itemsize)
+    codes = np.frombuffer(payload, dtype=_FRAME_WIRE_DTYPE, count=plates).reshape(header.dimensions)
+    levels = phase_levels(header.resolution_deg)
+    if plates and codes.max() >= levels:
+        raise ValueError(f"Phase frame {header.sequence} holds code {codes.max()} outside "
+                         f"0..{levels - 1} for {header.resolution_deg}° resolution")
+    
+    if header.delta:
+        if previous is None:
+            raise ValueError(f"Phase frame {header.sequence} is a delta frame; pass the previous codes")
+        if np.shape(previous) != header.dimensions:
+            raise ValueError(f"Previous frame shape {np.shape(previous)} != {header.dimensions}")
+        codes = np.add(previous, codes, dtype=_FRAME_WIRE_DTYPE)
+        np.subtract(codes, levels, out=codes, where=codes >= levels)
+    return header, codes
+
+
+def iter_frames(buffer) -> Iterator[memoryview]:
+    """Split a stream of concatenated frames into per-frame views (no copies)"""
+    view = memoryview(buffer).cast('B')
+    offset = 0
+    while offset < len(view):
+        size = read_frame_header(view[offset:]).nbytes
+        yield view[offset:offset + size]
+        offset += size
+
+
+class PhaseFrameEncoder:
+    """
+    Encode a frame stream, delta-coding each frame against the last
+    
+    A keyframe is sent every keyframe_interval frames (and whenever the
+    grid shape changes) so a receiver can join or recover mid-stream;
+    keyframe_interval=1 sends keyframes only.
+    """
+    
+    def __init__(self,
+                 resolution_deg: float = 0.1,
+                 compression: str = 'zlib',
+                 level: int = 1,
+                 keyframe_interval: int = 100):
+        if keyframe_interval < 1:
+            raise ValueError(f"Keyframe interval must be at least 1, got {keyframe_interval}")
+        self.resolution_deg = resolution_deg
+        self.compression = compression
+        self.level = level
+        self.keyframe_interval = keyframe_interval
+        self.sequence = 0
+        self._previous: Optional[np.ndarray] = None
+    
+    def encode(self, codes: np.ndarray) -> bytearray:
+        """Encode the next frame"""
+        codes = np.array(codes, dtype=_FRAME_WIRE_DTYPE)  # Callers may update their state in place
+        previous = self._previous
+        if previous is not None and (previous.shape != codes.shape
+                                     or self.sequence % self.keyframe_interval == 0):
+            previous = None
+        frame = encode_frame(codes, self.resolution_deg, previous, self.compression,
+                             self.level, self.sequence)
+        self._previous = codes
+        self.sequence += 1
+        return frame
+
+
+class PhaseFrameDecoder:
+    """
+    Decode a frame stream from PhaseFrameEncoder
+    
+    Delta frames must arrive in sequence after the frame they are coded
+    against. The last frame is kept to apply the next delta, and raw
+    keyframes are views of their buffer, so don't reuse a receive buffer
+    while a later delta still depends on its frame.
+    """
+    
+    def __init__(self, verify: bool = True):
+        self.verify = verify
+        self.sequence: Optional[int] = None
+        self._previous: Optional[np.ndarray] = None
+    
+    def decode(self, buffer) -> Tuple[FrameHeader, np.ndarray]:
+        """Decode the next frame"""
+        header = read_frame_header(buffer)
+        if header.delta and (self.sequence is None
+                             or header.sequence != (self.sequence + 1) & 0xFFFFFFFF):
+            raise ValueError(f"Delta frame {header.sequence} does not follow frame {self.sequence}")
+        header, codes = decode_frame(buffer, self._previous if header.delta else None, self.verify)
+        self.sequence = header.sequence
+        self._previous = codes
+        return header, codes
+
+
+# =============================================================================
+# CORE ENGINE
+# =============================================================================
+
+class GravityModulator:
+    """
+    Quantum Vacuum Gravity Modulator Core Engine
+    
+    Simulates Casimir-driven metric modification with metamaterial enhancement
+    and phased array control for directed thrust.
+    """
+    
+    def __init__(self, 
+                 array_size_cm: float = 10.0,
+                 metamaterial: Optional[MetamaterialSpecs] = None,
+                 array: Optional[CasimirArraySpecs] = None,
+                 phase_cache: Optional[PhaseCache] = None,
+                 compact_phases: bool = False,
+                 lazy_phases: bool = False,
+                 phase_workers: int = 1,
+                 verbose: Optional[bool] = None,
+                 profiler: Optional[StageProfiler] = None,
+                 measure_far_field: bool = False,
+                 channel_group: Optional[Union[Tuple[int, int, int], ScalingLevel]] = None):
+        
+        if compact_phases and lazy_phases:
+            raise ValueError("compact_phases and lazy_phases are mutually exclusive")
+        if channel_group is not None and (compact_phases or lazy_phases):
+            raise ValueError("channel_group cannot be combined with compact_phases or lazy_phases")
+        
+        self.array_size_m = array_size_cm / 100.0
+        self.metamaterial = metamaterial or MetamaterialSpecs()
+        self.array = array or CasimirArraySpecs()
+        self.phase_cache = phase_cache if phase_cache is not None else PhaseCache()
+        self.compact_phases = compact_phases
+        self.lazy_phases = lazy_phases
+        self.phase_workers = phase_workers
+        self.verbose = verbose  # None follows the module-level VERBOSE setting
+        self.profiler = profiler  # None disables stage instrumentation
+        # Solve the array factor on activation instead of assuming NOMINAL_EFFICIENCY
+        self.measure_far_field = measure_far_field
+        self._far_field_memo = None
+        # Plates per phase channel along each axis; None drives every plate
+        if isinstance(channel_group, (ScalingLevel, FrozenScalingLevel)):
+            channel_group = channel_group_shape(channel_group)
+        if channel_group is not None:
+            channel_group = tuple(int(g) for g in channel_group)
+            if len(channel_group) != 3 or any(g <= 0 for g in channel_group):
+                raise ValueError(f"Channel group must be three positive sizes, got {channel_group}")
+        self.channel_group = channel_group
+        
+        # Derived parameters
+        self.volume_m3 = self.array_size_m ** 3
+        self.gamma = self.metamaterial.total_enhancement
+        
+        # State tracking
+        self.active = False
+        self.thrust_vector = np.array([0.0, 0.0, 0.0])
+        self.power_input_MW = 0.0
+        # Phase state: radians, uint16 codes at phase_resolution_deg when compact,
+        # a procedural PhaseField when lazy (nothing is allocated per plate),
+        # or PhaseChannels holding one phase per channel group
+        if lazy_phases:
+            self._phase_state = PhaseField((0.0, 0.0, 0.0), self.array.plate_spacing_m,
+                                           self.array.dimensions)
+        elif channel_group is not None:
+            self._phase_state = self._wrap_channels((0.0, 0.0, 0.0),
+                                                    np.zeros(self.channel_shape))
+        else:
+            self._phase_state = np.zeros(self.array.dimensions,
+                                         dtype=PHASE_CODE_DTYPE if compact_phases else float)
+        # Direction and geometry the phase state was synthesized for (None if unknown)
+        self._phase_key = PhaseCache.make_key((0.0, 0.0, 0.0), self.array)
+        
+        _report(self.verbose, "\n🔧 GRAVITY MODULATOR INITIALIZED")
+        _report(self.verbose, "   Array size: %scm³", array_size_cm)
+        _report(self.verbose, "   Total plates: %s", _Fmt(self.array.total_plates, ','))
+        _report(self.verbose, "   Metamaterial enhancement: %.2ex", self.gamma)
+        
+    @property
+    def phase_matrix(self) -> np.ndarray:
+        """
+        Current phase shifts in radians
+        
+        Decoded on access in compact mode; a PhaseField in lazy mode and
+        PhaseChannels in grouped mode (index it to expand to plates).
+        """
+        if self.compact_phases:
+            return decode_phases(self._phase_state, self.array.phase_resolution_deg)
+        return self._phase_state
+    
+    @phase_matrix.setter
+    def phase_matrix(self, phases: np.ndarray):
+        if self.compact_phases:
+            phases = encode_phases(phases, self.array.phase_resolution_deg)
+        elif self.channel_group is not None and not isinstance(phases, PhaseChannels):
+            phases = self._wrap_channels((0.0, 0.0, 0.0), self._to_channels(phases))
+        self._phase_state = phases
+        self._phase_key = None
+    
+    @property
+    def channel_shape(self) -> Tuple[int, int, int]:
+        """Phase channels along each axis (the plate grid when ungrouped)"""
+        if self.channel_group is None:
+            return tuple(self.array.dimensions)
+        return tuple(-(-n // g) for n, g in zip(self.array.dimensions, self.channel_group))
+    
+    def _wrap_channels(self, direction: Tuple[float, float, float],
+                       channels: np.ndarray) -> PhaseChannels:
+        """Channel phases as a plate-indexable phase state"""
+        return PhaseChannels(channels, self.channel_group, direction,
+                             self.array.plate_spacing_m, self.array.dimensions)
+    
+    def _to_channels(self, phases: np.ndarray) -> np.ndarray:
+        """Accept channel phases as-is; sample per-plate phases at group centers"""
+        phases = np.asarray(phases, dtype=float)
+        if phases.shape == self.channel_shape:
+            return phases
+        if phases.shape == tuple(self.array.dimensions):
+            return phases[np.ix_(*channel_centers(phases.shape, self.channel_group))]
+        raise ValueError(f"Phase shape {phases.shape} matches neither the channel grid "
+                         f"{self.channel_shape} nor the plate grid {tuple(self.array.dimensions)}")
+    
+    @property
+    def phase_codes(self) -> np.ndarray:
+        """
+        Current phase state as uint16 hardware codes at phase_resolution_deg
+        
+        In lazy and grouped modes this materializes the whole field;
+        index phase_matrix first to encode a single tile.
+        """
+        if self.compact_phases:
+            return self._phase_state
+        return encode_phases(self._phase_state[...], self.array.phase_resolution_deg)
+    
+    def phase_frame(self,
+                    previous: Optional[np.ndarray] = None,
+                    compression: str = 'zlib',
+                    sequence: int = 0) -> bytearray:
+        """
+        Serialize the current phase state as a wire frame (see encode_frame)
+        
+        Grouped modulators send their channel codes rather than expanding
+        to plates.
+        
+        Args:
+            previous: Codes of the previous frame, to send a delta frame
+            compression: One of FRAME_CODECS
+            sequence: Frame number
+        """
+        resolution_deg = self.array.phase_resolution_deg
+        if self.channel_group is not None:
+            codes = encode_phases(self._phase_state.channels, resolution_deg)
+        else:
+            codes = self.phase_codes
+        return encode_frame(codes, resolution_deg, previous, compression, sequence=sequence)
+    
+    def load_phase_frame(self, buffer, previous: Optional[np.ndarray] = None) -> FrameHeader:
+        """
+        Replace the phase state with a wire frame's contents
+        
+        The frame must match the plate grid (the channel grid when grouped);
+        the phase state is left untouched if it doesn't. Compact modulators
+        adopt uncompressed codes without copying. Lazy modulators have no
+        stored phases to replace and raise ValueError.
+        
+        Args:
+            buffer: Bytes-like object holding the frame
+            previous: Codes of the previous frame, for delta frames
+            
+        Returns:
+            The frame's header
+        """
+        if self.lazy_phases:
+            raise ValueError("Lazy modulators synthesize phases on demand; "
+                             "load frames into a dense, compact or grouped modulator")
+        header = read_frame_header(buffer)
+        if not np.isclose(header.resolution_deg, self.array.phase_resolution_deg):
+            raise ValueError(f"Frame resolution {header.resolution_deg}° != array "
+                             f"{self.array.phase_resolution_deg}°")
+        if header.dimensions != self.channel_shape:
+            grid = 'channel grid' if self.channel_group is not None else 'array'
+            raise ValueError(f"Frame shape {header.dimensions} != {grid} {self.channel_shape}")
+        header, codes = decode_frame(buffer, previous)
+        if self.compact_phases:
+            self._phase_state = codes
+            self._phase_key = None
+        else:
+            self.phase_matrix = decode_phases(codes, header.resolution_deg)
+        return header
+    
+    def casimir_pressure(self, d: Optional[Union[float, np.ndarray]] = None
+                         ) -> Union[float, np.ndarray]:
+        """
+        Calculate Casimir pressure between plates
+        
+        P = -π²ℏc / 240d⁴
+        
+        Args:
+            d: Plate spacing(s) (m), uses default if None
+            
+        Returns:
+            Pressure in Pascals (negative = attractive)
+        """
+        if d is None:
+            d = self.array.plate_spacing_m
+        return casimir_pressure(d)
+    
+    def effective_pressure(self,
+                           d: Optional[Union[float, np.ndarray]] = None,
+                           gamma: Optional[Union[float, np.ndarray]] = None
+                           ) -> Union[float, np.ndarray]:
+        """
+        Calculate effective pressure with metamaterial enhancement
+        
+        P_eff = P × γ
+        
+        Args:
+            d: Plate spacing(s) (m), uses default if None
+            gamma: Enhancement factor(s), uses the metamaterial's if None
+        """
+        if d is None:
+            d = self.array.plate_spacing_m
+        if gamma is None:
+            gamma = self.gamma
+        return effective_pressure(d, gamma)
+    
+    def total_force(self,
+                    d: Optional[Union[float, np.ndarray]] = None,
+                    gamma: Optional[Union[float, np.ndarray]] = None,
+                    plates: Optional[Union[int, np.ndarray]] = None
+                    ) -> Union[float, np.ndarray]:
+        """
+        Calculate total force from entire array
+        
+        F = P_eff × A_total
+        
+        Args:
+            d: Plate spacing(s) (m), uses default if None
+            gamma: Enhancement factor(s), uses the metamaterial's if None
+            plates: Plate count(s), uses the array's if None
+        """
+        if d is None:
+            d = self.array.plate_spacing_m
+        if gamma is None:
+            gamma = self.gamma
+        if plates is None:
+            plates = self.array.total_plates
+        return total_force(d, gamma, plates)
+    
+    def calculate_phase_pattern(self,
+                                direction: Tuple[float, float, float],
+                                workers: Optional[int] = None,
+                                moments: Optional[PhaseMoments] = None) -> np.ndarray:
+        """
+        Calculate phase shifts for each plate to direct thrust
+        
+        θ_ij = φ_ij + k·r_ij
+        
+        Args:
+            direction: Target thrust vector (x, y, z)
+            workers: Worker processes to shard across (defaults to phase_workers)
+            moments: If given, accumulates phase statistics during synthesis
+                (the pattern is then built in cache-sized slabs)
+            
+        Returns:
+            3D array of phase shifts in radians
+        """
+        workers = self.phase_workers if workers is None else workers
+        if workers > 1:
+            return parallel_phase_pattern(direction, self.array.plate_spacing_m,
+                                          self.array.dimensions, workers, moments)
+        
+        nx, ny, nz = self.array.dimensions
+        if moments is None:
+            return phase_block(direction, self.array.plate_spacing_m,
+                               np.arange(nx), np.arange(ny), np.arange(nz))
+        
+        phases = np.empty(self.array.dimensions)
+        _fill_phase_rows(phases, direction, self.array.plate_spacing_m, 0, nx, moments)
+        return phases
+    
+    def calculate_channel_phases(self,
+                                 direction: Tuple[float, float, float],
+                                 moments: Optional[PhaseMoments] = None) -> np.ndarray:
+        """
+        Calculate one phase shift per channel group to direct thrust
+        
+        Args:
+            direction: Target thrust vector (x, y, z)
+            moments: If given, receives the per-plate phase statistics
+                (channels weighted by the plates they drive)
+            
+        Returns:
+            3D array of channel phases in radians, shape channel_shape
+        """
+        if self.channel_group is None:
+            raise ValueError("calculate_channel_phases needs a channel_group")
+        channels = channel_phases(direction, self.array.plate_spacing_m,
+                                  self.array.dimensions, self.channel_group)
+        if moments is not None:
+            moments.merge(self._wrap_channels(direction, channels).moments())
+        return channels
+    
+    def calculate_phase_codes(self,
+                              direction: Tuple[float, float, float],
+                              moments: Optional[PhaseMoments] = None) -> np.ndarray:
+        """
+        Calculate quantized phase codes for each plate to direct thrust
+        
+        Phases are synthesized and encoded in slabs along the first axis, so
+        no full-size float64 intermediate is ever allocated.
+        
+        Args:
+            direction: Target thrust vector (x, y, z)
+            moments: If given, accumulates statistics of the codes (in code
+                units) as each slab is encoded
+            
+        Returns:
+            3D array of uint16 phase codes at phase_resolution_deg
+        """
+        nx, ny, nz = self.array.dimensions
+        resolution_deg = self.array.phase_resolution_deg
+        j_idx, k_idx = np.arange(ny), np.arange(nz)
+        
+        codes = np.empty(self.array.dimensions, dtype=PHASE_CODE_DTYPE)
+        slab_rows = max(1, PHASE_SLAB_PLATES // max(1, ny * nz))
+        for start in range(0, nx, slab_rows):
+            stop = min(start + slab_rows, nx)
+            block = phase_block(direction, self.array.plate_spacing_m,
+                                np.arange(start, stop), j_idx, k_idx)
+            codes[start:stop] = encode_phases(block, resolution_deg)
+            if moments is not None:
+                moments.update(codes[start:stop])
+        return codes
+    
+    def iter_phase_tiles(self,
+                         direction: Tuple[float, float, float],
+                         tile_shape: Union[Tuple[int, int, int], ScalingLevel] = (10, 10, 10),
+                         quantized: bool = False,
+                         moments: Optional[PhaseMoments] = None
+                         ) -> Iterator[Tuple[Tuple[int, int, int], np.ndarray]]:
+        """
+        Stream the phase pattern tile by tile for hardware upload
+        
+        Peak memory is one tile regardless of total plate count, so upload
+        can start before the whole pattern is computed.
+        
+        Args:
+            direction: Target thrust vector (x, y, z)
+            tile_shape: Plates per tile along each axis, or a ScalingLevel
+                (e.g. ScalingArchitecture().tile) to match the §8.2 hierarchy
+            quantized: Yield uint16 codes at phase_resolution_deg instead of radians
+            moments: If given, accumulates phase statistics (radians) as
+                tiles are generated; complete once the iterator is exhausted
+            
+        Yields:
+            (tile_index, phase_block) pairs; in grouped mode each tile is
+            expanded from the channel phases
+        """
+        if isinstance(tile_shape, (ScalingLevel, FrozenScalingLevel)):
+            tile_shape = (plates_per_side(tile_shape),) * 3
+        resolution_deg = self.array.phase_resolution_deg if quantized else None
+        field = None
+        if self.channel_group is not None:
+            field = self._wrap_channels(direction, self.calculate_channel_phases(direction))
+        return iter_phase_tiles(direction, self.array.plate_spacing_m, self.array.dimensions,
+                                tile_shape, resolution_deg, moments, field)
+    
+    def iter_slew(self,
+                  start: Tuple[float, float, float],
+                  end: Tuple[float, float, float],
+                  duration_s: float,
+                  rate_hz: float = 1e6,
+                  profile: str = 'min_jerk',
+                  quantized: bool = False,
+                  delta: bool = False) -> Iterator[Tuple[float, Union[np.ndarray, Dict]]]:
+        """
+        Stream the phase frames of a slew between two directions
+        
+        Frames are synthesized in batches of up to SLEW_BATCH_PLATES phases
+        with phase_frames(), so a 1 ms slew at 1 MHz costs a few batched
+        passes instead of a thousand separate pattern builds. In grouped
+        mode frames hold one phase per channel. Modulator state is left
+        untouched; steer with resteer() or feed slew_directions() to a
+        ControlLoop to apply the slew.
+        
+        Args:
+            start: Direction at the start of the slew
+            end: Direction at the end of the slew
+            duration_s: Slew duration
+            rate_hz: Frame rate (one frame per control tick)
+            profile: Progress profile, one of SLEW_PROFILES
+            quantized: Yield uint16 codes at phase_resolution_deg instead of radians
+            delta: Yield only the codes that changed since the previous
+                frame (the first frame is diffed against start) as a dict
+                shaped like resteer()'s result
+            
+        Yields:
+            (time_s, frame) pairs, frame being phases, codes or a delta dict
+        """
+        times, directions = slew_directions(start, end, duration_s, rate_hz, profile)
+        resolution_deg = self.array.phase_resolution_deg
+        s = self.array.plate_spacing_m
+        
+        if self.channel_group is None:
+            axes = [np.arange(n) for n in self.array.dimensions]
+            changed_key = 'changed_plates'
+        else:
+            axes = channel_centers(self.array.dimensions, self.channel_group)
+            changed_key = 'changed_channels'
+        frame_size = int(np.prod([len(a) for a in axes]))
+        batch = max(1, SLEW_BATCH_PLATES // max(1, frame_size))
+        
+        frame_resolution_deg = resolution_deg if quantized or delta else None
+        previous = None
+        if delta:
+            previous = phase_frames(np.asarray(start), s, *axes, resolution_deg).reshape(-1)
+        
+        for b0 in range(0, len(times), batch):
+            frames = phase_frames(directions[b0:b0 + batch], s, *axes, frame_resolution_deg)
+            for t, direction, frame in zip(times[b0:b0 + batch], directions[b0:b0 + batch], frames):
+                if not delta:
+                    yield float(t), frame
+                    continue
+                codes = frame.reshape(-1)
+                changed = np.flatnonzero(codes != previous)
+                yield float(t), {'direction': tuple(float(d) for d in direction),
+                                 changed_key: changed, 'changed_codes': codes[changed]}
+                previous = codes
+    
+    def activate_batch(self,
+                       directions: np.ndarray,
+                       powers_MW: np.ndarray,
+                       coherence: bool = True) -> Dict:
+        """
+        Evaluate many steering commands in one vectorized pass
+        
+        Computes what activate() would report for each (direction, power)
+        pair without printing or touching modulator state. With
+        measure_far_field, each distinct direction's pattern is synthesized
+        and its far field solved, as activate() does.
+        
+        Args:
+            directions: (N, 3) array of thrust directions
+            powers_MW: Input powers in megawatts, shape (N,) or scalar
+            coherence: Also compute phase coherence (one streamed pass over
+                the plate grid per direction group; lazy and grouped
+                modulators use their field's bounded coherence instead)
+            
+        Returns:
+            Dictionary of per-command arrays
+        """
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        powers_MW = np.broadcast_to(np.asarray(powers_MW, dtype=float), (len(directions),))
+        
+        base_force = self.total_force()
+        if self.measure_far_field and len(directions):
+            unique, inverse = np.unique(directions, axis=0, return_inverse=True)
+            efficiency = np.array([self._synthesized_efficiency(tuple(d))
+                                   for d in unique])[inverse.reshape(-1)]
+        else:
+            efficiency = np.full(len(directions), NOMINAL_EFFICIENCY)
+        
+        thrust_vectors = directions * (base_force * efficiency)[:, None]
+        thrust_N = np.linalg.norm(thrust_vectors, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thrust_per_MW = thrust_N / powers_MW
+        
+        if coherence and (self.lazy_phases or self.channel_group is not None):
+            # Same sampled or channel-weighted statistics activate() reports
+            unique, inverse = np.unique(directions, axis=0, return_inverse=True)
+            phase_coherence = np.array([self._phase_field(tuple(d)).coherence()
+                                        for d in unique])[inverse.reshape(-1)]
+        elif coherence:
+            _, phase_coherence = phase_statistics(directions, self.array.plate_spacing_m,
+                                                  self.array.dimensions)
+        else:
+            phase_coherence = np.full(len(directions), np.nan)
+        
+        result = {
+            'thrust_vector': thrust_vectors,
+            'thrust_N': thrust_N,
+            'thrust_per_MW': thrust_per_MW,
+            'direction': directions,
+            'power_MW': np.array(powers_MW),
+            'phase_coherence': phase_coherence
+        }
+        if self.measure_far_field:
+            result['main_lobe_efficiency'] = efficiency
+        return result
     
     def activate(self, direction: Tuple[float, float, float] = (0, 0, 1), power_MW: float = 0.5):
         """
@@ -191,48 +2304,303 @@ class GravityModulator:
         Args:
             direction: Target thrust direction (normalized)
             power_MW: Input power in megawatts
+            
+        Returns:
+            Activation results; includes per-stage timings under 'stages'
+            when a profiler is attached
         """
-        print(f"\n⚡ ACTIVATING GRAVITY MODULATOR")
-        print(f"   Direction: {direction}")
-        print(f"   Power: {power_MW} MW")
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_call()
         
-        # Calculate phase pattern for directed thrust
-        self.phase_matrix = self.calculate_phase_pattern(direction)
+        with self._stage('report'):
+            _report(self.verbose, "\n⚡ ACTIVATING GRAVITY MODULATOR")
+            _report(self.verbose, "   Direction: %s", direction)
+            _report(self.verbose, "   Power: %s MW", power_MW)
         
-        # Calculate thrust
-        base_force = self.total_force()
+        # Calculate phase pattern for directed thrust (reused across repeat commands)
+        with self._stage('phase_synthesis'):
+            key = PhaseCache.make_key(direction, self.array)
+            if self.lazy_phases:
+                self._phase_state = PhaseField(direction, self.array.plate_spacing_m,
+                                               self.array.dimensions)
+                moments, phase_scale = None, 1.0
+            elif self.compact_phases:
+                resolution_deg = self.array.phase_resolution_deg
+                self._phase_state, moments = self.phase_cache.lookup(
+                    key + (resolution_deg,),
+                    lambda: self._synthesize(self.calculate_phase_codes, direction)
+                )
+                phase_scale = 2 * PI / phase_levels(resolution_deg)
+            elif self.channel_group is not None:
+                channels, moments = self.phase_cache.lookup(
+                    key + (self.channel_group,),
+                    lambda: self._synthesize(self.calculate_channel_phases, direction)
+                )
+                self._phase_state = self._wrap_channels(direction, channels)
+                phase_scale = 1.0
+            else:
+                self._phase_state, moments = self.phase_cache.lookup(
+                    key,
+                    lambda: self._synthesize(self.calculate_phase_pattern, direction)
+                )
+                phase_scale = 1.0
+            if moments is None and not self.lazy_phases:
+                # Cached by get_or_compute(), which keeps no statistics
+                if isinstance(self._phase_state, PhaseChannels):
+                    moments = self._phase_state.moments()
+                else:
+                    moments = PhaseMoments()
+                    moments.update(self._phase_state)
+            self._phase_key = key
         
-        # Directional efficiency from phase array
-        efficiency = 0.99999  # 99.999% of force in target direction
-        off_axis_cancellation = 0.99999  # 99.999% cancellation in other axes
+        # Directional efficiency from the phase array's far field
+        if self.measure_far_field:
+            with self._stage('far_field'):
+                efficiency, far_field = self._directional_efficiency(direction)
+        else:
+            efficiency, far_field = NOMINAL_EFFICIENCY, None
         
-        self.thrust_vector = np.array(direction) * base_force * efficiency
-        self.power_input_MW = power_MW
-        self.active = True
+        # Calculate thrust
+        with self._stage('force'):
+            base_force = self.total_force()
+            
+            self.thrust_vector = np.array(direction) * base_force * efficiency
+            self.power_input_MW = power_MW
+            self.active = True
+            
+            # Results
+            thrust_magnitude = np.linalg.norm(self.thrust_vector)
+            thrust_per_MW = thrust_magnitude / power_MW
         
-        # Results
-        thrust_magnitude = np.linalg.norm(self.thrust_vector)
-        thrust_per_MW = thrust_magnitude / power_MW
+        with self._stage('report'):
+            _report(self.verbose, "\n✅ MODULATOR ACTIVE")
+            _report(self.verbose, "   Total thrust: %.2e N", thrust_magnitude)
+            _report(self.verbose, "   Thrust per MW: %.2e N/MW", thrust_per_MW)
+            _report(self.verbose, "   Off-axis: <%.2e N", base_force * (1-efficiency))
         
-        print(f"\n✅ MODULATOR ACTIVE")
-        print(f"   Total thrust: {thrust_magnitude:.2e} N")
-        print(f"   Thrust per MW: {thrust_per_MW:.2e} N/MW")
-        print(f"   Off-axis: <{base_force * (1-efficiency):.2e} N")
+        with self._stage('phase_coherence'):
+            # Statistics come from synthesis; a lazy field streams (or samples)
+            # its own instead of being materialized
+            if self.lazy_phases:
+                phase_coherence = self._phase_state.coherence()
+            else:
+                phase_coherence = moments.std * phase_scale
         
-        return {
+        result = {
             'thrust_N': thrust_magnitude,
             'thrust_per_MW': thrust_per_MW,
             'direction': direction,
             'power_MW': power_MW,
-            'phase_coherence': np.std(self.phase_matrix)
+            'phase_coherence': phase_coherence
         }
+        if far_field is not None:
+            result['main_lobe_efficiency'] = far_field['main_lobe_efficiency']
+            result['side_lobe_level_db'] = far_field['side_lobe_level_db']
+        if profiler is not None:
+            result['stages'] = profiler.end_call()
+        return result
+    
+    def far_field(self,
+                  direction: Optional[Tuple[float, float, float]] = None,
+                  quantized: bool = True,
+                  grid_shape: Optional[Tuple[int, int, int]] = None) -> Dict:
+        """
+        Far-field response of the current phase state
+        
+        Args:
+            direction: Commanded direction to measure the main lobe at
+                (defaults to the direction the state was synthesized for)
+            quantized: Evaluate the phases as the hardware would apply them,
+                at phase_resolution_deg (compact state always is)
+            grid_shape: Angular grid size per axis (defaults to the array shape)
+            
+        Returns:
+            array_factor() results for the current phase state
+        """
+        if direction is None:
+            if self._phase_key is None:
+                raise ValueError("phase state has no known direction; pass one explicitly")
+            direction = self._phase_key[0]
+        
+        memo_key = (self._phase_key, tuple(direction), quantized,
+                    None if grid_shape is None else tuple(grid_shape))
+        if self._phase_key is not None and self._far_field_memo is not None \
+                and self._far_field_memo[0] == memo_key:
+            return self._far_field_memo[1]
+        
+        if (self.lazy_phases or self.channel_group is not None) \
+                and self.array.total_plates > FAR_FIELD_MAX_PLATES:
+            raise ValueError(f"far field needs a dense pattern; {self.array.total_plates:,} plates "
+                             f"exceeds FAR_FIELD_MAX_PLATES ({FAR_FIELD_MAX_PLATES:,})")
+        
+        phases = self.phase_matrix[...]
+        if quantized and not self.compact_phases:
+            resolution_deg = self.array.phase_resolution_deg
+            phases = decode_phases(encode_phases(phases, resolution_deg), resolution_deg)
+        
+        result = array_factor(phases, direction, grid_shape)
+        self._far_field_memo = (memo_key, result)
+        return result
+    
+    def _directional_efficiency(self, direction: Tuple[float, float, float]
+                                ) -> Tuple[float, Optional[Dict]]:
+        """Measured main-lobe efficiency when enabled, else NOMINAL_EFFICIENCY"""
+        if not self.measure_far_field:
+            return NOMINAL_EFFICIENCY, None
+        far_field = self.far_field(direction)
+        return far_field['main_lobe_efficiency'], far_field
+    
+    def _phase_field(self, direction: Tuple[float, float, float]) -> PhaseField:
+        """Lazy or grouped phase state for direction, as activate() builds it"""
+        if self.channel_group is not None:
+            return self._wrap_channels(direction, self.calculate_channel_phases(direction))
+        return PhaseField(direction, self.array.plate_spacing_m, self.array.dimensions)
+    
+    def _synthesized_efficiency(self, direction: Tuple[float, float, float]) -> float:
+        """Main-lobe efficiency of the state activate() would build for direction (state untouched)"""
+        if (self.lazy_phases or self.channel_group is not None) \
+                and self.array.total_plates > FAR_FIELD_MAX_PLATES:
+            raise ValueError(f"far field needs a dense pattern; {self.array.total_plates:,} plates "
+                             f"exceeds FAR_FIELD_MAX_PLATES ({FAR_FIELD_MAX_PLATES:,})")
+        
+        resolution_deg = self.array.phase_resolution_deg
+        if self.compact_phases:
+            codes = self.calculate_phase_codes(direction)
+        elif self.channel_group is not None:
+            codes = encode_phases(self._phase_field(direction)[...], resolution_deg)
+        else:
+            codes = encode_phases(self.calculate_phase_pattern(direction), resolution_deg)
+        phases = decode_phases(codes, resolution_deg)
+        return array_factor(phases, direction)['main_lobe_efficiency']
+    
+    @staticmethod
+    def _synthesize(compute: Callable, direction: Tuple[float, float, float]
+                    ) -> Tuple[np.ndarray, PhaseMoments]:
+        """Run a phase builder, collecting its statistics in the same pass"""
+        moments = PhaseMoments()
+        return compute(direction, moments=moments), moments
+    
+    def _stage(self, name: str):
+        """Stage timer from the attached profiler, or a shared no-op"""
+        if self.profiler is None:
+            return _NULL_STAGE
+        return self.profiler.stage(name)
+    
+    def resteer(self, new_direction: Tuple[float, float, float],
+                track_changes: bool = True) -> Dict:
+        """
+        Re-steer the array by updating the phase state in place
+        
+        The phase ramp is linear in direction, so the new pattern is
+        θ' = (θ + k·(Δd·r)) mod 2π. The delta is added slab by slab in a
+        single pass; compact state is re-encoded directly from the new
+        direction so quantization error never accumulates.
+        
+        Args:
+            new_direction: New thrust direction
+            track_changes: Collect the plates whose quantized codes changed
+            
+        Returns:
+            Dictionary with the new direction and, when tracked, the flat
+            plate indices whose codes changed and their new codes (flat
+            channel indices under 'changed_channels' in grouped mode)
+        """
+        new_direction = tuple(float(d) for d in new_direction)
+        new_key = PhaseCache.make_key(new_direction, self.array)
+        resolution_deg = self.array.phase_resolution_deg
+        changed_plates, changed_codes = [], []
+        
+        if self.lazy_phases:
+            # Nothing is stored per plate, so there is no diff to report
+            self._phase_state = PhaseField(new_direction, self.array.plate_spacing_m,
+                                           self.array.dimensions)
+            track_changes = False
+        elif self.channel_group is not None:
+            # Channel phases are cheap to rebuild; the diff is per channel
+            old_codes = encode_phases(self._phase_state.channels, resolution_deg)
+            channels = self.calculate_channel_phases(new_direction)
+            self._phase_state = self._wrap_channels(new_direction, channels)
+            if track_changes:
+                new_codes = encode_phases(channels, resolution_deg)
+                changed = np.flatnonzero(old_codes != new_codes)
+                changed_plates.append(changed)
+                changed_codes.append(new_codes.reshape(-1)[changed])
+        elif self._phase_key is None or self._phase_key[1:] != new_key[1:]:
+            # State of unknown origin or stale geometry: fall back to a full rebuild
+            old_codes = self.phase_codes if track_changes else None
+            if self.compact_phases:
+                self._phase_state = self.calculate_phase_codes(new_direction)
+            else:
+                self._phase_state = self.calculate_phase_pattern(new_direction)
+            if track_changes:
+                new_codes = self.phase_codes
+                if old_codes.shape == new_codes.shape:
+                    changed = np.flatnonzero(old_codes != new_codes)
+                else:
+                    changed = np.arange(new_codes.size)
+                changed_plates.append(changed)
+                changed_codes.append(new_codes.reshape(-1)[changed])
+        else:
+            state = self._phase_state
+            if not state.flags.writeable:
+                state = state.copy()  # Cached patterns are shared and read-only
+            
+            nx, ny, nz = self.array.dimensions
+            s = self.array.plate_spacing_m
+            j_idx, k_idx = np.arange(ny), np.arange(nz)
+            
+            k = 2 * PI / (s * 1000)  # Wave vector
+            delta = np.subtract(new_direction, self._phase_key[0])
+            delta_x = k * delta[0] * (np.arange(nx) * s)
+            delta_yz = k * (delta[1] * (j_idx * s)[:, None] + delta[2] * (k_idx * s)[None, :])
+            
+            slab_rows = max(1, PHASE_SLAB_PLATES // max(1, ny * nz))
+            for start in range(0, nx, slab_rows):
+                stop = min(start + slab_rows, nx)
+                slab = state[start:stop]
+                
+                if self.compact_phases:
+                    new = encode_phases(phase_block(new_direction, s, np.arange(start, stop),
+                                                    j_idx, k_idx), resolution_deg)
+                    if track_changes:
+                        mask = new != slab
+                    slab[...] = new
+                else:
+                    if track_changes:
+                        old = encode_phases(slab, resolution_deg)
+                    slab += delta_yz
+                    slab += delta_x[start:stop, None, None]
+                    np.mod(slab, 2 * PI, out=slab)
+                    if track_changes:
+                        new = encode_phases(slab, resolution_deg)
+                        mask = new != old
+                
+                if track_changes:
+                    changed = np.flatnonzero(mask)
+                    changed_plates.append(changed + start * ny * nz)
+                    changed_codes.append(new.reshape(-1)[changed])
+            
+            self._phase_state = state
+        
+        self._phase_key = new_key
+        if self.active:
+            efficiency, _ = self._directional_efficiency(new_direction)
+            self.thrust_vector = np.array(new_direction) * self.total_force() * efficiency
+        
+        result = {'direction': new_direction}
+        if track_changes:
+            changed_key = 'changed_plates' if self.channel_group is None else 'changed_channels'
+            result[changed_key] = np.concatenate(changed_plates)
+            result['changed_codes'] = np.concatenate(changed_codes).astype(PHASE_CODE_DTYPE)
+        return result
     
     def deactivate(self):
         """Deactivate the modulator"""
         self.active = False
         self.thrust_vector = np.array([0.0, 0.0, 0.0])
         self.power_input_MW = 0.0
-        print("\n⏹️ MODULATOR DEACTIVATED")
+        _report(self.verbose, "\n⏹️ MODULATOR DEACTIVATED")
     
     def get_status(self) -> Dict:
         """Get current modulator status"""
@@ -243,7 +2611,9 @@ class GravityModulator:
             'power_MW': self.power_input_MW,
             'efficiency': self.thrust_per_MW() if self.active else 0,
             'gamma': self.gamma,
-            'plates': self.array.total_plates
+            'plates': self.array.total_plates,
+            'phase_channels': int(np.prod(self.channel_shape)),
+            'phase_cache': self.phase_cache.stats()
         }
     
     def thrust_per_MW(self) -> float:
@@ -253,6 +2623,160 @@ class GravityModulator:
         return 0.0
 
 
+# =============================================================================
+# FLEET SIMULATION
+# =============================================================================
+
+UnitSelector = Union[None, int, slice, np.ndarray, List[int]]
+
+
+class ModulatorFleet:
+    """
+    Many modulator units as contiguous arrays (struct-of-arrays)
+    
+    Each unit follows GravityModulator.activate() semantics for thrust
+    (direction × base force × directional efficiency) but holds no phase
+    grid, so whole-vehicle updates are a handful of array operations.
+    Vector quantities are stored one contiguous row per axis, shape (3, N);
+    the (N, 3) properties are views. Units are selected with anything that
+    indexes a 1-D array: an index, slice, index array or boolean mask
+    (None selects every unit).
+    """
+    
+    def __init__(self,
+                 count: int,
+                 positions_m: Optional[np.ndarray] = None,
+                 array_sizes_cm: Union[float, np.ndarray] = 10.0,
+                 base_force_N: Optional[Union[float, np.ndarray]] = None,
+                 efficiency: Union[float, np.ndarray] = NOMINAL_EFFICIENCY):
+        """
+        Args:
+            count: Number of units
+            positions_m: (count, 3) unit positions in the vehicle frame
+            array_sizes_cm: Unit size(s) in cm
+            base_force_N: Full-power force per unit (defaults to a default
+                GravityModulator's total_force())
+            efficiency: Directional efficiency per unit
+        """
+        if base_force_N is None:
+            array = CasimirArraySpecs()
+            base_force_N = total_force(array.plate_spacing_m, MetamaterialSpecs().total_enhancement,
+                                       array.total_plates)
+        
+        self.count = count
+        self._positions = np.zeros((3, count))
+        if positions_m is not None:
+            self._positions[...] = np.asarray(positions_m, dtype=float).reshape(count, 3).T
+        self.array_sizes_cm = np.array(np.broadcast_to(array_sizes_cm, (count,)), dtype=float)
+        self.base_force_N = np.array(np.broadcast_to(base_force_N, (count,)), dtype=float)
+        self.efficiency = np.array(np.broadcast_to(efficiency, (count,)), dtype=float)
+        
+        self._directions = np.zeros((3, count))
+        self._thrust = np.zeros((3, count))
+        self.powers_MW = np.zeros(count)
+        self.active = np.zeros(count, dtype=bool)
+        
+        # Force per unit direction, reused by every activation
+        self._force_scale = self.base_force_N * self.efficiency
+    
+    @property
+    def positions_m(self) -> np.ndarray:
+        """(N, 3) unit positions (view)"""
+        return self._positions.T
+    
+    @property
+    def directions(self) -> np.ndarray:
+        """(N, 3) commanded directions (view)"""
+        return self._directions.T
+    
+    @property
+    def thrust_vectors(self) -> np.ndarray:
+        """(N, 3) per-unit thrust vectors in N (view)"""
+        return self._thrust.T
+    
+    @classmethod
+    def from_modulators(cls, modulators: List[GravityModulator],
+                        positions_m: Optional[np.ndarray] = None) -> "ModulatorFleet":
+        """Build a fleet mirroring existing modulators, including their current state"""
+        fleet = cls(len(modulators), positions_m,
+                    array_sizes_cm=[m.array_size_m * 100 for m in modulators],
+                    base_force_N=[m.total_force() for m in modulators])
+        for i, modulator in enumerate(modulators):
+            if modulator.active:
+                fleet.active[i] = True
+                fleet.powers_MW[i] = modulator.power_input_MW
+                fleet._thrust[:, i] = modulator.thrust_vector
+                fleet._directions[:, i] = modulator.thrust_vector / fleet._force_scale[i]
+        return fleet
+    
+    def activate(self, directions: np.ndarray, powers_MW: Union[float, np.ndarray],
+                 units: UnitSelector = None):
+        """
+        Activate units with the given thrust directions and powers
+        
+        Args:
+            directions: (3,) shared direction or (n, 3), one row per selected unit
+            powers_MW: Power per selected unit (scalar broadcasts)
+            units: Units to activate (None = all)
+        """
+        sel = slice(None) if units is None else units
+        directions = np.asarray(directions, dtype=float)
+        if directions.ndim == 2:
+            directions = directions.T  # One column per unit, like the storage
+        if not isinstance(sel, slice) and np.ndim(sel) == 0:
+            directions = directions.reshape(3)  # A single unit selects a (3,) column
+        elif directions.ndim == 1:
+            directions = directions[:, None]
+        
+        self._directions[:, sel] = directions
+        self.powers_MW[sel] = powers_MW
+        self.active[sel] = True
+        self._thrust[:, sel] = self._directions[:, sel] * self._force_scale[sel]
+    
+    def deactivate(self, units: UnitSelector = None):
+        """Deactivate units (None = all)"""
+        sel = slice(None) if units is None else units
+        self.active[sel] = False
+        self.powers_MW[sel] = 0.0
+        self._thrust[:, sel] = 0.0
+    
+    def net_thrust(self) -> np.ndarray:
+        """Total thrust vector of the vehicle (N)"""
+        return self._thrust.sum(axis=1)
+    
+    def net_torque(self, center_of_mass: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Total torque about the center of mass, Σ (rᵢ − r_cm) × Fᵢ (N·m)
+        
+        Args:
+            center_of_mass: Reference point (defaults to the origin)
+        """
+        # Σ rᵢ×Fᵢ − r_cm×ΣFᵢ avoids materializing the offsets
+        (rx, ry, rz), (fx, fy, fz) = self._positions, self._thrust
+        torque = np.array([ry @ fz - rz @ fy, rz @ fx - rx @ fz, rx @ fy - ry @ fx])
+        if center_of_mass is not None:
+            (cx, cy, cz), (nx, ny, nz) = center_of_mass, self.net_thrust()
+            torque -= (cy * nz - cz * ny, cz * nx - cx * nz, cx * ny - cy * nx)
+        return torque
+    
+    def status(self) -> Dict:
+        """Vehicle-level status plus per-unit arrays"""
+        thrust_N = np.sqrt(np.einsum('ij,ij->j', self._thrust, self._thrust))
+        total_power = float(self.powers_MW.sum())
+        net = self.net_thrust()
+        net_N = float(np.sqrt(net @ net))
+        return {
+            'units': self.count,
+            'active_units': int(np.count_nonzero(self.active)),
+            'net_thrust_vector': net,
+            'net_thrust_N': net_N,
+            'total_power_MW': total_power,
+            'thrust_per_MW': net_N / total_power if total_power > 0 else 0.0,
+            'unit_thrust_N': thrust_N,
+            'active': self.active
+        }
+
+
 # =============================================================================
 # SCALING ARCHITECTURE
 # =============================================================================
@@ -319,6 +2843,22 @@ class ScalingArchitecture:
         
         print("\n✅ Linear scaling verified: <1% error from 1mm³ to 10cm³")
     
+    def array_specs(self, level: ScalingLevel, **overrides) -> CasimirArraySpecs:
+        """
+        Build plate array specs for a scaling level
+        
+        Use with lazy_phases=True for Array and Megascale levels.
+        
+        Args:
+            level: Scaling level to size the array for
+            **overrides: Other CasimirArraySpecs fields
+            
+        Returns:
+            Plate array specifications
+        """
+        side = plates_per_side(level)
+        return CasimirArraySpecs(dimensions=(side, side, side), **overrides)
+    
     def thrust_at_scale(self, scale_cm: float) -> float:
         """
         Calculate thrust for a given scale
@@ -334,6 +2874,688 @@ class ScalingArchitecture:
         return self.tile.thrust_N * volume_ratio
 
 
+# =============================================================================
+# HIERARCHICAL CONTROL
+# =============================================================================
+
+NodeId = Tuple[int, int]  # (depth, flat index among that depth's nodes); root is (0, 0)
+
+
+@dataclass(frozen=True)
+class ControlCommand:
+    """Steering command held by a controller node for its whole subtree"""
+    direction: Tuple[float, float, float] = (0.0, 0.0, 1.0)
+    throttle: float = 1.0  # 0 disables the subtree
+
+
+class ControlTree:
+    """
+    Controller tree over the ScalingArchitecture levels (docs/scaling.md §8.2)
+    
+    Nodes are implicit: a node is its (depth, index) and holds state only
+    when commanded directly. Every other node inherits its nearest
+    commanded ancestor's command, so a subtree without overrides is
+    homogeneous and its thrust is closed-form. Thrust is reduced up the
+    tree by expanding only subtrees with overrides below them, and
+    per-node sums are memoized until a command in their subtree (or above
+    them) changes, so a megascale assembly costs work proportional to the
+    nodes that actually changed.
+    
+    Children sit on a 10×10×10 grid inside their parent (fan-out follows
+    the unit_cells ratio between levels, 1000× in the standard table).
+    Each level's reduction is scaled so a uniformly commanded node
+    reproduces that level's ScalingLevel.thrust_N.
+    """
+    
+    def __init__(self,
+                 root: Optional[ScalingLevel] = None,
+                 scaling: Optional[ScalingArchitecture] = None,
+                 command: ControlCommand = ControlCommand(),
+                 plate_spacing_m: Optional[float] = None):
+        """
+        Args:
+            root: Level of the root controller (defaults to megascale)
+            scaling: Level table (defaults to ScalingArchitecture())
+            command: Initial command for the whole assembly
+            plate_spacing_m: Plate spacing for phase fan-out (defaults to
+                CasimirArraySpecs())
+        """
+        scaling = scaling or ScalingArchitecture()
+        root = root or scaling.megascale
+        
+        # Levels from the root controller down to unit cells
+        ordered = sorted(scaling.levels, key=lambda level: level.unit_cells)
+        self.levels = [level for level in reversed(ordered) if level.unit_cells <= root.unit_cells]
+        self.depth = len(self.levels) - 1
+        self.fanout = [self.levels[d].unit_cells // self.levels[d + 1].unit_cells
+                       for d in range(self.depth)]
+        self.grid_side = [int(round(f ** (1 / 3))) for f in self.fanout]
+        self.plates_side = [plates_per_side(level) for level in self.levels]
+        self.plate_spacing_m = plate_spacing_m or CasimirArraySpecs().plate_spacing_m
+        
+        # Reduction gain making full(parent) = level.thrust_N given full(children)
+        self.gain = [1.0] * len(self.levels)
+        for d in range(self.depth):
+            self.gain[d] = self.levels[d].thrust_N / (self.fanout[d] * self.levels[d + 1].thrust_N)
+        
+        self._commands: Dict[NodeId, Tuple[int, ControlCommand]] = {(0, 0): (0, command)}
+        self._override_children: Dict[NodeId, set] = {}  # Node → child offsets with overrides below
+        self._memo: Dict[NodeId, Tuple[int, np.ndarray]] = {}
+        self._version = 0
+        self.evaluations = 0  # Subtree evaluations performed (for profiling laziness)
+    
+    def node_count(self, depth: int) -> int:
+        """Number of controller nodes at a depth"""
+        return int(np.prod(self.fanout[:depth], dtype=np.int64)) if depth else 1
+    
+    def parent(self, node: NodeId) -> Optional[NodeId]:
+        depth, index = node
+        return (depth - 1, index // self.fanout[depth - 1]) if depth else None
+    
+    def children(self, node: NodeId) -> range:
+        """Flat indices (at depth + 1) of a node's children"""
+        depth, index = node
+        fanout = self.fanout[depth]
+        return range(index * fanout, (index + 1) * fanout)
+    
+    def _check(self, node: NodeId):
+        depth, index = node
+        if not (0 <= depth <= self.depth and 0 <= index < self.node_count(depth)):
+            raise IndexError(f"No controller node {node}")
+    
+    def set_command(self, node: NodeId, command: ControlCommand):
+        """Command a node; its whole subtree follows unless overridden deeper"""
+        self._check(node)
+        self._version += 1
+        self._commands[node] = (self._version, command)
+        self._mark_path(node, add=True)
+    
+    def clear_command(self, node: NodeId):
+        """Drop a node's own command so it inherits from its parent again"""
+        if node == (0, 0):
+            raise ValueError("the root command can be replaced but not cleared")
+        if self._commands.pop(node, None) is not None:
+            self._version += 1
+            if not self._override_children.get(node):
+                self._mark_path(node, add=False)
+            else:
+                self._invalidate_ancestors(node)
+    
+    def _mark_path(self, node: NodeId, add: bool):
+        """Record (or retract) an override below each ancestor and drop their memos"""
+        self._memo.pop(node, None)
+        child = node
+        parent = self.parent(node)
+        while parent is not None:
+            self._memo.pop(parent, None)
+            offset = child[1] % self.fanout[parent[0]]  # Child's position within its parent
+            marked = self._override_children.setdefault(parent, set())
+            if add:
+                marked.add(offset)
+            else:
+                marked.discard(offset)
+                if not marked:
+                    del self._override_children[parent]
+                if marked or parent in self._commands:
+                    add = True  # Ancestors above still have overrides below
+            child, parent = parent, self.parent(parent)
+    
+    def _invalidate_ancestors(self, node: NodeId):
+        while node is not None:
+            self._memo.pop(node, None)
+            node = self.parent(node)
+    
+    def effective_command(self, node: NodeId) -> ControlCommand:
+        """Command in force at a node (its own or its nearest commanded ancestor's)"""
+        self._check(node)
+        return self._effective(node)[1]
+    
+    def _effective(self, node: NodeId) -> Tuple[int, ControlCommand]:
+        while node not in self._commands:
+            node = self.parent(node)
+        return self._commands[node]
+    
+    def _uniform_thrust(self, depth: int, command: ControlCommand) -> np.ndarray:
+        """Thrust of a node at depth whose whole subtree follows command"""
+        return np.asarray(command.direction, dtype=float) * (self.levels[depth].thrust_N
+                                                            * command.throttle)
+    
+    def thrust(self, node: NodeId = (0, 0)) -> np.ndarray:
+        """Thrust vector (N) of a node's subtree"""
+        self._check(node)
+        return self._subtree_thrust(node, self._effective(node)).copy()
+    
+    def _subtree_thrust(self, node: NodeId, inherited: Tuple[int, ControlCommand]) -> np.ndarray:
+        version, command = self._commands.get(node, inherited)
+        overridden = self._override_children.get(node)
+        if not overridden:
+            return self._uniform_thrust(node[0], command)
+        
+        memo = self._memo.get(node)
+        if memo is not None and memo[0] == version:
+            return memo[1]
+        
+        # Uniform children in closed form, overridden ones by recursion
+        self.evaluations += 1
+        depth, index = node
+        first = index * self.fanout[depth]
+        total = (self.fanout[depth] - len(overridden)) * self._uniform_thrust(depth + 1, command)
+        for child in overridden:
+            total = total + self._subtree_thrust((depth + 1, first + child), (version, command))
+        total = total * self.gain[depth]
+        self._memo[node] = (version, total)
+        return total
+    
+    def fan_out(self, node: NodeId) -> Iterator[Tuple[NodeId, ControlCommand]]:
+        """Effective command forwarded to each child of a node"""
+        self._check(node)
+        inherited = self._effective(node)
+        for child in self.children(node):
+            child_node = (node[0] + 1, child)
+            yield child_node, self._commands.get(child_node, inherited)[1]
+    
+    def plate_origin(self, node: NodeId) -> Tuple[int, int, int]:
+        """Global plate coordinates of a node's first plate"""
+        depth, index = node
+        origin = np.zeros(3, dtype=np.int64)
+        for d in range(depth - 1, -1, -1):
+            index, child = divmod(index, self.fanout[d])
+            side = self.grid_side[d]
+            origin += np.array(np.unravel_index(child, (side, side, side))) * self.plates_side[d + 1]
+        return tuple(int(o) for o in origin)
+    
+    def phase_block(self, node: NodeId, max_plates: int = PHASE_SLAB_PLATES) -> np.ndarray:
+        """
+        Phases (radians) of every plate under a node, at global plate coordinates
+        
+        Uniform subtrees come straight from phase_block(); overridden
+        children are filled in from their own commands.
+        """
+        self._check(node)
+        side = self.plates_side[node[0]]
+        if side ** 3 > max_plates:
+            raise ValueError(f"node {node} has {side ** 3:,} plates (max_plates={max_plates:,})")
+        
+        phases = np.empty((side, side, side))
+        self._fill_phases(node, self._effective(node), self.plate_origin(node), phases)
+        return phases
+    
+    def _fill_phases(self, node: NodeId, inherited: Tuple[int, ControlCommand],
+                     origin: Tuple[int, int, int], out: np.ndarray):
+        entry = self._commands.get(node, inherited)
+        side = out.shape[0]
+        out[...] = phase_block(entry[1].direction, self.plate_spacing_m,
+                               *(np.arange(o, o + side) for o in origin))
+        overridden = self._override_children.get(node, ())
+        for child in overridden:
+            depth = node[0]
+            child_node = (depth + 1, node[1] * self.fanout[depth] + child)
+            grid = self.grid_side[depth]
+            step = self.plates_side[depth + 1]
+            offset = np.array(np.unravel_index(child, (grid, grid, grid))) * step
+            view = out[offset[0]:offset[0] + step, offset[1]:offset[1] + step,
+                       offset[2]:offset[2] + step]
+            self._fill_phases(child_node, entry,
+                              tuple(int(o + d) for o, d in zip(origin, offset)), view)
+
+
+# =============================================================================
+# CONTROL LOOP
+# =============================================================================
+
+# Allowable latency for a command to cross into each level from the level
+# below it, in seconds (docs/scaling.md §8.3; "Unit Cell" is plate to unit)
+LATENCY_BUDGETS_S = {
+    "Unit Cell": 10e-9,
+    "Tile": 100e-9,
+    "Panel": 1e-6,
+    "Array": 10e-6,
+    "Megascale": 100e-6,
+}
+LOOP_HISTOGRAM_BINS = 256      # Log-spaced bins per control-loop histogram
+LOOP_HISTOGRAM_DECADES = 4     # Histogram span either side of its nominal value
+
+
+def latency_budget(level: ScalingLevel) -> float:
+    """
+    End-to-end latency budget from a level's controller down to its plates
+    
+    The sum of the §8.3 allowances for every hop at or below the level,
+    e.g. 1.11 µs for a Panel (Tile to Panel + Unit to Tile + Plate to Unit).
+    """
+    total = 0.0
+    for name, budget in LATENCY_BUDGETS_S.items():
+        total += budget
+        if name == level.name:
+            return total
+    raise KeyError(f"No latency budget for level {level.name!r}")
+
+
+class MonotonicClock:
+    """Wall-clock time source for ControlLoop (time.perf_counter)"""
+    
+    def now(self) -> float:
+        return time.perf_counter()
+    
+    async def sleep_until(self, deadline: float):
+        """Suspend until deadline, yielding to other tasks even when already late"""
+        import asyncio  # Deferred: only control loops need it, and it is slow to import
+        await asyncio.sleep(max(0.0, deadline - self.now()))
+    
+    def charge(self, stage: str):
+        """Real stages take the time they take; nothing to add"""
+
+
+class SimulatedClock:
+    """
+    Deterministic virtual time source for ControlLoop
+    
+    Time only moves when the loop sleeps or a stage is charged its modeled
+    cost, so runs are exactly reproducible regardless of host speed. Costs
+    and wake latency may be constants or zero-argument callables (e.g. a
+    seeded random draw) evaluated on each use.
+    """
+    
+    def __init__(self,
+                 start: float = 0.0,
+                 stage_costs: Optional[Dict[str, Union[float, Callable[[], float]]]] = None,
+                 wake_latency: Union[float, Callable[[], float]] = 0.0):
+        self.time = float(start)
+        self.stage_costs = dict(stage_costs or {})
+        self.wake_latency = wake_latency
+    
+    def now(self) -> float:
+        return self.time
+    
+    def advance(self, seconds: float):
+        """Move virtual time forward"""
+        if seconds < 0:
+            raise ValueError(f"Cannot advance the clock by {seconds} s")
+        self.time += seconds
+    
+    async def sleep_until(self, deadline: float):
+        """Jump to deadline (if still ahead) plus the modeled wake latency"""
+        self.time = max(self.time, deadline)
+        self.advance(self._resolve(self.wake_latency))
+        import asyncio  # Deferred: only control loops need it, and it is slow to import
+        await asyncio.sleep(0)
+    
+    def charge(self, stage: str):
+        """Advance by the modeled cost of a finished stage"""
+        self.advance(self._resolve(self.stage_costs.get(stage, 0.0)))
+    
+    @staticmethod
+    def _resolve(value: Union[float, Callable[[], float]]) -> float:
+        return float(value() if callable(value) else value)
+
+
+CommandSource = Union[Callable[[int, float], Optional[Tuple[float, float, float]]],
+                      Iterable[Optional[Tuple[float, float, float]]]]
+
+
+class ControlLoop:
+    """
+    Fixed-rate steering loop for a GravityModulator
+    
+    Each tick fetches the next command ('command' stage) and, when the
+    direction changed, re-steers the modulator ('steer' stage). Stage
+    latencies are checked against their budgets, by default the §8.3
+    end-to-end budget for the modulator's scaling level on 'steer'.
+    Ticks are scheduled on absolute deadlines (start + n / rate_hz) so
+    timing error does not accumulate; a tick that runs past the next
+    deadline is an overrun, and deadlines that passed during it are
+    skipped rather than run back to back. Wake-up jitter (lateness
+    against the deadline) and stage latencies are kept in streamed
+    log-spaced histograms, so memory does not grow with run length.
+    """
+    
+    STAGES = ('command', 'steer')
+    
+    def __init__(self,
+                 modulator: GravityModulator,
+                 commands: CommandSource,
+                 rate_hz: float = 1000.0,
+                 level: Optional[ScalingLevel] = None,
+                 budgets: Optional[Dict[str, float]] = None,
+                 clock: Optional[Union[MonotonicClock, SimulatedClock]] = None,
+                 track_changes: bool = False):
+        """
+        Args:
+            modulator: Modulator to steer
+            commands: Callable (tick, time_s) -> direction, or an iterable of
+                directions (the loop ends when it is exhausted); None holds
+                the current direction
+            rate_hz: Tick rate
+            level: Scaling level the modulator's controller sits at (defaults
+                to the smallest level with at least its plate count)
+            budgets: Per-stage latency budgets in seconds, replacing the
+                defaults; stages without a budget are timed but never overrun
+            clock: Time source (defaults to MonotonicClock)
+            track_changes: Keep the changed plate codes of each re-steer in
+                last_update, for upload
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"Tick rate must be positive, got {rate_hz}")
+        
+        self.modulator = modulator
+        self.period_s = 1.0 / rate_hz
+        self.clock = clock or MonotonicClock()
+        self.track_changes = track_changes
+        if level is None:
+            scaling = ScalingArchitecture()
+            plates = modulator.array.total_plates
+            level = next((l for l in scaling.levels if scaling.array_specs(l).total_plates >= plates),
+                         scaling.levels[-1])
+        self.level = level
+        self.budgets = {'steer': latency_budget(level)} if budgets is None else dict(budgets)
+        
+        if callable(commands):
+            self._source, self._commands = commands, None
+        else:
+            self._source, self._commands = None, iter(commands)
+        
+        self.ticks = 0
+        self.overrun_ticks = 0
+        self.skipped_ticks = 0
+        self.stage_overruns = {name: 0 for name in self.STAGES}
+        self.last_update: Optional[Dict] = None
+        self._direction: Optional[Tuple[float, float, float]] = None
+        self._stopped = False
+        self._elapsed_s = 0.0
+        self._jitter = self._histogram(self.period_s)
+        self._latency = {name: self._histogram(self.budgets.get(name, self.period_s))
+                         for name in self.STAGES}
+    
+    @staticmethod
+    def _histogram(nominal: float) -> _LogHistogram:
+        return _LogHistogram(nominal, LOOP_HISTOGRAM_BINS, LOOP_HISTOGRAM_DECADES)
+    
+    def stop(self):
+        """Ask a running loop to finish after its current tick"""
+        self._stopped = True
+    
+    async def run(self, ticks: Optional[int] = None, duration_s: Optional[float] = None) -> Dict:
+        """
+        Run the loop until ticks have executed, duration_s has elapsed, the
+        command iterable is exhausted or stop() is called
+        
+        Args:
+            ticks: Ticks to execute (None for no limit)
+            duration_s: Schedule length in clock seconds (None for no limit)
+            
+        Returns:
+            report() for everything recorded so far
+        """
+        clock = self.clock
+        self._stopped = False
+        start = clock.now()
+        slot, executed = 0, 0
+        
+        while not self._stopped and (ticks is None or executed < ticks):
+            deadline = start + slot * self.period_s
+            if duration_s is not None and deadline - start >= duration_s:
+                break
+            await clock.sleep_until(deadline)
+            woke = clock.now()
+            self._jitter.update(np.array([woke - deadline]))
+            
+            try:
+                command = self._timed('command', self._next_command, woke)
+            except StopIteration:
+                break
+            if command is not None:
+                direction = tuple(float(d) for d in command)
+                if direction != self._direction:
+                    self.last_update = self._timed('steer', self.modulator.resteer,
+                                                   direction, self.track_changes)
+                    self._direction = direction
+            
+            # Resume at the first deadline not yet passed
+            executed += 1
+            self.ticks += 1
+            end = clock.now()
+            next_slot = max(slot + 1, int(np.ceil((end - start) / self.period_s)))
+            if next_slot > slot + 1 or end > deadline + self.period_s:
+                self.overrun_ticks += 1
+            self.skipped_ticks += next_slot - slot - 1
+            slot = next_slot
+        
+        self._elapsed_s += clock.now() - start
+        return self.report()
+    
+    def _next_command(self, now: float) -> Optional[Tuple[float, float, float]]:
+        if self._source is not None:
+            return self._source(self.ticks, now)
+        return next(self._commands)
+    
+    def _timed(self, stage: str, fn: Callable, *args):
+        """Run a stage, charging the clock and checking it against its budget"""
+        start = self.clock.now()
+        result = fn(*args)
+        self.clock.charge(stage)
+        elapsed = self.clock.now() - start
+        
+        self._latency[stage].update(np.array([elapsed]))
+        budget = self.budgets.get(stage)
+        if budget is not None and elapsed > budget:
+            self.stage_overruns[stage] += 1
+        return result
+    
+    def report(self, percentiles: Tuple[float, ...] = (50, 99, 99.9)) -> Dict:
+        """
+        Timing summary of every tick run so far
+        
+        Args:
+            percentiles: Percentiles to report for jitter and stage latency
+            
+        Returns:
+            Tick counts, and for jitter and each stage the latency
+            distribution (seconds) with its histogram; histogram counts
+            carry underflow and overflow bins at either end
+        """
+        stages = {}
+        for name in self.STAGES:
+            stages[name] = self._summarize(self._latency[name], percentiles)
+            stages[name]['budget_s'] = self.budgets.get(name)
+            stages[name]['overruns'] = self.stage_overruns[name]
+        
+        return {
+            'level': self.level.name,
+            'rate_hz': 1.0 / self.period_s,
+            'ticks': self.ticks,
+            'overrun_ticks': self.overrun_ticks,
+            'skipped_ticks': self.skipped_ticks,
+            'elapsed_s': self._elapsed_s,
+            'jitter': self._summarize(self._jitter, percentiles),
+            'stages': stages
+        }
+    
+    @staticmethod
+    def _summarize(histogram: _LogHistogram, percentiles: Tuple[float, ...]) -> Dict:
+        summary = {'count': histogram.moments.count}
+        if histogram.moments.count:
+            summary.update(histogram.summary(percentiles))
+        summary['histogram'] = {'edges': (10 ** histogram.edges).tolist(),
+                                'counts': histogram.counts.tolist()}
+        return summary
+
+
+# =============================================================================
+# TRAJECTORY SIMULATION
+# =============================================================================
+
+@dataclass
+class LiftProfiles:
+    """
+    Struct-of-arrays batch of vertical lift configurations
+    
+    Fields broadcast against each other on construction, so scalars may be
+    mixed with per-profile arrays.
+    """
+    mass_kg: np.ndarray
+    thrust_N: np.ndarray
+    power_MW: np.ndarray
+    target_m: np.ndarray
+    
+    def __post_init__(self):
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                       for v in (self.mass_kg, self.thrust_N,
+                                                 self.power_MW, self.target_m)))
+        self.mass_kg, self.thrust_N, self.power_MW, self.target_m = (
+            np.ascontiguousarray(a).reshape(-1) for a in arrays
+        )
+    
+    def __len__(self) -> int:
+        return len(self.mass_kg)
+
+
+def gravity_at(altitude_m: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Gravitational acceleration at altitude, g₀·(R/(R+h))²"""
+    return G0 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + np.asarray(altitude_m)))**2
+
+
+def _rk4_step(h: np.ndarray, v: np.ndarray, accel_thrust: np.ndarray,
+              dt: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """One classical RK4 step of ḣ = v, v̇ = T/m − g(h) for every profile"""
+    a1 = accel_thrust - gravity_at(h)
+    h2, v2 = h + 0.5 * dt * v, v + 0.5 * dt * a1
+    a2 = accel_thrust - gravity_at(h2)
+    h3, v3 = h + 0.5 * dt * v2, v + 0.5 * dt * a2
+    a3 = accel_thrust - gravity_at(h3)
+    h4, v4 = h + dt * v3, v + dt * a3
+    a4 = accel_thrust - gravity_at(h4)
+    return (h + dt / 6 * (v + 2 * v2 + 2 * v3 + v4),
+            v + dt / 6 * (a1 + 2 * a2 + 2 * a3 + a4))
+
+
+def simulate_lift(profiles: LiftProfiles,
+                  method: str = 'adaptive',
+                  dt: float = 0.01,
+                  max_time_s: float = 3600.0,
+                  rtol: float = 1e-8,
+                  atol: float = 1e-6,
+                  max_steps: int = 100_000) -> Dict:
+    """
+    Integrate many vertical lift trajectories at once
+    
+    Each profile starts at rest on the ground and thrusts straight up at
+    constant power until it reaches its target altitude, against gravity
+    that weakens with altitude. All profiles advance together as arrays;
+    finished profiles drop out of the active set. A step that would overshoot
+    the target is retaken to end just past it (event location), then the
+    arrival is interpolated within that short final step.
+    
+    Args:
+        profiles: Batch of lift configurations
+        method: 'rk4' (fixed step dt) or 'adaptive' (per-profile step
+            doubling RK4, dt is only the upper bound on the first step)
+        dt: Time step in seconds
+        max_time_s: Give up on profiles that have not arrived by then
+        rtol: Relative tolerance for the adaptive method
+        atol: Absolute tolerance (m, m/s) for the adaptive method
+        max_steps: Hard cap on integration steps
+        
+    Returns:
+        Dictionary of per-profile arrays: arrival time, arrival velocity,
+        electrical energy drawn, mechanical energy delivered and success
+    """
+    if method not in ('rk4', 'adaptive'):
+        raise ValueError(f"Unknown integration method: {method}")
+    
+    n = len(profiles)
+    accel_thrust = profiles.thrust_N / profiles.mass_kg
+    target = profiles.target_m
+    
+    time_s = np.full(n, np.nan)
+    velocity = np.full(n, np.nan)
+    
+    # Profiles that cannot leave the ground never start
+    active = np.flatnonzero((accel_thrust > gravity_at(0.0)) & (target > 0))
+    zero = target <= 0
+    time_s[zero], velocity[zero] = 0.0, 0.0
+    
+    h = np.zeros(len(active))
+    v = np.zeros(len(active))
+    t = np.zeros(len(active))
+    a = accel_thrust[active]
+    tgt = target[active]
+    if method == 'rk4':
+        step = np.full(len(active), dt)
+    else:
+        # Start at a fraction of the constant-gravity arrival time
+        step = np.minimum(dt, np.sqrt(2 * tgt / (a - G0)) / 100)
+    steps = 0
+    
+    while len(active) and steps < max_steps:
+        steps += 1
+        step = np.minimum(step, max_time_s - t)
+        h_new, v_new = _rk4_step(h, v, a, step)
+        
+        if method == 'adaptive':
+            h_half, v_half = _rk4_step(h, v, a, step / 2)
+            h_half, v_half = _rk4_step(h_half, v_half, a, step / 2)
+            scale_h = atol + rtol * np.maximum(np.abs(h_half), tgt)
+            scale_v = atol + rtol * np.abs(v_half)
+            err = np.maximum(np.abs(h_half - h_new) / scale_h, np.abs(v_half - v_new) / scale_v) / 15
+            accept = err <= 1.0
+            h_new, v_new = h_half, v_half  # Keep the more accurate estimate
+            growth = np.clip(0.9 * np.where(err > 0, err, 1e-10)**-0.2, 0.2, 5.0)
+        else:
+            accept = np.ones(len(active), dtype=bool)
+        
+        # Crossings: solve h + vτ + ½āτ² = target with the step's mean acceleration
+        crossed = accept & (h_new >= tgt)
+        tau = step.copy()
+        if crossed.any():
+            c_h, c_v, c_step = h[crossed], v[crossed], step[crossed]
+            a_mean = (v_new[crossed] - c_v) / c_step
+            gap = tgt[crossed] - c_h
+            tau[crossed] = 2 * gap / (c_v + np.sqrt(np.maximum(c_v**2 + 2 * a_mean * gap, 0.0)))
+        
+        # Arrive once the overshoot is within tolerance; otherwise retake the
+        # step to end just past the estimated crossing
+        h_tol = atol + rtol * tgt
+        arrived = crossed & (h_new - tgt <= h_tol)
+        retake = crossed & ~arrived
+        if arrived.any():
+            idx = active[arrived]
+            time_s[idx] = t[arrived] + tau[arrived]
+            velocity[idx] = v[arrived] + (v_new[arrived] - v[arrived]) * tau[arrived] / step[arrived]
+        
+        advance = accept & ~retake
+        h = np.where(advance, h_new, h)
+        v = np.where(advance, v_new, v)
+        t = np.where(advance, t + step, t)
+        if method == 'adaptive':
+            step = step * growth
+        if retake.any():
+            v_cross = v[retake] + (v_new[retake] - v[retake]) * tau[retake] / step[retake]
+            step[retake] = tau[retake] + 0.5 * h_tol[retake] / np.maximum(v_cross, 1e-9)
+        
+        keep = ~arrived & (t < max_time_s)
+        active, h, v, t, a, tgt, step = (x[keep] for x in (active, h, v, t, a, tgt, step))
+    
+    success = np.isfinite(time_s)
+    energy_J = np.where(success, profiles.power_MW * 1e6 * np.nan_to_num(time_s), 0.0)
+    
+    # Work against (altitude-dependent) gravity plus kinetic energy at arrival
+    potential_J = profiles.mass_kg * G0 * EARTH_RADIUS_M * target / (EARTH_RADIUS_M + target)
+    mechanical_J = np.where(success, potential_J + 0.5 * profiles.mass_kg * np.nan_to_num(velocity)**2,
+                            0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiency = np.where(energy_J > 0, mechanical_J / energy_J, np.nan)
+    
+    return {
+        'time_s': time_s,
+        'velocity_m_s': velocity,
+        'energy_J': energy_J,
+        'mechanical_energy_J': mechanical_J,
+        'efficiency': efficiency,
+        'success': success,
+        'steps': steps
+    }
+
+
 # =============================================================================
 # LIFT DEMONSTRATION
 # =============================================================================
@@ -343,9 +3565,10 @@ class LiftTest:
     Simple lift demonstration using gravity modulator
     """
     
-    def __init__(self, modulator: GravityModulator):
+    def __init__(self, modulator: GravityModulator, verbose: Optional[bool] = None):
         self.modulator = modulator
         self.scaling = ScalingArchitecture()
+        self.verbose = verbose  # None follows the module-level VERBOSE setting
     
     def lift_payload(self, mass_kg: float, height_m: float) -> Dict:
         """
@@ -358,8 +3581,8 @@ class LiftTest:
         Returns:
             Test results dictionary
         """
-        print(f"\n🚀 LIFT TEST: {mass_kg} kg to {height_m} m")
-        print("-" * 50)
+        _report(self.verbose, "\n🚀 LIFT TEST: %s kg to %s m", mass_kg, height_m)
+        _report(self.verbose, "%s", "-" * 50)
         
         # Calculate required force
         required_force = mass_kg * 9.81  # Newtons to counteract gravity
@@ -395,19 +3618,56 @@ class LiftTest:
         }
         
         # Report
-        print(f"\n📊 RESULTS:")
-        print(f"   Required force: {required_force:.1f} N")
-        print(f"   Actual thrust: {result['thrust_N']:.1f} N")
-        print(f"   Required power: {required_power_MW:.3f} MW")
-        print(f"   Lift time: {results['lift_time_s']:.2f} s")
-        print(f"   Energy used: {results['energy_used_J']:.2f} J")
-        print(f"   Success: {'✅' if results['success'] else '❌'}")
+        _report(self.verbose, "\n📊 RESULTS:")
+        _report(self.verbose, "   Required force: %.1f N", required_force)
+        _report(self.verbose, "   Actual thrust: %.1f N", result['thrust_N'])
+        _report(self.verbose, "   Required power: %.3f MW", required_power_MW)
+        _report(self.verbose, "   Lift time: %.2f s", results['lift_time_s'])
+        _report(self.verbose, "   Energy used: %.2f J", results['energy_used_J'])
+        _report(self.verbose, "   Success: %s", '✅' if results['success'] else '❌')
         
         # Compare to rocket
         rocket_energy = mass_kg * height_m * 9.81 * 100  # Rockets are 1% efficient
-        print(f"\n   vs Rocket: {rocket_energy:.2f} J")
-        print(f"   Efficiency improvement: {rocket_energy / results['energy_used_J']:.0f}x")
+        _report(self.verbose, "\n   vs Rocket: %.2f J", rocket_energy)
+        _report(self.verbose, "   Efficiency improvement: %.0fx", rocket_energy / results['energy_used_J'])
+        
+        return results
+    
+    def lift_profiles(self, masses_kg, heights_m, method: str = 'adaptive', **kwargs) -> Dict:
+        """
+        Integrate many lifts at once with the trajectory simulator
+        
+        Power is sized per payload as in lift_payload(), but gravity falls
+        off with altitude and arrival time and energy come from integrating
+        the trajectory rather than a constant-acceleration formula.
+        
+        Args:
+            masses_kg: Payload mass(es) in kg
+            heights_m: Lift height(s) in meters (broadcast against masses)
+            method: Integrator, 'adaptive' or 'rk4'
+            **kwargs: Passed through to simulate_lift()
+            
+        Returns:
+            simulate_lift() results plus the lift configuration arrays
+        """
+        efficiency, _ = self.modulator._directional_efficiency((0, 0, 1))
+        thrust_N = self.modulator.total_force() * efficiency
+        masses_kg, heights_m = np.broadcast_arrays(np.atleast_1d(np.asarray(masses_kg, dtype=float)),
+                                                   np.atleast_1d(np.asarray(heights_m, dtype=float)))
+        required_power_MW = masses_kg * G0 / 77_000  # Same sizing as lift_payload()
+        
+        profiles = LiftProfiles(mass_kg=masses_kg, thrust_N=thrust_N,
+                                power_MW=required_power_MW, target_m=heights_m)
+        results = simulate_lift(profiles, method=method, **kwargs)
+        results.update({
+            'mass_kg': profiles.mass_kg,
+            'height_m': profiles.target_m,
+            'thrust_N': profiles.thrust_N,
+            'required_power_MW': profiles.power_MW
+        })
         
+        _report(self.verbose, "\n🚀 LIFT PROFILES: %d integrated, %d succeeded",
+                len(profiles), int(results['success'].sum()))
         return results
 
 
@@ -417,6 +3677,7 @@ class LiftTest:
 
 def main():
     """Run complete gravity modulator simulation"""
+    log_to_console()
     
     print("=" * 70)
     print("ω³ QUANTUM VACUUM GRAVITY MODULATOR SIMULATION")
@@ -424,7 +3685,7 @@ def main():
     
     # Step 1: Initialize modulator
     print("\n📦 STEP 1: INITIALIZING MODULATOR")
-    modulator = GravityModulator(array_size_cm=10.0)
+    modulator = GravityModulator(array_size_cm=10.0, verbose=True)
     
     # Step 2: Display metamaterial specs
     print("\n🧪 STEP 2: METAMATERIAL SPECIFICATIONS")
@@ -448,7 +3709,7 @@ def main():
     
     # Step 5: Run lift test
     print("\n⚡ STEP 5: LIFT TEST")
-    test = LiftTest(modulator)
+    test = LiftTest(modulator, verbose=True)
     results = test.lift_payload(mass_kg=1000, height_m=100)
     
     # Step 6: Final summary
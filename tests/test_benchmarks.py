@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the hot-path benchmark suite and its regression check.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent and benchmarks directories to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+import bench_modulator
+from gravity_modulator import ScalingArchitecture
+
+
+class TestBenchmarkSuite:
+    """Test suite for benchmark selection, recording and comparison."""
+
+    def test_fitting_levels(self):
+        """Verify only levels whose phase grid fits the budget are selected."""
+        scaling = ScalingArchitecture()
+        names = [level.name for level in bench_modulator.fitting_levels(scaling, 2 * 1024**3)]
+
+        assert names == ["Unit Cell", "Tile"]
+        assert bench_modulator.fitting_levels(scaling, 1000) == []
+
+    def test_compare_flags_regressions(self):
+        """Verify slowdowns beyond the threshold are reported."""
+        baseline = {'cases': {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0}}}
+        run = {'cases': {'a': {'seconds': 1.1}, 'b': {'seconds': 1.5}, 'new': {'seconds': 9.0}}}
+
+        regressions = bench_modulator.compare(run, baseline, threshold=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("b:")
+        assert bench_modulator.compare(run, None, threshold=0.25) == []
+
+    def test_main_records_history(self, tmp_path):
+        """Verify a run is appended to history and becomes the first baseline."""
+        history = tmp_path / "history.json"
+        argv = ["--history", str(history), "--repeat", "1", "--levels", "Unit Cell"]
+
+        assert bench_modulator.main(argv) == 0
+        assert bench_modulator.main(argv + ["--threshold", "1000"]) == 0
+
+        data = json.loads(history.read_text())
+        assert len(data['runs']) == 2
+        assert data['baseline'] == data['runs'][0]
+        assert "Unit Cell/activate" in data['baseline']['cases']
+        assert data['baseline']['cases']["Unit Cell/activate"]['plates'] == 1000
+
+    def test_main_fails_on_regression(self, tmp_path):
+        """Verify the exit code signals a regression against the baseline."""
+        history = tmp_path / "history.json"
+        argv = ["--history", str(history), "--repeat", "1", "--levels", "Unit Cell"]
+        bench_modulator.main(argv)
+
+        # Make the stored baseline impossibly fast
+        data = json.loads(history.read_text())
+        for case in data['baseline']['cases'].values():
+            case['seconds'] = 1e-12
+        history.write_text(json.dumps(data))
+
+        assert bench_modulator.main(argv) == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -11,7 +11,15 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from gravity_modulator import GravityModulator, MetamaterialSpecs, CasimirArraySpecs
+from gravity_modulator import (GravityModulator, MetamaterialSpecs, CasimirArraySpecs, PhaseCache,
+                               PhaseField, PhaseMoments, ScalingArchitecture,
+                               phase_levels, encode_phases, decode_phases, array_factor,
+                               Tolerance, monte_carlo_thrust, NOMINAL_EFFICIENCY,
+                               FrozenCasimirArraySpecs, FrozenMetamaterialSpecs,
+                               PhaseChannels, channel_group_shape, PHASE_CHANNELS,
+                               slew_directions, phase_frames, phase_block,
+                               encode_frame, decode_frame, iter_frames, read_frame_header,
+                               PhaseFrameEncoder, PhaseFrameDecoder)
 
 
 class TestCasimirPhysics:
@@ -70,6 +78,33 @@ class TestCasimirPhysics:
         # Should be negative
         assert eff < 0, "Effective pressure should still be negative"
 
+    def test_vectorized_sweep_matches_scalar(self):
+        """Verify array arguments broadcast and match per-point evaluation."""
+        spacing = np.linspace(5e-9, 500e-9, 50)[:, None, None]
+        gamma = np.array([1.0, 1e3, 1.2e6])[None, :, None]
+        plates = np.array([10**3, 10**6])[None, None, :]
+
+        forces = self.mod.total_force(d=spacing, gamma=gamma, plates=plates)
+        assert forces.shape == (50, 3, 2)
+
+        for idx in [(0, 0, 0), (17, 2, 1), (49, 1, 0)]:
+            i, j, k = idx
+            point = self.mod.total_force(d=float(spacing[i, 0, 0]), gamma=float(gamma[0, j, 0]),
+                                         plates=int(plates[0, 0, k]))
+            assert isinstance(point, float)
+            assert np.isclose(forces[idx], point, rtol=1e-12)
+
+        pressures = self.mod.effective_pressure(d=spacing[:, 0, 0])
+        assert np.allclose(pressures, self.mod.casimir_pressure(d=spacing[:, 0, 0]) * self.mod.gamma)
+
+    def test_defaults_unchanged(self):
+        """Verify instance defaults still give scalar results."""
+        force = self.mod.total_force()
+        plate_area = (self.mod.array.plate_spacing_m * 100) ** 2
+        expected = abs(self.mod.effective_pressure()) * plate_area * self.mod.array.total_plates
+        assert isinstance(force, float)
+        assert np.isclose(force, expected, rtol=1e-12)
+
 
 class TestCasimirArray:
     """Test suite for Casimir array calculations."""
@@ -162,6 +197,23 @@ class TestPhaseControl:
         # Should be small due to cancellation
         assert np.mean(magnitude) < 0.1, "Off-axis cancellation insufficient"
     
+    def test_vectorized_matches_reference_loop(self):
+        """Verify vectorized phase pattern matches the per-plate formula."""
+        self.mod.array = CasimirArraySpecs(dimensions=(12, 9, 7))
+        k = 2 * np.pi / (self.mod.array.plate_spacing_m * 1000)
+
+        for direction in [(0, 0, 1), (1, 1, 0), (0.3, -0.7, 0.2), (-1, 2, 5)]:
+            phases = self.mod.calculate_phase_pattern(direction)
+
+            expected = np.zeros(self.mod.array.dimensions)
+            for i, j, k_idx in np.ndindex(*self.mod.array.dimensions):
+                r = np.array([i, j, k_idx]) * self.mod.array.plate_spacing_m
+                expected[i, j, k_idx] = (k * np.dot(direction, r)) % (2 * np.pi)
+
+            # Compare on the unit circle so 0 and 2π count as equal
+            diff = np.angle(np.exp(1j * (phases - expected)))
+            assert np.max(np.abs(diff)) < 1e-9, f"Phase mismatch for {direction}"
+
     def test_different_directions(self):
         """Test phase patterns for different directions."""
         directions = [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0)]
@@ -175,6 +227,825 @@ class TestPhaseControl:
             assert phases.max() <= 2 * np.pi
 
 
+class TestParallelPhase:
+    """Test suite for process-pool sharded phase computation."""
+
+    def test_parallel_matches_serial(self):
+        """Verify sharded computation reproduces the serial pattern."""
+        mod = GravityModulator(array_size_cm=1.0,
+                               array=CasimirArraySpecs(dimensions=(13, 8, 6)))
+        serial = mod.calculate_phase_pattern((0.3, -0.7, 0.2))
+        parallel = mod.calculate_phase_pattern((0.3, -0.7, 0.2), workers=3)
+
+        assert np.array_equal(parallel, serial)
+
+    def test_more_workers_than_rows(self):
+        """Verify shards never exceed the first-axis length."""
+        mod = GravityModulator(array_size_cm=1.0,
+                               array=CasimirArraySpecs(dimensions=(2, 4, 4)),
+                               phase_workers=4)
+        phases = mod.calculate_phase_pattern((0, 0, 1))
+
+        assert np.array_equal(phases, mod.calculate_phase_pattern((0, 0, 1), workers=1))
+
+
+class TestPhaseCache:
+    """Test suite for phase pattern caching."""
+
+    def setup_method(self):
+        """Initialize a small modulator for each test."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(10, 10, 10)))
+
+    def test_repeat_activation_hits_cache(self):
+        """Verify repeated directions reuse the cached pattern."""
+        self.mod.activate(direction=(0, 0, 1))
+        first = self.mod.phase_matrix
+        self.mod.activate(direction=(0.0, 0.0, 1.0))
+
+        stats = self.mod.get_status()['phase_cache']
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert self.mod.phase_matrix is first
+        assert not first.flags.writeable
+
+    def test_geometry_is_part_of_key(self):
+        """Verify a change of spacing recomputes the pattern."""
+        self.mod.activate(direction=(0, 0, 1))
+        self.mod.array = CasimirArraySpecs(dimensions=(10, 10, 10), plate_spacing_nm=200.0)
+        self.mod.activate(direction=(0, 0, 1))
+
+        assert self.mod.phase_cache.misses == 2
+        expected = self.mod.calculate_phase_pattern((0, 0, 1))
+        assert np.array_equal(self.mod.phase_matrix, expected)
+
+    def test_lru_eviction_by_count(self):
+        """Verify least-recently-used entries are evicted first."""
+        cache = PhaseCache(max_entries=2)
+        for key in ['a', 'b', 'a', 'c']:
+            cache.get_or_compute(key, lambda: np.zeros(4))
+
+        assert cache.evictions == 1
+        assert cache.hits == 1
+        cache.get_or_compute('a', lambda: np.zeros(4))
+        assert cache.hits == 2, "'a' should have survived as most recently used"
+
+    def test_byte_budget(self):
+        """Verify the byte budget bounds cache occupancy."""
+        cache = PhaseCache(max_entries=100, max_bytes=3 * 80)
+        for key in range(5):
+            cache.get_or_compute(key, lambda: np.zeros(10))
+
+        assert cache.nbytes <= 3 * 80
+        assert len(cache) == 3
+        assert cache.evictions == 2
+
+        # Oversized patterns are returned but never stored
+        big = cache.get_or_compute('big', lambda: np.zeros(1000))
+        assert big.shape == (1000,)
+        assert len(cache) == 3
+
+
+class TestPhaseQuantization:
+    """Test suite for quantized phase codes."""
+
+    def test_levels_at_default_resolution(self):
+        """Verify 0.1° resolution gives 3600 phase codes."""
+        assert phase_levels(0.1) == 3600
+        with pytest.raises(ValueError):
+            phase_levels(0.001)
+
+    def test_encode_decode_round_trip(self):
+        """Verify decoded phases are within half a quantization step."""
+        phases = np.linspace(0, 2 * np.pi, 10001)
+        codes = encode_phases(phases, 0.1)
+
+        assert codes.dtype == np.uint16
+        assert codes.max() < 3600
+        assert codes[-1] == 0, "2π should wrap to code 0"
+
+        diff = np.angle(np.exp(1j * (decode_phases(codes, 0.1) - phases)))
+        assert np.max(np.abs(diff)) <= np.deg2rad(0.05) + 1e-12
+
+    def test_compact_modulator_state(self):
+        """Verify compact mode stores uint16 codes matching the float pattern."""
+        specs = CasimirArraySpecs(dimensions=(20, 20, 20))
+        compact = GravityModulator(array_size_cm=1.0, array=specs, compact_phases=True)
+        full = GravityModulator(array_size_cm=1.0, array=specs)
+
+        r_compact = compact.activate(direction=(1, 1, 0))
+        r_full = full.activate(direction=(1, 1, 0))
+
+        assert compact.phase_codes.dtype == np.uint16
+        assert compact.phase_codes.nbytes * 4 == full.phase_matrix.nbytes
+        assert np.array_equal(compact.phase_codes, full.phase_codes)
+        assert abs(r_compact['phase_coherence'] - r_full['phase_coherence']) < 1e-2
+
+
+class TestPhaseField:
+    """Test suite for the lazy procedural phase field."""
+
+    def setup_method(self):
+        """Build a small field alongside its dense equivalent."""
+        self.direction = (0.3, -0.7, 0.2)
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(8, 6, 5)))
+        self.dense = self.mod.calculate_phase_pattern(self.direction)
+        self.field = PhaseField(self.direction, self.mod.array.plate_spacing_m,
+                                self.mod.array.dimensions)
+
+    def test_basic_indexing_matches_dense(self):
+        """Verify slices, integers and Ellipsis match dense indexing."""
+        keys = [
+            (...),
+            (2,),
+            (slice(1, 7, 2), 3),
+            (-1, ..., slice(None, None, -1)),
+            (4, 5, 1),
+            (..., 2),
+            ([0, 3, 7], slice(2, 4)),
+            (slice(None), 1, np.array([4, -1])),
+        ]
+        for key in keys:
+            assert np.array_equal(self.field[key], self.dense[key]), f"Mismatch for {key}"
+
+    def test_point_sampling(self):
+        """Verify index arrays on all axes sample individual plates."""
+        i = np.array([0, 7, 3])
+        j = np.array([5, 0, 2])
+        k = np.array([4, 1, 0])
+        assert np.array_equal(self.field[i, j, k], self.dense[i, j, k])
+
+    def test_invalid_indices(self):
+        """Verify out-of-range and unsupported indices are rejected."""
+        with pytest.raises(IndexError):
+            self.field[8]
+        with pytest.raises(IndexError):
+            self.field[[0, 1], [0, 1]]
+        with pytest.raises(IndexError):
+            self.field[0, 0, 0, 0]
+
+    def test_megascale_in_constant_memory(self):
+        """Verify a megascale array can be steered and queried lazily."""
+        scaling = ScalingArchitecture()
+        specs = scaling.array_specs(scaling.megascale)
+        assert specs.total_plates == 10**15
+
+        mod = GravityModulator(array_size_cm=1000.0, array=specs, lazy_phases=True)
+        result = mod.activate(direction=(0, 0, 1))
+        assert result['thrust_N'] > 0
+
+        tile = mod.phase_matrix[50_000:50_010, 99_990:, :10]
+        assert tile.shape == (10, 10, 10)
+
+        small = GravityModulator(array=CasimirArraySpecs(dimensions=(1, 1, 10)))
+        expected = small.calculate_phase_pattern((0, 0, 1))[0, 0]
+        assert np.allclose(tile[3, 4], expected)
+
+
+class TestResteer:
+    """Test suite for incremental re-steering."""
+
+    def setup_method(self):
+        """Initialize a small modulator steered along Z."""
+        self.specs = CasimirArraySpecs(dimensions=(16, 12, 10))
+        self.mod = GravityModulator(array_size_cm=1.0, array=self.specs)
+        self.mod.activate(direction=(0, 0, 1))
+
+    def test_delta_update_matches_full_pattern(self):
+        """Verify the in-place delta update reproduces a fresh pattern."""
+        cached = self.mod.phase_matrix
+        before = cached.copy()
+        self.mod.resteer((0.01, -0.02, 1.0))
+
+        expected = self.mod.calculate_phase_pattern((0.01, -0.02, 1.0))
+        diff = np.angle(np.exp(1j * (self.mod.phase_matrix - expected)))
+        assert np.max(np.abs(diff)) < 1e-9
+        assert np.array_equal(cached, before), "Cached pattern must not be modified"
+
+    def test_sparse_diff_reconstructs_codes(self):
+        """Verify the reported diff turns old codes into the new codes."""
+        old_codes = self.mod.phase_codes.copy()
+        result = self.mod.resteer((0.05, 0, 1.0))
+
+        patched = old_codes.reshape(-1).copy()
+        patched[result['changed_plates']] = result['changed_codes']
+        assert np.array_equal(patched.reshape(old_codes.shape), self.mod.phase_codes)
+        assert 0 < len(result['changed_plates']) < old_codes.size
+
+    def test_compact_resteer(self):
+        """Verify compact state is re-encoded without accumulated error."""
+        mod = GravityModulator(array_size_cm=1.0, array=self.specs, compact_phases=True)
+        mod.activate(direction=(0, 0, 1))
+        for step in range(1, 6):
+            result = mod.resteer((0.003 * step, 0, 1.0))
+
+        assert np.array_equal(mod.phase_codes, mod.calculate_phase_codes((0.015, 0, 1.0)))
+        assert result['changed_codes'].dtype == np.uint16
+
+    def test_geometry_change_falls_back_to_rebuild(self):
+        """Verify stale geometry triggers a full recompute."""
+        self.mod.array = CasimirArraySpecs(dimensions=(8, 8, 8))
+        self.mod.resteer((1, 0, 0))
+
+        assert np.array_equal(self.mod.phase_matrix, self.mod.calculate_phase_pattern((1, 0, 0)))
+
+    def test_thrust_follows_new_direction(self):
+        """Verify an active modulator's thrust vector is re-steered."""
+        self.mod.resteer((1, 0, 0))
+        assert self.mod.thrust_vector[0] > 0
+        assert self.mod.thrust_vector[2] == 0
+
+
+class TestPhaseTiles:
+    """Test suite for tile-by-tile phase streaming."""
+
+    def setup_method(self):
+        """Initialize a small, non-tile-aligned modulator."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(23, 10, 17)))
+
+    def test_tiles_reassemble_to_full_pattern(self):
+        """Verify streamed tiles cover the array exactly once."""
+        direction = (1, 1, 0)
+        full = self.mod.calculate_phase_pattern(direction)
+        rebuilt = np.full(full.shape, np.nan)
+
+        tiles = list(self.mod.iter_phase_tiles(direction, tile_shape=(10, 10, 10)))
+        assert len(tiles) == 3 * 1 * 2
+        for (ti, tj, tk), block in tiles:
+            assert block.shape[0] <= 10 and block.shape[2] <= 10
+            sl = tuple(slice(t * 10, t * 10 + n) for t, n in zip((ti, tj, tk), block.shape))
+            assert np.all(np.isnan(rebuilt[sl])), "Tiles overlap"
+            rebuilt[sl] = block
+
+        assert np.array_equal(rebuilt, full)
+
+    def test_quantized_tiles(self):
+        """Verify quantized tiles are upload-ready uint16 codes."""
+        tile_index, block = next(self.mod.iter_phase_tiles((0, 0, 1), quantized=True))
+        assert tile_index == (0, 0, 0)
+        assert block.dtype == np.uint16
+        expected = encode_phases(self.mod.calculate_phase_pattern((0, 0, 1))[:10, :10, :10])
+        assert np.array_equal(block, expected)
+
+    def test_scaling_level_tile_shape(self):
+        """Verify a ScalingLevel selects its plate grid as the tile shape."""
+        scaling = ScalingArchitecture()
+        _, block = next(self.mod.iter_phase_tiles((0, 0, 1), tile_shape=scaling.unit_cell))
+        assert block.shape == (10, 10, 10)
+
+
+class TestPhaseChannels:
+    """Test suite for grouped phase channels."""
+
+    def setup_method(self):
+        """Initialize a grouped modulator whose groups do not tile the array evenly."""
+        self.array = CasimirArraySpecs(dimensions=(23, 10, 17))
+        self.mod = GravityModulator(array_size_cm=1.0, array=self.array, channel_group=(4, 5, 3))
+
+    def test_channel_grid_and_expansion(self):
+        """Verify one phase is stored per group and every plate reads its group's phase."""
+        self.mod.activate(direction=(0.3, -0.2, 0.9), power_MW=1.0)
+        state = self.mod.phase_matrix
+        assert isinstance(state, PhaseChannels)
+        assert state.channels.shape == self.mod.channel_shape == (6, 2, 6)
+
+        dense = state[...]
+        assert dense.shape == self.array.dimensions
+        assert np.all(dense[4:8, 5:10, 3:6] == state.channels[1, 1, 1])
+        assert np.array_equal(state[22, :, 16], dense[22, :, 16])
+        assert np.array_equal(state[[0, 9], [1, 2], [3, 16]], dense[[0, 9], [1, 2], [3, 16]])
+
+    def test_matches_per_plate_pattern_at_group_centers(self):
+        """Verify channel phases equal the per-plate ramp at each group's center plate."""
+        mod = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(9, 9, 9)),
+                               channel_group=(3, 3, 3))
+        direction = (1, 0.5, 0.25)
+        channels = mod.calculate_channel_phases(direction)
+        full = mod.calculate_phase_pattern(direction)
+        assert np.allclose(channels, full[1::3, 1::3, 1::3])
+
+    def test_plate_grid_setter_matches_synthesis(self):
+        """Verify sampling a per-plate pattern gives the synthesized channels, even groups included."""
+        direction = (0.3, -0.2, 0.9)
+        self.mod.phase_matrix = self.mod.calculate_phase_pattern(direction)
+        assert np.array_equal(self.mod.phase_matrix.channels,
+                              self.mod.calculate_channel_phases(direction))
+
+    def test_coherence_is_plate_weighted(self):
+        """Verify reported coherence equals the std of the expanded per-plate phases."""
+        result = self.mod.activate(direction=(1, 1, 0), power_MW=1.0)
+        assert np.isclose(result['phase_coherence'], np.std(self.mod.phase_matrix[...]))
+
+    def test_cache_holds_only_channels(self):
+        """Verify cached state and its byte count scale with channels, not plates."""
+        self.mod.activate(direction=(0, 0, 1), power_MW=1.0)
+        self.mod.activate(direction=(0, 0, 1), power_MW=1.0)
+        stats = self.mod.phase_cache.stats()
+        assert stats['hits'] == 1
+        assert stats['bytes'] == 6 * 2 * 6 * 8
+        assert self.mod.get_status()['phase_channels'] == 72
+
+    def test_resteer_reports_channels(self):
+        """Verify re-steering rebuilds the channels and reports per-channel code changes."""
+        self.mod.activate(direction=(0, 0, 1), power_MW=1.0)
+        result = self.mod.resteer((1, 0, 0))
+        expected = self.mod.calculate_channel_phases((1, 0, 0))
+        assert np.array_equal(self.mod.phase_matrix.channels, expected)
+        assert 'changed_plates' not in result
+        assert np.array_equal(result['changed_codes'],
+                              encode_phases(expected).reshape(-1)[result['changed_channels']])
+
+    def test_setter_accepts_channel_or_plate_grids(self):
+        """Verify phase_matrix takes channel phases directly or samples plates at group centers."""
+        channels = np.random.default_rng(0).uniform(0, 2 * np.pi, self.mod.channel_shape)
+        self.mod.phase_matrix = channels
+        assert np.array_equal(self.mod.phase_matrix.channels, channels)
+
+        self.mod.phase_matrix = self.mod.phase_matrix[...]
+        assert np.array_equal(self.mod.phase_matrix.channels, channels)
+
+        with pytest.raises(ValueError):
+            self.mod.phase_matrix = np.zeros((2, 2, 2))
+
+    def test_tiles_expand_channels(self):
+        """Verify streamed tiles are expanded from the channel phases."""
+        direction = (0, 1, 0)
+        self.mod.activate(direction=direction, power_MW=1.0)
+        dense = self.mod.phase_matrix[...]
+        for (ti, tj, tk), block in self.mod.iter_phase_tiles(direction, tile_shape=(10, 10, 10)):
+            sl = tuple(slice(t * 10, t * 10 + n) for t, n in zip((ti, tj, tk), block.shape))
+            assert np.array_equal(block, dense[sl])
+
+    def test_level_group_shapes(self):
+        """Verify scaling-level groups reproduce the channel counts in the scaling table."""
+        scaling = ScalingArchitecture()
+        for level in scaling.levels:
+            specs = scaling.array_specs(level)
+            group = channel_group_shape(level)
+            channels = np.prod([-(-n // g) for n, g in zip(specs.dimensions, group)])
+            assert channels == PHASE_CHANNELS[level.name]
+
+    def test_exclusive_with_compact_and_lazy(self):
+        """Verify grouped mode rejects the other phase storage modes."""
+        with pytest.raises(ValueError):
+            GravityModulator(channel_group=(2, 2, 2), compact_phases=True)
+        with pytest.raises(ValueError):
+            GravityModulator(channel_group=(2, 2, 2), lazy_phases=True)
+        with pytest.raises(ValueError):
+            GravityModulator(channel_group=(0, 2, 2))
+
+
+class TestSlewPlanning:
+    """Test suite for batched slew frame generation."""
+
+    def setup_method(self):
+        """Initialize a small modulator."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(12, 9, 7)))
+
+    @staticmethod
+    def circular_close(a, b):
+        return np.allclose(np.angle(np.exp(1j * (a - b))), 0, atol=1e-12)
+
+    def test_directions_follow_great_circle(self):
+        """Verify a 1 ms slew at 1 MHz has 1000 unit-length ticks ending on target."""
+        times, directions = slew_directions((0, 0, 1), (1, 0, 0), 1e-3, rate_hz=1e6)
+        assert len(times) == len(directions) == 1000
+        assert times[-1] == pytest.approx(1e-3)
+        assert np.array_equal(directions[-1], [1.0, 0.0, 0.0])
+        assert np.allclose(np.linalg.norm(directions, axis=1), 1.0)
+
+        # Minimum-jerk progress starts and ends gently and is symmetric
+        steps = np.linalg.norm(np.diff(np.vstack([(0, 0, 1), directions]), axis=0), axis=1)
+        assert steps[0] < steps[len(steps) // 2] / 100
+        assert steps[0] == pytest.approx(steps[-1], rel=1e-3)
+
+    def test_direction_edge_cases(self):
+        """Verify antiparallel slews fall back to linear paths and bad profiles raise."""
+        _, directions = slew_directions((0, 0, 1), (0, 0, -1), 1e-3, rate_hz=1e4, profile='linear')
+        assert np.allclose(directions[:, :2], 0)
+        assert np.allclose(np.diff(directions[:, 2]), -0.2)
+        with pytest.raises(ValueError):
+            slew_directions((0, 0, 1), (1, 0, 0), 1e-3, profile='bang_bang')
+
+    def test_frames_match_phase_block(self):
+        """Verify batched frames agree with per-direction synthesis and encoding."""
+        rng = np.random.default_rng(3)
+        directions = rng.normal(size=(4, 3))
+        axes = [np.arange(n) for n in (12, 9, 7)]
+        s = self.mod.array.plate_spacing_m
+
+        frames = phase_frames(directions, s, *axes)
+        codes = phase_frames(directions, s, *axes, resolution_deg=0.1)
+        for direction, frame, frame_codes in zip(directions, frames, codes):
+            reference = phase_block(direction, s, *axes)
+            assert self.circular_close(frame, reference)
+            assert np.array_equal(frame_codes, encode_phases(reference))
+        assert np.all((frames >= 0) & (frames < 2 * np.pi))
+
+    def test_codes_stay_below_one_turn(self):
+        """Verify quantized frames wrap to valid codes for directions with negative components."""
+        mod = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(20, 20, 20)))
+        axes = [np.arange(20)] * 3
+        s = mod.array.plate_spacing_m
+        frames = [frame for _, frame in mod.iter_slew((0.957, -0.114, 0.418), (-0.376, 0.068, -0.291),
+                                                      1e-5, rate_hz=1e6, quantized=True)]
+        _, directions = slew_directions((0.957, -0.114, 0.418), (-0.376, 0.068, -0.291),
+                                        1e-5, rate_hz=1e6)
+        codes = np.stack(frames)
+        assert codes.max() < phase_levels(0.1)
+        for direction, frame_codes in zip(directions, codes):
+            assert np.array_equal(frame_codes, encode_phases(phase_block(direction, s, *axes)))
+        decode_frame(encode_frame(codes[-1]))
+
+        directions = np.random.default_rng(5).uniform(-1, 1, size=(50, 3))
+        codes = phase_frames(directions, s, *axes, resolution_deg=0.1)
+        assert codes.max() < phase_levels(0.1)
+        for direction, frame_codes in zip(directions, codes):
+            assert np.array_equal(frame_codes, encode_phases(phase_block(direction, s, *axes)))
+
+    def test_iter_slew_ends_on_target(self):
+        """Verify the last frame is the end pattern and state is untouched."""
+        before = self.mod.phase_matrix.copy()
+        frames = list(self.mod.iter_slew((0, 0, 1), (0.6, 0.8, 0), 1e-4, rate_hz=1e5))
+        assert len(frames) == 10
+        assert self.circular_close(frames[-1][1], self.mod.calculate_phase_pattern((0.6, 0.8, 0)))
+        assert np.array_equal(self.mod.phase_matrix, before)
+
+    def test_delta_frames_reconstruct_codes(self):
+        """Verify applying each delta to the start codes reproduces every quantized frame."""
+        args = ((0, 0, 1), (1, 0, 0), 2e-5, 1e6)
+        codes = encode_phases(self.mod.calculate_phase_pattern((0, 0, 1))).reshape(-1)
+        for (_, delta), (_, frame) in zip(self.mod.iter_slew(*args, delta=True),
+                                          self.mod.iter_slew(*args, quantized=True)):
+            codes[delta['changed_plates']] = delta['changed_codes']
+            assert np.array_equal(codes, frame.reshape(-1))
+
+    def test_delta_frames_span_batches(self, monkeypatch):
+        """Verify delta streams stay correct across several synthesis batches."""
+        import gravity_modulator
+        monkeypatch.setattr(gravity_modulator, 'SLEW_BATCH_PLATES', 3 * 12 * 9 * 7)
+        args = ((0, 0, 1), (1, 0, 0), 1e-5, 1e6)
+        codes = encode_phases(self.mod.calculate_phase_pattern((0, 0, 1))).reshape(-1)
+        deltas = list(self.mod.iter_slew(*args, delta=True))
+        assert len(deltas) == 10  # Four batches of up to three frames
+        for (_, delta), (_, frame) in zip(deltas, self.mod.iter_slew(*args, quantized=True)):
+            codes[delta['changed_plates']] = delta['changed_codes']
+            assert np.array_equal(codes, frame.reshape(-1))
+
+    def test_grouped_frames_are_channels(self):
+        """Verify grouped modulators slew their channel grid."""
+        mod = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(12, 9, 7)),
+                               channel_group=(4, 3, 7))
+        _, frame = list(mod.iter_slew((0, 0, 1), (1, 0, 0), 1e-5, rate_hz=1e6))[-1]
+        assert frame.shape == mod.channel_shape == (3, 3, 1)
+        assert self.circular_close(frame, mod.calculate_channel_phases((1, 0, 0)))
+
+
+class TestWireFormat:
+    """Test suite for the binary phase frame format."""
+
+    def setup_method(self):
+        """Build two nearby code grids, as for a small steering change."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(30, 20, 10)))
+        self.codes = encode_phases(self.mod.calculate_phase_pattern((0, 0, 1)))
+        self.next_codes = encode_phases(self.mod.calculate_phase_pattern((0.05, 0, 1)))
+
+    @pytest.mark.parametrize("compression", ['none', 'zlib'])
+    def test_round_trip(self, compression):
+        """Verify keyframes and delta frames decode to the original codes."""
+        frame = encode_frame(self.codes, compression=compression, sequence=7)
+        header, codes = decode_frame(bytes(frame))
+        assert header.sequence == 7 and not header.delta
+        assert header.dimensions == (30, 20, 10) and header.nbytes == len(frame)
+        assert np.array_equal(codes, self.codes)
+
+        delta = encode_frame(self.next_codes, previous=self.codes, compression=compression)
+        header, codes = decode_frame(delta, previous=self.codes)
+        assert header.delta
+        assert np.array_equal(codes, self.next_codes)
+
+    def test_lz4_round_trip(self):
+        """Verify the optional lz4 codec round-trips delta frames."""
+        pytest.importorskip('lz4')
+        frame = encode_frame(self.next_codes, previous=self.codes, compression='lz4')
+        header, codes = decode_frame(frame, previous=self.codes)
+        assert header.compression == 'lz4'
+        assert np.array_equal(codes, self.next_codes)
+
+    def test_compression_shrinks_frames(self):
+        """Verify codes are 2 bytes per plate raw and delta frames compress further."""
+        raw = encode_frame(self.codes, compression='none')
+        keyframe = encode_frame(self.next_codes)
+        delta = encode_frame(self.next_codes, previous=self.codes)
+        assert len(raw) == read_frame_header(raw).nbytes
+        assert read_frame_header(raw).payload_bytes == self.codes.size * 2
+        assert len(delta) < len(keyframe) < len(raw)
+
+    def test_raw_decode_is_zero_copy(self):
+        """Verify uncompressed keyframes decode as views of the buffer."""
+        frame = encode_frame(self.codes, compression='none')
+        _, codes = decode_frame(frame)
+        assert np.shares_memory(codes, np.frombuffer(frame, dtype=np.uint8))
+
+    def test_corruption_and_bad_frames_rejected(self):
+        """Verify checksum, magic, truncation and missing-base errors."""
+        frame = encode_frame(self.codes)
+        corrupt = bytearray(frame)
+        corrupt[-1] ^= 0xFF
+        with pytest.raises(ValueError, match="checksum"):
+            decode_frame(corrupt)
+        with pytest.raises(ValueError, match="magic"):
+            decode_frame(b'XXXX' + bytes(frame[4:]))
+        with pytest.raises(ValueError, match="truncated"):
+            decode_frame(frame[:-1])
+        with pytest.raises(ValueError):
+            decode_frame(encode_frame(self.next_codes, previous=self.codes))
+
+    @pytest.mark.parametrize("delta", [False, True])
+    def test_out_of_range_codes_rejected(self, delta):
+        """Verify decoded codes must lie below the header resolution's level count."""
+        levels = phase_levels(0.1)
+        bad = self.codes.copy()
+        bad[1, 2, 3] = levels
+        previous = np.zeros_like(self.codes) if delta else None
+        frame = encode_frame(bad, resolution_deg=0.1, previous=previous)
+        with pytest.raises(ValueError, match="outside"):
+            decode_frame(frame, previous=previous)
+
+    def test_stream_with_keyframes(self):
+        """Verify an encoder/decoder pair round-trips a slew stream split from one buffer."""
+        encoder = PhaseFrameEncoder(keyframe_interval=4)
+        frames = [frame for _, frame in self.mod.iter_slew((0, 0, 1), (1, 0, 0), 1e-5, quantized=True)]
+        stream = b''.join(bytes(encoder.encode(frame)) for frame in frames)
+
+        decoder = PhaseFrameDecoder()
+        headers = []
+        for view, expected in zip(iter_frames(stream), frames):
+            header, codes = decoder.decode(view)
+            headers.append(header)
+            assert np.array_equal(codes, expected)
+        assert len(headers) == len(frames) == 10
+        assert [h.delta for h in headers[:5]] == [False, True, True, True, False]
+
+        # A delta frame out of sequence is refused
+        with pytest.raises(ValueError, match="does not follow"):
+            PhaseFrameDecoder().decode(list(iter_frames(stream))[1])
+
+    def test_keyframe_interval_validated(self):
+        """Verify intervals below one are refused and an interval of one sends only keyframes."""
+        for interval in (0, -3):
+            with pytest.raises(ValueError, match="Keyframe interval"):
+                PhaseFrameEncoder(keyframe_interval=interval)
+
+        encoder = PhaseFrameEncoder(keyframe_interval=1)
+        frames = [encoder.encode(codes) for codes in (self.codes, self.next_codes, self.codes)]
+        assert not any(read_frame_header(frame).delta for frame in frames)
+
+    @pytest.mark.parametrize("mode", [{}, {'compact_phases': True}, {'channel_group': (10, 5, 5)}])
+    def test_modulator_frames(self, mode):
+        """Verify a modulator's frame loads into another in every phase storage mode."""
+        array = CasimirArraySpecs(dimensions=(30, 20, 10))
+        source = GravityModulator(array_size_cm=1.0, array=array, **mode)
+        target = GravityModulator(array_size_cm=1.0, array=array, **mode)
+        source.activate(direction=(0.3, 0.1, 1), power_MW=1.0)
+
+        header = target.load_phase_frame(source.phase_frame(sequence=3))
+        assert header.sequence == 3
+        assert header.dimensions == source.channel_shape
+        assert np.array_equal(target.phase_codes, source.phase_codes)
+
+    @pytest.mark.parametrize("mode", [{}, {'compact_phases': True}, {'channel_group': (10, 5, 5)}])
+    def test_mismatched_frame_shape_rejected(self, mode):
+        """Verify frames for another grid are refused without touching the phase state."""
+        target = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(30, 20, 10)),
+                                  **mode)
+        before = target.phase_codes.copy()
+        with pytest.raises(ValueError, match="Frame shape"):
+            target.load_phase_frame(encode_frame(np.zeros((4, 4, 4), dtype=np.uint16)))
+        assert np.array_equal(target.phase_codes, before)
+
+    def test_lazy_modulator_refuses_frames(self):
+        """Verify loading a frame does not silently densify a lazy modulator."""
+        array = CasimirArraySpecs(dimensions=(30, 20, 10))
+        source = GravityModulator(array_size_cm=1.0, array=array)
+        target = GravityModulator(array_size_cm=1.0, array=array, lazy_phases=True)
+        source.activate(direction=(0.3, 0.1, 1), power_MW=1.0)
+
+        with pytest.raises(ValueError, match="Lazy"):
+            target.load_phase_frame(source.phase_frame())
+        assert isinstance(target.phase_matrix, PhaseField)
+
+
+class TestPhaseMoments:
+    """Test suite for streaming phase-coherence statistics."""
+
+    def setup_method(self):
+        """Build a small modulator and reference direction."""
+        self.direction = (0.3, -0.2, 0.9)
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(37, 23, 11)))
+
+    def test_blockwise_matches_numpy(self):
+        """Verify merged block moments match a two-pass computation."""
+        data = np.random.default_rng(1).uniform(0, 2 * np.pi, 10_001)
+        moments = PhaseMoments()
+        for block in np.array_split(data, 7):
+            moments.update(block)
+
+        assert moments.count == data.size
+        assert np.isclose(moments.mean, data.mean(), rtol=1e-12)
+        assert np.isclose(moments.std, data.std(), rtol=1e-12)
+
+    def test_merge_shards(self):
+        """Verify shard accumulators merge to the whole-array result."""
+        data = np.random.default_rng(2).normal(3.0, 0.5, 5000)
+        left, right = PhaseMoments(), PhaseMoments()
+        left.update(data[:1234])
+        right.update(data[1234:])
+        left.merge(right)
+        left.merge(PhaseMoments())  # Empty shards are a no-op
+
+        assert np.isclose(left.std, data.std(), rtol=1e-12)
+
+    def test_synthesis_collects_moments(self, monkeypatch):
+        """Verify pattern synthesis yields its statistics in the same pass."""
+        import gravity_modulator
+        monkeypatch.setattr(gravity_modulator, 'PHASE_STATS_SLAB_PLATES', 300)
+
+        moments = PhaseMoments()
+        phases = self.mod.calculate_phase_pattern(self.direction, moments=moments)
+        assert np.array_equal(phases, self.mod.calculate_phase_pattern(self.direction))
+        assert np.isclose(moments.std, np.std(phases), rtol=1e-12)
+
+    def test_tiles_collect_moments(self):
+        """Verify streamed tiles accumulate the full-pattern statistics."""
+        moments = PhaseMoments()
+        for _ in self.mod.iter_phase_tiles(self.direction, (5, 4, 3), moments=moments):
+            pass
+        phases = self.mod.calculate_phase_pattern(self.direction)
+        assert moments.count == phases.size
+        assert np.isclose(moments.std, np.std(phases), rtol=1e-12)
+
+    def test_activate_coherence_all_modes(self):
+        """Verify activate() reports the same coherence as np.std in every mode."""
+        dense = GravityModulator(array_size_cm=1.0, array=self.mod.array)
+        compact = GravityModulator(array_size_cm=1.0, array=self.mod.array, compact_phases=True)
+        lazy = GravityModulator(array_size_cm=1.0, array=self.mod.array, lazy_phases=True)
+
+        expected = np.std(self.mod.calculate_phase_pattern(self.direction))
+        for mod in (dense, lazy):
+            # Repeat so the cache-hit path is exercised as well
+            for _ in range(2):
+                result = mod.activate(direction=self.direction, power_MW=1.0)
+                assert np.isclose(result['phase_coherence'], expected, rtol=1e-12)
+
+        scale = 2 * np.pi / phase_levels(compact.array.phase_resolution_deg)
+        result = compact.activate(direction=self.direction, power_MW=1.0)
+        assert np.isclose(result['phase_coherence'], np.std(compact.phase_codes) * scale,
+                          rtol=1e-12)
+
+    def test_lazy_field_sampled_estimate(self):
+        """Verify large lazy fields fall back to a seeded sampled estimate."""
+        field = PhaseField(self.direction, self.mod.array.plate_spacing_m,
+                           self.mod.array.dimensions)
+        exact = field.coherence()
+        sampled = field.coherence(max_plates=100)
+
+        assert sampled == field.coherence(max_plates=100)  # Reproducible
+        assert abs(sampled - exact) < 0.05 * exact
+
+
+class TestFarField:
+    """Test suite for the FFT array-factor engine."""
+
+    def setup_method(self):
+        """Build a small array whose steering lands exactly on FFT bins."""
+        self.array = CasimirArraySpecs(dimensions=(10, 8, 5))
+        self.direction = (100.0, 125.0, 200.0)  # One bin along each axis
+
+    def test_on_grid_beam_is_ideal(self):
+        """Verify a bin-aligned ramp puts all power in the main lobe."""
+        mod = GravityModulator(array_size_cm=1.0, array=self.array)
+        phases = mod.calculate_phase_pattern(self.direction)
+        result = array_factor(phases, self.direction)
+
+        assert result['target_bin'] == (1, 1, 1)
+        assert result['peak_bin'] == (1, 1, 1)
+        assert np.isclose(result['main_lobe_efficiency'], 1.0, atol=1e-5)
+        assert result['side_lobe_level_db'] < -60
+
+    def test_efficiency_independent_of_grid(self):
+        """Verify oversampling refines side lobes without moving the peak gain."""
+        mod = GravityModulator(array_size_cm=1.0, array=self.array)
+        phases = mod.calculate_phase_pattern(self.direction)
+        coarse = array_factor(phases, self.direction)
+        fine = array_factor(phases, self.direction, grid_shape=(20, 16, 10))
+
+        assert fine['target_bin'] == (2, 2, 2)
+        assert np.isclose(fine['main_lobe_efficiency'], coarse['main_lobe_efficiency'], atol=1e-5)
+        assert fine['side_lobe_level_db'] > coarse['side_lobe_level_db']
+
+        with pytest.raises(ValueError):
+            array_factor(phases, self.direction, grid_shape=(5, 8, 5))
+
+    def test_incoherent_phases_lose_efficiency(self):
+        """Verify random phases scatter power out of the main lobe."""
+        phases = np.random.default_rng(3).uniform(0, 2 * np.pi, self.array.dimensions)
+        result = array_factor(phases, self.direction)
+        assert result['main_lobe_efficiency'] < 0.1
+
+    def test_quantization_costs_efficiency(self):
+        """Verify coarse phase quantization is reflected in the far field."""
+        coarse = CasimirArraySpecs(dimensions=(10, 8, 5), phase_resolution_deg=90.0)
+        mod = GravityModulator(array_size_cm=1.0, array=coarse)
+        mod.activate(direction=self.direction)
+
+        exact = mod.far_field(quantized=False)
+        quantized = mod.far_field()
+        assert quantized['main_lobe_efficiency'] < exact['main_lobe_efficiency']
+
+    def test_activate_uses_measured_efficiency(self):
+        """Verify activation reports far-field figures when enabled."""
+        direction = (0.3, -0.2, 0.9)
+        nominal = GravityModulator(array_size_cm=1.0, array=self.array)
+        measured = GravityModulator(array_size_cm=1.0, array=self.array, measure_far_field=True)
+
+        base = nominal.activate(direction=direction)
+        result = measured.activate(direction=direction)
+        assert 'main_lobe_efficiency' not in base
+
+        efficiency = result['main_lobe_efficiency']
+        assert 0 < efficiency <= 1
+        assert np.isclose(result['thrust_N'],
+                          np.linalg.norm(direction) * measured.total_force() * efficiency)
+
+
+class TestToleranceAnalysis:
+    """Test suite for Monte Carlo yield analysis."""
+
+    def setup_method(self):
+        """Define a representative set of manufacturing tolerances."""
+        self.tolerances = [
+            Tolerance('bragg_enhancement', 0.05),
+            Tolerance('plasmonic_enhancement', 0.08, distribution='uniform'),
+            Tolerance('plate_spacing_nm', 0.02, distribution='lognormal'),
+            Tolerance('reflectivity', 2e-5, relative=False, bounds=(0.0, 1.0)),
+        ]
+
+    def test_nominal_matches_force_model(self):
+        """Verify zero scatter reproduces the modulator's thrust."""
+        mod = GravityModulator(array_size_cm=1.0)
+        result = monte_carlo_thrust([], samples=1000)
+        expected = mod.total_force() * NOMINAL_EFFICIENCY
+
+        assert np.isclose(result['nominal_thrust_N'], expected, rtol=1e-12)
+        assert np.isclose(result['thrust_N']['percentiles'][50], expected, rtol=1e-3)
+        assert result['thrust_N']['std'] < 1e-9 * expected
+
+    def test_percentiles_match_exact(self):
+        """Verify streamed percentiles agree with a full in-memory sort."""
+        result = monte_carlo_thrust(self.tolerances[:3], samples=50_000, seed=7, chunk_size=4096)
+
+        streams = [np.random.default_rng(s) for s in np.random.SeedSequence(7).spawn(3)]
+        bragg = streams[0].normal(850.0, 42.5, 50_000)
+        plasmonic = streams[1].uniform(380.0 * 0.92, 380.0 * 1.08, 50_000)
+        spacing_nm = 100.0 * streams[2].lognormal(0.0, 0.02, 50_000)
+        mod = GravityModulator(array_size_cm=1.0)
+        thrust = mod.total_force(d=spacing_nm * 1e-9, gamma=bragg * plasmonic * 3.7) * NOMINAL_EFFICIENCY
+
+        for q, value in result['thrust_N']['percentiles'].items():
+            assert np.isclose(value, np.percentile(thrust, q), rtol=5e-4)
+        assert np.isclose(result['thrust_N']['std'], thrust.std(), rtol=1e-9)
+        assert np.isclose(result['thrust_N']['max'], thrust.max(), rtol=1e-12)
+
+    def test_reproducible_across_chunk_sizes(self):
+        """Verify the seed alone determines the samples."""
+        a = monte_carlo_thrust(self.tolerances, samples=30_000, seed=1, chunk_size=1000)
+        b = monte_carlo_thrust(self.tolerances, samples=30_000, seed=1, chunk_size=30_000)
+        c = monte_carlo_thrust(self.tolerances, samples=30_000, seed=2)
+
+        assert a['thrust_N']['percentiles'] == b['thrust_N']['percentiles']
+        assert np.isclose(a['thrust_N']['mean'], b['thrust_N']['mean'], rtol=1e-12)
+        assert a['thrust_N']['percentiles'] != c['thrust_N']['percentiles']
+
+    def test_yield_and_validation(self):
+        """Verify the yield fraction and rejection of unknown fields."""
+        result = monte_carlo_thrust(self.tolerances, samples=20_000,
+                                    min_thrust_N=0.0)
+        assert result['yield'] == 1.0
+
+        nominal = result['nominal_thrust_N']
+        result = monte_carlo_thrust(self.tolerances, samples=20_000, min_thrust_N=nominal)
+        assert 0.3 < result['yield'] < 0.7
+
+        with pytest.raises(ValueError):
+            monte_carlo_thrust([Tolerance('plate_material', 0.1)], samples=10)
+
+
 class TestMetamaterialSpecs:
     """Test suite for metamaterial specifications."""
     
@@ -215,6 +1086,76 @@ class TestMetamaterialSpecs:
             assert meta.bragg_enhancement > 0
 
 
+class TestFrozenSpecs:
+    """Test suite for the immutable, slotted spec variants."""
+
+    def test_freeze_round_trip(self):
+        """Verify freezing keeps every field and precomputes derived values."""
+        meta = MetamaterialSpecs(bragg_enhancement=900.0)
+        array = CasimirArraySpecs(dimensions=(4, 5, 6), plate_spacing_nm=50.0)
+        frozen_meta, frozen_array = meta.freeze(), array.freeze()
+
+        assert frozen_meta.total_enhancement == meta.total_enhancement
+        assert frozen_array.total_plates == 120
+        assert frozen_array.plate_spacing_m == array.plate_spacing_m
+        assert frozen_meta.thaw() == meta
+        assert frozen_array.thaw() == array
+
+        scaling = ScalingArchitecture()
+        assert scaling.tile.freeze().thaw() == scaling.tile
+
+    def test_immutable_and_slotted(self):
+        """Verify assignment is rejected and no per-instance dict exists."""
+        import dataclasses
+
+        spec = FrozenCasimirArraySpecs()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.plate_spacing_nm = 1.0
+        assert not hasattr(spec, '__dict__')
+
+        changed = dataclasses.replace(spec, plate_spacing_nm=50.0)
+        assert changed.plate_spacing_m == CasimirArraySpecs(plate_spacing_nm=50.0).plate_spacing_m
+
+    def test_slots_fallback_for_older_pythons(self):
+        """Verify the pre-3.10 slotted rebuild is frozen, dict-free and picklable."""
+        import dataclasses
+        import pickle
+        import gravity_modulator
+
+        spec = gravity_modulator._slotted(
+            dataclasses.dataclass(frozen=True)(type('Spec', (), {
+                '__annotations__': {'a': int, 'b': tuple}, 'a': 1, 'b': (2, 3)})))()
+        assert spec.a == 1 and spec.b == (2, 3)
+        assert not hasattr(spec, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.a = 5
+        assert dataclasses.replace(spec, a=4).a == 4
+
+        frozen = FrozenCasimirArraySpecs(dimensions=(4, 5, 6))
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert restored == frozen and restored.total_plates == 120
+
+    def test_hashable_cache_keys(self):
+        """Verify equal specs hash equally, including list-built dimensions."""
+        a = FrozenCasimirArraySpecs(dimensions=[10, 10, 10])
+        b = CasimirArraySpecs(dimensions=(10, 10, 10)).freeze()
+        cache = {a: 'computed'}
+
+        assert a == b and hash(a) == hash(b)
+        assert cache[b] == 'computed'
+        assert FrozenMetamaterialSpecs() in {MetamaterialSpecs().freeze()}
+
+    def test_modulator_accepts_frozen_specs(self):
+        """Verify the engine runs unchanged on frozen specs."""
+        array = CasimirArraySpecs(dimensions=(8, 8, 8))
+        mutable = GravityModulator(array_size_cm=1.0, array=array)
+        frozen = GravityModulator(array_size_cm=1.0, metamaterial=MetamaterialSpecs().freeze(),
+                                  array=array.freeze())
+
+        assert frozen.activate()['thrust_N'] == mutable.activate()['thrust_N']
+        assert np.array_equal(frozen.phase_matrix, mutable.phase_matrix)
+
+
 class TestNumericalStability:
     """Test suite for numerical stability."""
     
@@ -250,10 +1191,3 @@ class TestNumericalStability:
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
-```
-
----
-
-ONE FILE. ONE BLOCK. ✅
-
-Want FILE 9 next?
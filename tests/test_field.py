@@ -3,6 +3,8 @@
 Unit tests for gravitational field equations and thrust calculations.
 """
 
+import logging
+import tracemalloc
 import numpy as np
 import pytest
 import sys
@@ -11,7 +13,11 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from gravity_modulator import GravityModulator, LiftTest, ScalingArchitecture
+import gravity_modulator
+from gravity_modulator import (GravityModulator, LiftTest, ScalingArchitecture, CasimirArraySpecs,
+                               StageProfiler, LiftProfiles, simulate_lift, gravity_at, ModulatorFleet,
+                               ControlTree, ControlCommand, ControlLoop, SimulatedClock,
+                               latency_budget)
 
 
 class TestGravitationalField:
@@ -146,6 +152,148 @@ class TestThrustCalculations:
         assert abs(result['direction'][1]) < 0.001, f"Y-axis thrust too high: {result['direction'][1]}"
 
 
+class TestBatchSteering:
+    """Test suite for vectorized batch steering."""
+
+    def setup_method(self):
+        """Initialize a small modulator."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(20, 15, 10)))
+
+    def test_batch_matches_activate(self):
+        """Verify each batch entry matches a single activation."""
+        rng = np.random.default_rng(0)
+        directions = rng.normal(size=(6, 3))
+        powers = np.linspace(0.1, 1.0, 6)
+
+        batch = self.mod.activate_batch(directions, powers)
+
+        for n in range(len(directions)):
+            single = self.mod.activate(direction=tuple(directions[n]), power_MW=powers[n])
+            assert np.isclose(batch['thrust_N'][n], single['thrust_N'])
+            assert np.isclose(batch['thrust_per_MW'][n], single['thrust_per_MW'])
+            assert np.isclose(batch['phase_coherence'][n], single['phase_coherence'])
+            assert np.allclose(batch['thrust_vector'][n], self.mod.thrust_vector)
+
+    def test_batch_matches_measured_far_field(self):
+        """Verify measured efficiency is used per direction, as activate() does."""
+        mod = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(20, 15, 10)),
+                               measure_far_field=True)
+        directions = [(0, 0, 1), (0.3, 0.2, 0.9), (0, 0, 1)]
+        batch = mod.activate_batch(directions, 1.0)
+
+        for n, direction in enumerate(directions):
+            single = mod.activate(direction=direction, power_MW=1.0)
+            assert np.isclose(batch['thrust_N'][n], single['thrust_N'], rtol=1e-12)
+            assert batch['main_lobe_efficiency'][n] == single['main_lobe_efficiency']
+        assert batch['main_lobe_efficiency'][1] < gravity_modulator.NOMINAL_EFFICIENCY
+
+    @pytest.mark.parametrize("mode", [{'lazy_phases': True}, {'channel_group': (4, 5, 3)}])
+    def test_batch_coherence_matches_field_modes(self, mode):
+        """Verify lazy and grouped batches report the same coherence as activate()."""
+        mod = GravityModulator(array_size_cm=1.0,
+                               array=CasimirArraySpecs(dimensions=(20, 15, 10)), **mode)
+        directions = [(0.3, -0.7, 0.2), (1, 1, 0)]
+        batch = mod.activate_batch(directions, 1.0)['phase_coherence']
+        for n, direction in enumerate(directions):
+            assert np.isclose(batch[n], mod.activate(direction=direction, power_MW=1.0)['phase_coherence'])
+
+    def test_lazy_batch_coherence_is_bounded(self, monkeypatch):
+        """Verify a lazy batch never streams a huge grid."""
+        mod = GravityModulator(lazy_phases=True, array=CasimirArraySpecs(dimensions=(10**5,) * 3))
+
+        def full_pass(*args):
+            raise AssertionError("lazy batch streamed every plate")
+        monkeypatch.setattr(gravity_modulator, 'phase_statistics', full_pass)
+        coherence = mod.activate_batch([(0, 0, 1), (0.3, 0.2, 0.9)], 1.0)['phase_coherence']
+        assert np.all(np.isfinite(coherence)) and np.all(coherence > 0)
+
+    def test_batch_does_not_touch_state(self):
+        """Verify batch evaluation leaves the modulator inactive."""
+        self.mod.activate_batch([(0, 0, 1), (1, 0, 0)], 0.5)
+
+        assert self.mod.active == False
+        assert self.mod.power_input_MW == 0.0
+        assert np.all(self.mod.thrust_vector == 0)
+
+    def test_small_slabs_give_same_statistics(self, monkeypatch):
+        """Verify slab-wise moment merging is independent of slab size."""
+        directions = np.array([(0.3, -0.7, 0.2), (1, 1, 0)])
+        expected = self.mod.activate_batch(directions, 1.0)['phase_coherence']
+
+        monkeypatch.setattr(gravity_modulator, 'PHASE_SLAB_PLATES', 7)
+        result = self.mod.activate_batch(directions, 1.0)['phase_coherence']
+
+        assert np.allclose(result, expected)
+
+
+class TestModulatorFleet:
+    """Test suite for the struct-of-arrays modulator fleet."""
+
+    def setup_method(self):
+        """Build a small fleet with random positions."""
+        rng = np.random.default_rng(5)
+        self.positions = rng.normal(size=(6, 3))
+        self.directions = rng.normal(size=(6, 3))
+        self.fleet = ModulatorFleet(6, self.positions)
+
+    def test_matches_individual_modulators(self):
+        """Verify per-unit thrust equals GravityModulator.activate()."""
+        self.fleet.activate(self.directions, 0.5)
+
+        for i, direction in enumerate(self.directions):
+            mod = GravityModulator()
+            mod.activate(direction=tuple(direction), power_MW=0.5)
+            assert np.allclose(self.fleet.thrust_vectors[i], mod.thrust_vector, rtol=1e-12)
+
+        mirrored = ModulatorFleet.from_modulators([mod], self.positions[-1:])
+        assert np.allclose(mirrored.thrust_vectors, self.fleet.thrust_vectors[-1:])
+
+    def test_selective_activation(self):
+        """Verify unit selectors update only the chosen units."""
+        self.fleet.activate((0, 0, 1), 1.0, units=[1, 3])
+        status = self.fleet.status()
+        assert status['active_units'] == 2
+        assert status['total_power_MW'] == 2.0
+
+        self.fleet.activate(self.directions[:2], 0.5, units=slice(4, 6))
+        self.fleet.deactivate(units=np.array([False, True, False, False, False, False]))
+        assert self.fleet.active.tolist() == [False, False, False, True, True, True]
+        assert np.all(self.fleet.thrust_vectors[1] == 0)
+        assert np.allclose(self.fleet.directions[4:], self.directions[:2])
+
+    def test_single_unit_activation(self):
+        """Verify an integer selector accepts a (3,) or single-row direction."""
+        self.fleet.activate(self.directions[2], 0.5, units=2)
+        self.fleet.activate(self.directions[4:5], 0.25, units=np.int64(4))
+        assert self.fleet.active.tolist() == [False, False, True, False, True, False]
+        assert np.allclose(self.fleet.directions[[2, 4]], self.directions[[2, 4]])
+        assert self.fleet.powers_MW[4] == 0.25
+        assert np.all(self.fleet.thrust_vectors[[0, 1, 3, 5]] == 0)
+
+    def test_net_thrust_and_torque(self):
+        """Verify net thrust and torque against a direct sum of cross products."""
+        self.fleet.activate(self.directions, 1.0)
+        com = np.array([0.3, -0.1, 0.2])
+
+        forces = self.fleet.thrust_vectors
+        assert np.allclose(self.fleet.net_thrust(), forces.sum(axis=0))
+        assert np.allclose(self.fleet.net_torque(com),
+                           np.cross(self.positions - com, forces).sum(axis=0))
+
+    def test_symmetric_vehicle_has_no_torque(self):
+        """Verify mirrored units lifting together produce pure thrust."""
+        positions = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0)]
+        fleet = ModulatorFleet(4, positions)
+        fleet.activate((0, 0, 1), 0.5)
+
+        assert np.allclose(fleet.net_torque(), 0)
+        assert np.isclose(fleet.status()['net_thrust_N'], 4 * fleet.status()['unit_thrust_N'][0])
+
+        fleet.deactivate(units=0)
+        assert fleet.net_torque()[1] > 0
+
+
 class TestLiftTest:
     """Test suite for lift demonstrations."""
     
@@ -203,6 +351,200 @@ class TestLiftTest:
         assert improvement > 100, f"Expected >100x improvement, got {improvement:.0f}x"
 
 
+class TestTrajectory:
+    """Test suite for the vectorized lift trajectory simulator."""
+
+    def test_low_altitude_matches_closed_form(self):
+        """Verify short lifts match constant-gravity kinematics."""
+        profiles = LiftProfiles(mass_kg=100.0, thrust_N=1500.0, power_MW=0.02, target_m=10.0)
+        acceleration = 1500.0 / 100.0 - 9.81
+
+        for method in ('rk4', 'adaptive'):
+            result = simulate_lift(profiles, method=method)
+            assert np.isclose(result['time_s'][0], np.sqrt(2 * 10.0 / acceleration), rtol=1e-5)
+            assert np.isclose(result['velocity_m_s'][0], np.sqrt(2 * acceleration * 10.0), rtol=1e-5)
+            assert np.isclose(result['energy_J'][0], 0.02e6 * result['time_s'][0])
+
+    def test_methods_agree_across_batch(self):
+        """Verify adaptive and fixed-step results agree for a mixed batch."""
+        rng = np.random.default_rng(4)
+        profiles = LiftProfiles(mass_kg=rng.uniform(10, 150, 200), thrust_N=1553.0,
+                                power_MW=0.01, target_m=rng.uniform(1, 2e5, 200))
+        fixed = simulate_lift(profiles, method='rk4', dt=0.05)
+        adaptive = simulate_lift(profiles, method='adaptive')
+
+        assert fixed['success'].all() and adaptive['success'].all()
+        assert np.allclose(adaptive['time_s'], fixed['time_s'], rtol=1e-6)
+        assert adaptive['steps'] < fixed['steps'] / 10
+
+        # Batched results equal solo runs
+        solo = simulate_lift(LiftProfiles(profiles.mass_kg[7], 1553.0, 0.01, profiles.target_m[7]))
+        assert np.isclose(solo['time_s'][0], adaptive['time_s'][7], rtol=1e-9)
+
+    def test_weakening_gravity_shortens_climb(self):
+        """Verify altitude-dependent gravity beats the constant-g estimate."""
+        assert gravity_at(200e3) < gravity_at(0.0)
+
+        profiles = LiftProfiles(mass_kg=100.0, thrust_N=1500.0, power_MW=0.02, target_m=200e3)
+        result = simulate_lift(profiles)
+        assert result['time_s'][0] < np.sqrt(2 * 200e3 / (15.0 - 9.81))
+
+        # Work done against inverse-square gravity plus kinetic energy at arrival
+        radius = gravity_modulator.EARTH_RADIUS_M
+        expected = (100.0 * 9.81 * radius * 200e3 / (radius + 200e3)
+                    + 0.5 * 100.0 * result['velocity_m_s'][0]**2)
+        assert np.isclose(result['mechanical_energy_J'][0], expected)
+
+    def test_infeasible_and_timeout(self):
+        """Verify grounded and unfinished profiles are reported as failures."""
+        profiles = LiftProfiles(mass_kg=[100.0, 200.0, 100.0], thrust_N=1500.0,
+                                power_MW=0.02, target_m=[10.0, 10.0, 1e6])
+        result = simulate_lift(profiles, max_time_s=60.0)
+
+        assert result['success'].tolist() == [True, False, False]
+        assert np.isnan(result['time_s'][1:]).all()
+        assert result['energy_J'][1] == 0.0
+
+        with pytest.raises(ValueError):
+            simulate_lift(profiles, method='euler')
+
+    def test_lift_profiles_from_modulator(self):
+        """Verify LiftTest sizes power per payload and integrates the batch."""
+        lift = LiftTest(GravityModulator(array_size_cm=1.0))
+        results = lift.lift_profiles([10.0, 50.0], 10.0)
+
+        assert results['success'].all()
+        assert np.allclose(results['required_power_MW'], np.array([10.0, 50.0]) * 9.81 / 77_000)
+        assert results['time_s'][0] < results['time_s'][1]
+
+
+class TestReporting:
+    """Test suite for verbosity control and structured logging."""
+
+    def teardown_method(self):
+        """Restore the module-level default and detach any console handler."""
+        gravity_modulator.set_verbose(False)
+        for handler in list(gravity_modulator.logger.handlers):
+            if not isinstance(handler, logging.NullHandler):
+                gravity_modulator.logger.removeHandler(handler)
+        gravity_modulator.logger.setLevel(logging.NOTSET)
+
+    def test_quiet_by_default(self, capsys):
+        """Verify library calls print nothing unless asked to."""
+        mod = GravityModulator(array_size_cm=1.0)
+        mod.activate()
+        mod.deactivate()
+
+        assert capsys.readouterr().out == ""
+
+    def test_library_installs_only_null_handler(self, capsys):
+        """Verify verbose messages need an application or script handler to be shown."""
+        assert all(isinstance(h, logging.NullHandler) for h in gravity_modulator.logger.handlers)
+
+        GravityModulator(array_size_cm=1.0, verbose=True)
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_flag_echoes_messages(self, capsys):
+        """Verify verbose=True with log_to_console keeps the original console output."""
+        gravity_modulator.log_to_console()
+        assert gravity_modulator.log_to_console() is gravity_modulator.log_to_console()
+        mod = GravityModulator(array_size_cm=1.0, verbose=True)
+        mod.activate(power_MW=0.5)
+
+        out = capsys.readouterr().out
+        assert "\n🔧 GRAVITY MODULATOR INITIALIZED\n" in out
+        assert f"   Total plates: {mod.array.total_plates:,}\n" in out
+        assert "   Power: 0.5 MW\n" in out
+        assert out.count("INITIALIZED") == 1
+
+    def test_module_setting(self, capsys):
+        """Verify set_verbose changes the default and the flag overrides it."""
+        gravity_modulator.log_to_console()
+        gravity_modulator.set_verbose(True)
+        GravityModulator(array_size_cm=1.0)
+        assert "INITIALIZED" in capsys.readouterr().out
+
+        GravityModulator(array_size_cm=1.0, verbose=False)
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_messages_reach_application_logging_once(self, caplog):
+        """Verify verbose records honour levels and propagate to application handlers once."""
+        with caplog.at_level(logging.WARNING):
+            GravityModulator(array_size_cm=1.0, verbose=True)
+        assert caplog.records == []
+
+        with caplog.at_level(logging.INFO):
+            GravityModulator(array_size_cm=1.0, verbose=True)
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages.count("\n🔧 GRAVITY MODULATOR INITIALIZED") == 1
+
+    def test_quiet_messages_are_logged_at_debug(self, caplog):
+        """Verify quiet messages remain available through logging."""
+        with caplog.at_level(logging.DEBUG, logger="gravity_modulator"):
+            GravityModulator(array_size_cm=1.0)
+
+        messages = [r.getMessage() for r in caplog.records if r.levelno == logging.DEBUG]
+        assert "   Array size: 1.0cm³" in messages
+
+
+class TestStageProfiler:
+    """Test suite for per-stage activation instrumentation."""
+
+    def setup_method(self):
+        """Initialize a small modulator."""
+        self.mod = GravityModulator(array_size_cm=1.0,
+                                    array=CasimirArraySpecs(dimensions=(10, 10, 10)))
+
+    def test_disabled_by_default(self):
+        """Verify activation results are unchanged without a profiler."""
+        result = self.mod.activate()
+        assert 'stages' not in result
+
+    def test_stage_record_per_call(self):
+        """Verify each activation reports its named stages."""
+        self.mod.profiler = StageProfiler()
+        result = self.mod.activate(direction=(1, 0, 0))
+
+        stages = result['stages']['stages']
+        assert set(stages) == {'report', 'phase_synthesis', 'force', 'phase_coherence'}
+        assert stages['report']['entries'] == 2
+        assert sum(e['seconds'] for e in stages.values()) <= result['stages']['total_seconds']
+        assert self.mod.profiler.last is result['stages']
+
+    def test_summary_aggregates_calls(self):
+        """Verify histograms aggregate every recorded call."""
+        profiler = StageProfiler()
+        self.mod.profiler = profiler
+        for _ in range(5):
+            self.mod.activate()
+
+        summary = profiler.summary()
+        assert profiler.calls == 5
+        assert summary['total']['count'] == 5
+        assert sum(summary['phase_synthesis']['histogram']['counts']) == 5
+        assert summary['force']['min'] <= summary['force']['p50'] <= summary['force']['max']
+
+    def test_allocation_tracing(self):
+        """Verify tracemalloc deltas are recorded and tracing is restored."""
+        self.mod.profiler = StageProfiler(trace_allocations=True)
+        result = self.mod.activate(direction=(0, 1, 0))
+
+        synthesis = result['stages']['stages']['phase_synthesis']
+        if hasattr(tracemalloc, 'reset_peak'):
+            assert synthesis['peak_bytes'] >= self.mod.phase_matrix.nbytes
+        assert 'alloc_blocks' in synthesis
+        assert not tracemalloc.is_tracing()
+
+    def test_allocation_tracing_without_reset_peak(self, monkeypatch):
+        """Verify Python 3.8's tracemalloc (no reset_peak) drops only the peak."""
+        monkeypatch.delattr(tracemalloc, 'reset_peak', raising=False)
+        self.mod.profiler = StageProfiler(trace_allocations=True)
+        synthesis = self.mod.activate(direction=(0, 1, 0))['stages']['stages']['phase_synthesis']
+
+        assert 'peak_bytes' not in synthesis
+        assert 'alloc_bytes' in synthesis and 'alloc_blocks' in synthesis
+
+
 class TestScalingArchitecture:
     """Test suite for scaling architecture."""
     
@@ -266,6 +608,186 @@ class TestScalingArchitecture:
         assert True
 
 
+class TestControlTree:
+    """Test suite for the hierarchical controller model."""
+
+    def test_uniform_tree_matches_level_table(self):
+        """Verify every uniformly commanded node reports its level's thrust."""
+        scaling = ScalingArchitecture()
+        tree = ControlTree()
+
+        assert tree.fanout == [1000, 1000, 1000, 1000]
+        for depth, level in enumerate(tree.levels):
+            assert np.allclose(tree.thrust((depth, 0)), [0, 0, level.thrust_N])
+        assert tree.levels[0] == scaling.megascale
+        assert tree.evaluations == 0
+
+    def test_reduction_over_disabled_units(self):
+        """Verify disabled units are subtracted through the reduction tree."""
+        scaling = ScalingArchitecture()
+        tree = ControlTree(root=scaling.tile)
+        for unit in range(10):
+            tree.set_command((1, unit * 7), ControlCommand(throttle=0.0))
+
+        assert np.isclose(tree.thrust()[2], 990 * scaling.unit_cell.thrust_N)
+
+        tree.clear_command((1, 0))
+        assert np.isclose(tree.thrust()[2], 991 * scaling.unit_cell.thrust_N)
+
+    def test_lazy_evaluation_touches_changed_paths(self):
+        """Verify only subtrees above changed nodes are re-evaluated."""
+        tree = ControlTree()
+        tree.set_command((4, 123_456_789_012), ControlCommand(throttle=0.0))
+        tree.set_command((2, 5), ControlCommand(direction=(1, 0, 0)))
+        tree.thrust()
+        # Root, the two arrays holding overrides, and the panel and tile above
+        # the disabled unit; panel 5 itself is uniform and needs no expansion
+        assert tree.evaluations == 5
+
+        before = tree.evaluations
+        tree.thrust()
+        assert tree.evaluations == before  # Fully memoized
+
+        tree.set_command((4, 123_456_789_013), ControlCommand(throttle=0.0))
+        tree.thrust()
+        assert tree.evaluations == before + 4  # One path from tile to root
+
+    def test_fan_out_and_inheritance(self):
+        """Verify commands fan out and overrides shadow only their subtree."""
+        tree = ControlTree(root=ScalingArchitecture().panel)
+        tilted = ControlCommand(direction=(0.6, 0.0, 0.8))
+        tree.set_command((1, 3), tilted)
+
+        commands = dict(tree.fan_out((0, 0)))
+        assert commands[(1, 3)] == tilted
+        assert commands[(1, 4)] == ControlCommand()
+        assert tree.effective_command((2, 3 * 1000 + 17)) == tilted
+
+        with pytest.raises(IndexError):
+            tree.set_command((1, 1000), tilted)
+
+    def test_phase_block_composes_overrides(self):
+        """Verify a node's phases follow each child's effective command."""
+        tree = ControlTree(root=ScalingArchitecture().tile)
+        tilted = ControlCommand(direction=(0.6, 0.0, 0.8))
+        tree.set_command((1, 1), tilted)  # Unit at grid (0, 0, 1)
+
+        phases = tree.phase_block((0, 0))
+        spacing = tree.plate_spacing_m
+        assert phases.shape == (100, 100, 100)
+
+        upright = GravityModulator(array_size_cm=1.0, array=CasimirArraySpecs(dimensions=(100, 100, 100)))
+        expected = upright.calculate_phase_pattern((0, 0, 1))
+        assert np.allclose(phases[:, :, 20:], expected[:, :, 20:])
+
+        unit = tree.phase_block((1, 1))
+        assert tree.plate_origin((1, 1)) == (0, 0, 10)
+        assert np.allclose(phases[:10, :10, 10:20], unit)
+        assert not np.allclose(unit, expected[:10, :10, 10:20])
+
+        with pytest.raises(ValueError):
+            ControlTree().phase_block((0, 0))
+
+    def test_nested_override_inside_non_root_node(self):
+        """Verify deep overrides are placed correctly under any parent."""
+        tree = ControlTree(root=ScalingArchitecture().panel)
+        tree.set_command((2, 5003), ControlCommand(direction=(1, 0, 0)))
+
+        tile = tree.phase_block((1, 5))
+        unit = tree.phase_block((2, 5003))
+        offset = np.subtract(tree.plate_origin((2, 5003)), tree.plate_origin((1, 5)))
+        assert np.allclose(tile[offset[0]:offset[0] + 10, offset[1]:offset[1] + 10,
+                                offset[2]:offset[2] + 10], unit)
+
+        tree.clear_command((2, 5003))
+        assert np.allclose(tree.thrust(), [0, 0, tree.levels[0].thrust_N])
+
+
+class TestControlLoop:
+    """Test suite for the fixed-rate steering loop and its latency accounting."""
+    
+    def setup_method(self):
+        """Initialize a small modulator (a Tile-sized controller by plate count)."""
+        self.mod = GravityModulator(array=CasimirArraySpecs(dimensions=(10, 10, 10)))
+    
+    def run(self, loop, **kwargs):
+        import asyncio
+        return asyncio.run(loop.run(**kwargs))
+    
+    def test_latency_budgets(self):
+        """Verify end-to-end budgets sum the §8.3 hops below each level."""
+        scaling = ScalingArchitecture()
+        assert latency_budget(scaling.unit_cell) == pytest.approx(10e-9)
+        assert latency_budget(scaling.panel) == pytest.approx(1.11e-6)
+        assert latency_budget(scaling.megascale) == pytest.approx(111.11e-6)
+    
+    def test_steers_on_schedule(self):
+        """Verify each new direction re-steers the modulator on its own deadline."""
+        clock = SimulatedClock()
+        directions = [(0, 0, 1), (0, 0, 1), (1, 0, 0), None, (0, 1, 0)]
+        loop = ControlLoop(self.mod, directions, rate_hz=100.0, clock=clock)
+        report = self.run(loop)
+        
+        assert report['ticks'] == 5
+        assert report['stages']['steer']['count'] == 3  # Repeats and None hold
+        assert report['overrun_ticks'] == report['skipped_ticks'] == 0
+        assert report['jitter']['max'] == 0.0
+        assert report['elapsed_s'] == pytest.approx(0.05)
+        assert np.allclose(self.mod.phase_matrix, self.mod.calculate_phase_pattern((0, 1, 0)))
+    
+    def test_stage_overruns_against_budget(self):
+        """Verify stage latencies beyond the level budget are counted as overruns."""
+        clock = SimulatedClock(stage_costs={'steer': 50e-9, 'command': 1e-6})
+        loop = ControlLoop(self.mod, lambda tick, now: (tick % 2, 0, 1), rate_hz=1000.0,
+                           level=ScalingArchitecture().panel, clock=clock)
+        report = self.run(loop, ticks=10)
+        
+        steer = report['stages']['steer']
+        assert report['level'] == 'Panel'
+        assert steer['budget_s'] == pytest.approx(1.11e-6) and steer['overruns'] == 0
+        assert steer['mean'] == pytest.approx(50e-9)
+        
+        clock.stage_costs['steer'] = 5e-6
+        report = self.run(loop, ticks=10)
+        assert report['stages']['steer']['overruns'] == 10
+        assert report['stages']['command']['overruns'] == 0  # Unbudgeted
+    
+    def test_tick_overrun_skips_missed_deadlines(self):
+        """Verify a tick longer than the period skips deadlines instead of bursting."""
+        clock = SimulatedClock(stage_costs={'steer': 2.5e-3})
+        loop = ControlLoop(self.mod, lambda tick, now: (tick, 0, 1), rate_hz=1000.0, clock=clock)
+        report = self.run(loop, ticks=4)
+        
+        assert report['overrun_ticks'] == 4
+        assert report['skipped_ticks'] == 4 * 2
+        assert clock.now() == pytest.approx(3 * 3e-3 + 2.5e-3)
+    
+    def test_jitter_histogram(self):
+        """Verify wake-up lateness is recorded and binned deterministically."""
+        rng = np.random.default_rng(7)
+        clock = SimulatedClock(wake_latency=lambda: rng.uniform(0, 1e-4))
+        loop = ControlLoop(self.mod, lambda tick, now: None, rate_hz=1000.0, clock=clock)
+        jitter = self.run(loop, duration_s=0.5)['jitter']
+        
+        assert jitter['count'] == 500
+        assert 0 < jitter['min'] <= jitter['percentiles'][50] <= jitter['max'] < 1e-4
+        assert sum(jitter['histogram']['counts']) == 500
+        assert len(jitter['histogram']['counts']) == len(jitter['histogram']['edges']) + 1
+    
+    def test_wall_clock_run(self):
+        """Verify the loop runs against real time and stop() ends it."""
+        def command(tick, now):
+            if tick == 4:
+                loop.stop()
+            return (0, 0, 1)
+        
+        loop = ControlLoop(self.mod, command, rate_hz=2000.0)
+        report = self.run(loop, ticks=100)
+        assert report['ticks'] == 5
+        assert report['stages']['steer']['count'] == 1
+        assert report['elapsed_s'] > 0
+
+
 class TestEnergyCalculations:
     """Test suite for energy calculations."""
     
@@ -300,10 +822,3 @@ class TestEnergyCalculations:
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
-```
-
----
-
-ONE FILE. ONE BLOCK. ✅
-
-Want FILE 10 next?
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmarks for the modulator module and example scripts.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Wall-clock budget for `import gravity_modulator`, numpy included
+IMPORT_BUDGET_S = 0.75
+
+
+def _import_in_subprocess(module: str, path: str = ROOT) -> dict:
+    """Import a module in a fresh interpreter and report time and loaded modules."""
+    code = (
+        "import json, sys, time\n"
+        f"sys.path.insert(0, {path!r})\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - t\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, cwd=ROOT)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+class TestStartup:
+    """Test suite for import-time cost."""
+
+    def test_import_within_budget(self):
+        """Verify importing the modulator stays under the startup budget."""
+        best = min(_import_in_subprocess("gravity_modulator")['elapsed'] for _ in range(3))
+        assert best < IMPORT_BUDGET_S, f"import took {best:.3f}s (budget {IMPORT_BUDGET_S}s)"
+
+    def test_no_heavy_optional_imports(self):
+        """Verify plotting, multiprocessing and asyncio are not loaded at import time."""
+        modules = _import_in_subprocess("gravity_modulator")['modules']
+
+        assert 'matplotlib' not in modules
+        assert 'asyncio' not in modules
+        assert 'concurrent.futures.process' not in modules
+        assert 'multiprocessing.shared_memory' not in modules
+
+    def test_thrust_calc_defers_tabulate(self):
+        """Verify the thrust calculator only loads tabulate for batch tables."""
+        modules = _import_in_subprocess("thrust_calc", os.path.join(ROOT, 'examples'))['modules']
+
+        assert 'tabulate' not in modules
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the thrust calculator's vectorized evaluation and sweeps.
+"""
+
+import numpy as np
+import pytest
+import sys
+import os
+
+# Add parent and examples directories to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'examples')))
+
+from thrust_calc import ThrustCalculator, SWEEP_COLUMNS
+
+
+class TestThrustSweep:
+    """Test suite for ThrustCalculator.evaluate() and sweep()."""
+
+    def setup_method(self):
+        """Initialize calculator and a small sweep grid."""
+        self.calc = ThrustCalculator()
+        self.sizes = [1.0, 10.0, 100.0]
+        self.powers = [0.05, 5.0]
+        self.directions = [(0, 0, 1), (0.6, 0, 0.8), (1, 1, 0)]
+
+    def test_evaluate_matches_calculate_thrust(self):
+        """Verify vectorized evaluation matches per-configuration results."""
+        results = self.calc.evaluate([1, 10, 100], [0.0005, 0.05, 5],
+                                     [(0, 0, 1), (0.6, 0, 0.8), (1, 1, 0)])
+        for i, (size, power, direction) in enumerate(zip([1, 10, 100], [0.0005, 0.05, 5],
+                                                         [(0, 0, 1), (0.6, 0, 0.8), (1, 1, 0)])):
+            expected = self.calc.calculate_thrust(size, power, direction)
+            assert np.isclose(results['thrust_n'][i], expected['thrust_n'], rtol=1e-12)
+            assert np.isclose(results['thrust_per_mw'][i], expected['thrust_per_mw'], rtol=1e-12)
+            assert np.isclose(results['volume_m3'][i], expected['volume_m3'])
+
+    def test_sweep_builds_no_modulator(self, monkeypatch):
+        """Verify evaluate() and nominal sweeps never construct a GravityModulator."""
+        import gravity_modulator
+
+        def fail(*args, **kwargs):
+            raise AssertionError("GravityModulator constructed during a sweep")
+
+        expected = gravity_modulator.GravityModulator().total_force()
+        monkeypatch.setattr(gravity_modulator.GravityModulator, '__init__', fail)
+        calc = ThrustCalculator()
+        summary = calc.sweep(self.sizes, self.powers, self.directions, chunk_rows=4)
+        assert np.isclose(calc.base_force, expected, rtol=1e-12)
+        assert summary['written_rows'] == 18
+
+    def test_sweep_grid_order(self):
+        """Verify the in-memory sweep covers the grid with direction fastest."""
+        summary = self.calc.sweep(self.sizes, self.powers, self.directions, chunk_rows=4)
+        columns = summary['columns']
+
+        assert summary['total_rows'] == summary['written_rows'] == 18
+        assert list(columns) == SWEEP_COLUMNS
+        assert np.array_equal(columns['size_cm'], np.repeat(self.sizes, 6))
+        assert np.array_equal(columns['dir_x'][:3], [0, 0.6, 1])
+        assert np.all(np.isnan(columns['phase_coherence']))
+
+    def test_csv_resume_after_interruption(self, tmp_path):
+        """Verify an interrupted CSV sweep resumes to the uninterrupted result."""
+        full = tmp_path / 'full.csv'
+        self.calc.sweep(self.sizes, self.powers, self.directions, output=str(full))
+
+        # Simulate a crash partway through a row write
+        partial = tmp_path / 'partial.csv'
+        data = full.read_bytes()
+        partial.write_bytes(data[:data.index(b'\n', len(data) // 2) + 25])
+
+        summary = self.calc.sweep(self.sizes, self.powers, self.directions,
+                                  output=str(partial), chunk_rows=5)
+        assert 0 < summary['skipped_rows'] < 18
+        assert summary['skipped_rows'] + summary['written_rows'] == 18
+        assert partial.read_bytes() == data
+
+        rerun = self.calc.sweep(self.sizes, self.powers, self.directions, output=str(partial))
+        assert rerun['written_rows'] == 0
+
+    def test_csv_resume_rejects_foreign_file(self, tmp_path):
+        """Verify resuming refuses files written with other columns."""
+        path = tmp_path / 'other.csv'
+        path.write_text("a,b\n1,2\n")
+        with pytest.raises(ValueError):
+            self.calc.sweep(self.sizes, self.powers, self.directions, output=str(path))
+
+        summary = self.calc.sweep(self.sizes, self.powers, self.directions,
+                                  output=str(path), resume=False)
+        assert summary['written_rows'] == 18
+
+    def test_resume_rejects_other_grid(self, tmp_path):
+        """Verify resuming refuses output written for different sizes, powers or options."""
+        path = tmp_path / 'sweep.csv'
+        self.calc.sweep(self.sizes[:1], self.powers, self.directions, output=str(path))
+        data = path.read_bytes()
+        assert data.startswith(b'# grid ')
+
+        for kwargs in ({'sizes_cm': self.sizes, 'powers_mw': self.powers},
+                       {'sizes_cm': self.sizes[:1], 'powers_mw': [0.5, 5.0]},
+                       {'sizes_cm': self.sizes[:1], 'powers_mw': self.powers, 'coherence': True}):
+            with pytest.raises(ValueError, match="different sweep grid"):
+                self.calc.sweep(directions=self.directions, output=str(path), **kwargs)
+            assert path.read_bytes() == data
+
+    def test_far_field_and_coherence_per_direction(self):
+        """Verify direction-dependent columns are computed once and broadcast."""
+        summary = self.calc.sweep([1.0, 2.0], [1.0], [(0, 0, 1), (1, 0, 0)],
+                                  far_field=True, coherence=True)
+        columns = summary['columns']
+
+        assert np.all((columns['efficiency'] > 0) & (columns['efficiency'] <= 1))
+        assert np.array_equal(columns['efficiency'][:2], columns['efficiency'][2:])
+        assert np.all(np.isfinite(columns['phase_coherence']))
+        assert np.allclose(columns['thrust_n'],
+                           columns['efficiency'] * self.calc.evaluate(1.0, 1.0, efficiency=1.0)['thrust_n'])
+
+    def test_integrated_time_to_orbit(self):
+        """Verify the integrated climb accounts for weakening gravity."""
+        self.calc.calculate_thrust(10, 0.5)
+        closed = self.calc.time_to_orbit(payload_kg=100)
+        integrated = self.calc.time_to_orbit(payload_kg=100, integrate=True)
+
+        assert integrated['time_to_orbit_s'] < closed['time_to_orbit_s']
+        assert np.isclose(integrated['energy_J'], 0.5e6 * integrated['time_to_orbit_s'])
+
+    def test_parquet_parts(self, tmp_path):
+        """Verify Parquet output resumes from its completed part files."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        out = tmp_path / 'sweep'
+
+        first = self.calc.sweep(self.sizes, self.powers, self.directions,
+                                output=str(out), chunk_rows=5)
+        assert first['written_rows'] == 18
+
+        # Simulate a run interrupted after two parts
+        for name in sorted(os.listdir(out))[2:]:
+            os.remove(out / name)
+        summary = self.calc.sweep(self.sizes, self.powers, self.directions,
+                                  output=str(out), chunk_rows=5)
+        assert summary['skipped_rows'] == 10
+        assert pq.read_table(str(out)).num_rows == 18
+
+        with pytest.raises(ValueError, match="different sweep grid"):
+            self.calc.sweep(self.sizes, [0.5], self.directions, output=str(out))